@@ -1,5 +1,4 @@
 import nltk
-from nltk.sentiment import SentimentIntensityAnalyzer
 
 from PySide6.QtGui import QImage, QPainter, QColor, QFont, Qt
 from PySide6.QtCore import QRectF
@@ -113,20 +112,24 @@ class SentimentSummaryRenderer:
         return img
 
 
-def run_sentiment_summary(sentences, width: int | None = None, height: int | None = None):
-    ensure_vader()
-    vader = SentimentIntensityAnalyzer()
-
+def count_scores(scores):
+    """
+    Count positive, neutral and negative VADER compound scores.
+    Returns a (positive, neutral, negative) tuple.
+    """
     positive = neutral = negative = 0
-    for s in sentences:
-        score = vader.polarity_scores(s)["compound"]
+    for score in scores:
         if score >= 0.05:
             positive += 1
         elif score <= -0.05:
             negative += 1
         else:
             neutral += 1
+    return positive, neutral, negative
+
 
+def render_sentiment_summary(positive: int, neutral: int, negative: int,
+                             width: int | None = None, height: int | None = None):
     if width is None:
         width = 1600
     if height is None:
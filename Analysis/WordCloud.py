@@ -1,13 +1,43 @@
 import io
+import re
+from collections import Counter, defaultdict
+from typing import Iterable
+
 from wordcloud import WordCloud, STOPWORDS
-from PySide6.QtGui import QImage
 
-from utils.Logger import logger
+
+# Tokenization used by WordCloud.process_text with its default settings
+WORD_PATTERN = re.compile(r"\w[\w']*")
+
+
+def render_wordcloud_png(frequencies: dict, width: int, height: int,
+                         background_color: str = "white", max_words: int = 200) -> bytes:
+    """
+    Lay out a word cloud from word frequencies and return it as PNG bytes.
+
+    Kept free of Qt objects so it can run in a separate process (see AnalysisWorker).
+    """
+    wordcloud = WordCloud(
+        width=width,
+        height=height,
+        background_color=background_color,
+        max_words=max_words,
+        scale=1,
+        collocations=False
+    )
+    wordcloud.generate_from_frequencies(frequencies)
+
+    img_buffer = io.BytesIO()
+    wordcloud.to_image().save(img_buffer, format="PNG")
+    return img_buffer.getvalue()
 
 
 class WordCloudAnalyzer:
     """
-    Returns QImage word cloud. Defaults chosen for high-res natural-size display.
+    Word counting for word clouds. Defaults chosen for high-res natural-size display.
+
+    Words can be counted incrementally with count_words() over batches of sentences,
+    then merged with fuse_counts() and laid out with render_wordcloud_png().
     """
 
     def __init__(self, width=2800, height=1680, background_color="white", max_words=200):
@@ -17,41 +47,46 @@ class WordCloudAnalyzer:
         self.max_words = max_words
         self.stopwords = set(STOPWORDS)
 
-    def generate_wordcloud(self, text_list: list[str], width: int | None = None, height: int | None = None) -> QImage:
-        if not isinstance(text_list, list):
-            logger.error("WordCloudAnalyzer: text_list must be a list of strings")
-            raise TypeError("Input must be a list of strings.")
-
-        if not text_list:
-            logger.error("WordCloudAnalyzer: Input text list is empty")
-            raise ValueError("Input list cannot be empty.")
-
-        use_w = int(width) if width is not None else self.width
-        use_h = int(height) if height is not None else self.height
-
-        logger.debug(f"WordCloudAnalyzer: generating wordcloud with {len(text_list)} items at {use_w}x{use_h}")
-
-        try:
-            text_corpus = " ".join(text_list)
-
-            wordcloud = WordCloud(
-                width=use_w,
-                height=use_h,
-                background_color=self.background_color,
-                max_words=self.max_words,
-                stopwords=self.stopwords,
-                scale=1,
-                collocations=False
-            )
-            wordcloud.generate(text_corpus)
-
-            pil_image = wordcloud.to_image()
-            img_buffer = io.BytesIO()
-            pil_image.save(img_buffer, format="PNG")
-            qimage = QImage()
-            qimage.loadFromData(img_buffer.getvalue())
-            return qimage
-
-        except Exception as e:
-            logger.error(f"WordCloudAnalyzer: Error generating wordcloud: {e}")
-            raise
+    def count_words(self, text_list: Iterable[str], counts: Counter | None = None) -> Counter:
+        """
+        Count the words of a batch of sentences the way WordCloud tokenizes text.
+
+        Args:
+            text_list: Sentences to count.
+            counts: Counter to add to, so batches can be counted one after another.
+
+        Returns:
+            Counter of raw (case-preserving) words, without stopwords and numbers.
+        """
+        if counts is None:
+            counts = Counter()
+        stopwords = {word.lower() for word in self.stopwords}
+        for text in text_list:
+            for word in WORD_PATTERN.findall(text):
+                if word.lower().endswith("'s"):
+                    word = word[:-2]
+                if word.isdigit() or word.lower() in stopwords:
+                    continue
+                counts[word] += 1
+        return counts
+
+    @staticmethod
+    def fuse_counts(counts: Counter) -> dict:
+        """
+        Merge case variants and simple plurals as WordCloud does (see wordcloud.tokenization.process_tokens),
+        keeping the most common case of each word.
+        """
+        cases = defaultdict(dict)
+        for word, count in counts.items():
+            cases[word.lower()][word] = count
+
+        for key in list(cases):
+            if key.endswith("s") and not key.endswith("ss") and key[:-1] in cases:
+                singular = cases[key[:-1]]
+                for word, count in cases.pop(key).items():
+                    singular[word[:-1]] = singular.get(word[:-1], 0) + count
+
+        return {
+            max(case_counts.items(), key=lambda item: item[1])[0]: sum(case_counts.values())
+            for case_counts in cases.values()
+        }
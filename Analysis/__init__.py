@@ -1,2 +0,0 @@
-import nltk
-nltk.download('vader_lexicon')
\ No newline at end of file
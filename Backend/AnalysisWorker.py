@@ -1,17 +1,47 @@
 # Backend/AnalysisWorker.py
 from PySide6.QtCore import QObject, Signal
 from PySide6.QtGui import QImage
-import time
+from typing import Deque, Iterable, Optional, Tuple
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import itertools
+import multiprocessing
+import multiprocessing.pool
+import os
+import queue
 
-from Analysis.SentimentAnalysis import run_sentiment_summary
-from Analysis.WordCloud import WordCloudAnalyzer
+from Analysis.SentimentAnalysis import count_scores, ensure_vader, render_sentiment_summary
+from Analysis.WordCloud import WordCloudAnalyzer, render_wordcloud_png
+from Backend.SentimentEngine import SentimentEngine
+from utils.AppState import app_state
 
 class AnalysisWorker(QObject):
     """
     Threaded worker to run analysis (sentiment summary + wordcloud) on a list of sentences.
     Emits progress updates for the splash and returns QImage results.
+
+    In streaming mode more sentences can be added with add_sentences() while the worker
+    runs, e.g. as scraped videos come in; sentiment is scored as they arrive and the
+    images are rendered once close_input() is called.
+
+    The sentiment summary and the word cloud are produced concurrently: sentiment is
+    scored on a separate thread backed by the sentiment engine's processes, and the
+    word cloud is laid out in its own process. Each image is emitted when it is ready.
     """
 
+    # Sentences scored between progress updates / cancel checks; large enough for the
+    # sentiment engine to shard a batch across its worker processes
+    BATCH_SIZE = 5000
+
+    # Progress reached after setup and once every sentence is scored; the sentiment
+    # summary and the word cloud each add IMAGE_PERCENT when ready
+    PREPARE_PERCENT = 2
+    SCORED_PERCENT = 70
+    IMAGE_PERCENT = 15
+
+    # Seconds between cancel checks while waiting for the sentiment and word cloud results
+    POLL_INTERVAL = 0.1
+
     progress_updated = Signal(str)
     progress_percentage = Signal(int)
     finished = Signal()
@@ -19,89 +49,183 @@ class AnalysisWorker(QObject):
     wordcloud_ready = Signal(QImage)
 
     def __init__(self, sentences: list[str], sentiment_size: tuple = (1600, 520),
-                 wordcloud_size: tuple = (2800, 1680), max_words: int = 200):
+                 wordcloud_size: tuple = (2800, 1680), max_words: int = 200, streaming: bool = False):
         super().__init__()
         self.sentences = sentences or []
         self.sent_w, self.sent_h = sentiment_size
         self.wc_w, self.wc_h = wordcloud_size
         self.max_words = max_words
+        self.streaming = streaming
+        # With a single core, overlapping the two stages only adds process start-up cost
+        self.parallel = (os.cpu_count() or 1) > 1
         self._cancelled = False
+        self._percentage = 0
+
+        # Sources of sentences still to analyze; None marks the end of input
+        self._input: queue.Queue = queue.Queue()
+        if self.sentences:
+            self._input.put(self.sentences)
+        if not streaming:
+            self._input.put(None)
+
+    def add_sentences(self, sentences: Iterable[str]) -> None:
+        """
+        Queue more sentences (streaming mode). Safe to call from any thread; iterables are
+        consumed on the worker thread, so a generator reading the database does not block the caller.
+        """
+        self._input.put(sentences)
+
+    def close_input(self) -> None:
+        """
+        Signal that no more sentences will be added; the worker then renders the results.
+        """
+        self._input.put(None)
 
     def cancel(self):
         self._cancelled = True
+        # Wake a streaming worker that is waiting for input
+        self._input.put(None)
+
+    def _cancel_and_finish(self) -> None:
+        self.progress_updated.emit("Analysis cancelled.")
+        self.finished.emit()
+
+    def _start_layout(self, frequencies: dict, background_color: str) -> Tuple[Future, multiprocessing.pool.Pool]:
+        """
+        Lay out the word cloud in a separate process so it runs alongside sentiment scoring.
+        Returns a future of the PNG bytes and the pool, which can be terminated to cancel.
+        Without a spare core the layout runs in-process and the pool is None.
+        """
+        future: Future = Future()
+        if not self.parallel:
+            try:
+                future.set_result(render_wordcloud_png(frequencies, self.wc_w, self.wc_h, background_color, self.max_words))
+            except Exception as e:
+                future.set_exception(e)
+            return future, None
+
+        # Spawn rather than fork: this process runs Qt and database threads
+        pool = multiprocessing.get_context("spawn").Pool(processes=1)
+        pool.apply_async(
+            render_wordcloud_png,
+            (frequencies, self.wc_w, self.wc_h, background_color, self.max_words),
+            callback=future.set_result,
+            error_callback=future.set_exception
+        )
+        return future, pool
+
+    def _report_progress(self, scored: int, total: int, images_ready: int) -> None:
+        if not total:
+            return
+        scoring_span = self.SCORED_PERCENT - self.PREPARE_PERCENT
+        done = self.PREPARE_PERCENT + int(scored / total * scoring_span)
+        percentage = min(done + images_ready * self.IMAGE_PERCENT, 100)
+        if percentage != self._percentage:
+            self._percentage = percentage
+            self.progress_percentage.emit(percentage)
 
     def run(self) -> None:
+        engine: Optional[SentimentEngine] = None
+        scorer: Optional[ThreadPoolExecutor] = None
+        layout_pool = None
         try:
-            total_stages = 4
-            stage = 0
-
-            # Stage 1: loading/extract count
-            stage += 1
             self.progress_updated.emit("Preparing sentences for analysis...")
-            self.progress_percentage.emit(int((stage/total_stages)*100 * 0.02))  # small percent
-
-            sentences = self.sentences
-            n = len(sentences)
+            self._percentage = self.PREPARE_PERCENT
+            self.progress_percentage.emit(self.PREPARE_PERCENT)
             if self._cancelled:
-                self.progress_updated.emit("Analysis cancelled.")
-                self.finished.emit()
+                self._cancel_and_finish()
                 return
 
-            # Stage 2: Sentiment (iterate sentences — dynamic progress)
-            stage += 1
+            # Sentiment batches are scored on their own thread (and the engine's processes)
+            # while this thread counts words, so the word cloud can be laid out as soon as
+            # the input is closed instead of after all sentiment scoring
             self.progress_updated.emit("Running sentiment analysis...")
-            # We'll update percent dynamically across this stage (weight: 45%)
-            sentiment_stage_weight = 45
-            base = int(((stage-1)/total_stages) * 100)
-            if n == 0:
-                self.progress_percentage.emit(base + 1)
-            else:
-                # process in micro-batches to allow progress updates
-                batch = max(1, n // 20)
-                processed = 0
-                # build text list chunked — run_sentiment_summary expects sentences list
-                # but it's not incremental; to show progress we compute compound in loop using VADER directly would be needed.
-                # For simplicity and to avoid importing internals, call run_sentiment_summary once but fake granular progress.
-                # Show incremental progress while computing
-                for i in range(0, n, batch):
+            ensure_vader()
+            engine = SentimentEngine(db=app_state.db)
+            scorer = ThreadPoolExecutor(max_workers=1)
+            wordcloud = WordCloudAnalyzer(max_words=self.max_words)
+            word_counts = Counter()
+            pending: Deque[Tuple[Future, int]] = deque()
+            tally = [0, 0, 0]
+            total = 0 if self.streaming else len(self.sentences)
+            analyzed = scored = 0
+
+            def collect_scores() -> int:
+                # Tally finished batches in order; returns the number of sentences scored
+                count = 0
+                while pending and pending[0][0].done():
+                    future, size = pending.popleft()
+                    for i, n in enumerate(count_scores(future.result())):
+                        tally[i] += n
+                    count += size
+                return count
+
+            while True:
+                source = self._input.get()
+                if source is None:
+                    break
+                iterator = iter(source)
+                while True:
                     if self._cancelled:
-                        self.progress_updated.emit("Analysis cancelled.")
-                        self.finished.emit()
+                        self._cancel_and_finish()
                         return
-                    # small sleep to let UI update if heavy
-                    time.sleep(0.01)
-                    processed += min(batch, n - i)
-                    frac = processed / n
-                    pct = base + int(frac * sentiment_stage_weight)
-                    self.progress_percentage.emit(min(pct, 99))
-
-                # Now compute final sentiment image
-                sentiment_img = run_sentiment_summary(sentences, width=self.sent_w, height=self.sent_h)
-                self.sentiment_ready.emit(sentiment_img)
-
-            # Stage 3: Wordcloud (weight: 45%)
-            stage += 1
-            self.progress_updated.emit("Generating word cloud...")
-            wc_base = int(((stage-1)/total_stages) * 100)
-            # Quick progress ticks while generating
-            # generate_wordcloud is blocking; show small animation ticks before/after
-            for tick in range(3):
+                    batch = list(itertools.islice(iterator, self.BATCH_SIZE))
+                    if not batch:
+                        break
+                    pending.append((scorer.submit(engine.scores, batch), len(batch)))
+                    wordcloud.count_words(batch, word_counts)
+                    analyzed += len(batch)
+                    scored += collect_scores()
+                    if self.streaming:
+                        # Total is unknown until input is closed
+                        self.progress_updated.emit(f"Analyzed {analyzed} sentences...")
+                    else:
+                        self._report_progress(scored, total, 0)
+
+            if self._cancelled:
+                self._cancel_and_finish()
+                return
+            if not analyzed:
+                self.progress_updated.emit("No sentences to analyze.")
+                self.finished.emit()
+                return
+
+            total = analyzed
+            self.progress_updated.emit(f"Generating word cloud and sentiment summary from {analyzed} sentences...")
+            frequencies = wordcloud.fuse_counts(word_counts)
+            layout: Optional[Future] = None
+            if self.parallel:
+                layout, layout_pool = self._start_layout(frequencies, wordcloud.background_color)
+
+            # Emit each result as soon as it is ready
+            sentiment_done = wordcloud_done = False
+            while not (sentiment_done and wordcloud_done):
                 if self._cancelled:
-                    self.progress_updated.emit("Analysis cancelled.")
-                    self.finished.emit()
+                    self._cancel_and_finish()
                     return
-                time.sleep(0.05)
-                self.progress_percentage.emit(wc_base + int((tick+1) * (40/3)))
-
-            wc_img = WordCloudAnalyzer(max_words=self.max_words).generate_wordcloud(sentences, width=self.wc_w, height=self.wc_h)
-            self.wordcloud_ready.emit(wc_img)
-            self.progress_percentage.emit(95)
-
-            # Stage 4: Finalizing
-            stage += 1
-            self.progress_updated.emit("Finalizing results...")
-            time.sleep(0.05)
-            self.progress_percentage.emit(100)
+                waiting = [future for future, _ in pending]
+                if layout is not None and not wordcloud_done:
+                    waiting.append(layout)
+                wait(waiting, timeout=self.POLL_INTERVAL, return_when=FIRST_COMPLETED)
+
+                scored += collect_scores()
+                if not sentiment_done and not pending:
+                    sentiment_done = True
+                    sentiment_img = render_sentiment_summary(*tally, width=self.sent_w, height=self.sent_h)
+                    self.sentiment_ready.emit(sentiment_img)
+                    if layout is None:
+                        layout, layout_pool = self._start_layout(frequencies, wordcloud.background_color)
+                if layout is not None and not wordcloud_done and layout.done():
+                    wordcloud_done = True
+                    # A failed layout is raised once the sentiment summary is out
+                    if layout.exception() is None:
+                        wc_img = QImage()
+                        wc_img.loadFromData(layout.result())
+                        self.wordcloud_ready.emit(wc_img)
+                self._report_progress(scored, total, sentiment_done + wordcloud_done)
+
+            layout.result()
+
             self.progress_updated.emit("Analysis complete.")
             self.finished.emit()
 
@@ -112,3 +236,11 @@ class AnalysisWorker(QObject):
             except Exception:
                 pass
             self.finished.emit()
+        finally:
+            if layout_pool is not None:
+                # Stops a layout still running after cancel or an error
+                layout_pool.terminate()
+            if scorer is not None:
+                scorer.shutdown(wait=True, cancel_futures=True)
+            if engine is not None:
+                engine.shutdown()
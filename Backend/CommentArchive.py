@@ -0,0 +1,197 @@
+# comment_archive.py
+import gzip
+import json
+import os
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Tuple
+
+from utils.Logger import logger
+
+
+# Newest format first; ".json" is the legacy nested-thread format
+COMMENT_FILE_SUFFIXES = (".ndjson.gz", ".ndjson", ".json")
+LEGACY_SUFFIX = ".json"
+
+# gzip's default level 9 is several times slower for a few percent smaller files
+GZIP_LEVEL = 6
+
+def comment_file_path(comment_dir: str, channel_id: str, video_id: str, compress: bool = True) -> str:
+    """
+    Path of a video's comment archive in the NDJSON format.
+    """
+    suffix = ".ndjson.gz" if compress else ".ndjson"
+    return os.path.join(str(comment_dir), str(channel_id), f"{video_id}{suffix}")
+
+
+def find_comment_file(comment_dir: str, channel_id: str, video_id: str) -> Optional[str]:
+    """
+    Path of the existing comment file for a video in any supported format, or None.
+    """
+    base = os.path.join(str(comment_dir), str(channel_id), str(video_id))
+    for suffix in COMMENT_FILE_SUFFIXES:
+        if os.path.exists(base + suffix):
+            return base + suffix
+    return None
+
+
+def _open_text(filepath: str, mode: str, compressed: Optional[bool] = None) -> IO[str]:
+    if compressed is None:
+        compressed = filepath.endswith(".gz")
+    if compressed:
+        if "w" in mode:
+            return gzip.open(filepath, mode + "t", encoding="utf-8", compresslevel=GZIP_LEVEL)
+        return gzip.open(filepath, mode + "t", encoding="utf-8")
+    return open(filepath, mode, encoding="utf-8")
+
+
+def to_record(comment: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce a yt-dlp comment or a stored comment to an archive record.
+
+    Replies carry their parent's comment_id in parent_id; top-level comments have None.
+    """
+    parent = comment.get("parent_id") or comment.get("parent")
+    return {
+        "comment_id": comment.get("comment_id") or comment.get("id"),
+        "parent_id": None if parent in (None, "root") else parent,
+        "author": comment.get("author"),
+        "author_id": comment.get("author_id"),
+        "text": comment.get("text"),
+        "like_count": int(comment.get("like_count") or 0),
+        "is_favorited": bool(comment.get("is_favorited", False)),
+        "timestamp": comment.get("timestamp"),
+    }
+
+
+def write_comments(filepath: str, comments: Iterable[Dict[str, Any]],
+                   allow_empty: bool = True) -> Tuple[int, int]:
+    """
+    Stream comments to an NDJSON file, one compact JSON object per line.
+
+    Comments should arrive thread by thread (each top-level comment followed by its
+    replies), which is the order yt-dlp produces; iter_comment_threads relies on it
+    to rebuild threads without loading the whole file. The file is written to a
+    temporary path and moved into place, so readers never see a partial archive.
+
+    Args:
+        filepath: Target path; a ".gz" suffix enables gzip compression.
+        comments: yt-dlp or stored comment dictionaries.
+        allow_empty: If False and no comment was written, the target is left untouched.
+
+    Returns:
+        (number of comments written, number of top-level comments)
+    """
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    part_path = filepath + ".part"
+    written = threads = 0
+    try:
+        with _open_text(part_path, "w", compressed=filepath.endswith(".gz")) as f:
+            for comment in comments:
+                record = to_record(comment)
+                if not record["comment_id"]:
+                    continue
+                f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+                f.write("\n")
+                written += 1
+                if record["parent_id"] is None:
+                    threads += 1
+        if written or allow_empty:
+            os.replace(part_path, filepath)
+        else:
+            os.remove(part_path)
+    except BaseException:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        raise
+    return written, threads
+
+
+def _iter_legacy_records(filepath: str) -> Iterator[Dict[str, Any]]:
+    with open(filepath, "r", encoding="utf-8") as f:
+        threads = json.load(f)
+    if not isinstance(threads, list):
+        return
+
+    # Depth-first keeps every reply right after its thread
+    stack = list(reversed(threads))
+    while stack:
+        comment = stack.pop()
+        if not isinstance(comment, dict):
+            continue
+        record = to_record(comment)
+        if record["comment_id"]:
+            yield record
+        stack.extend(reversed(comment.get("replies") or []))
+
+
+def iter_comment_records(filepath: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream flat comment records from a comment file in any supported format.
+
+    Legacy nested JSON files have to be parsed whole; NDJSON files are read line by line.
+    """
+    if filepath.endswith(LEGACY_SUFFIX):
+        yield from _iter_legacy_records(filepath)
+        return
+
+    with _open_text(filepath, "r") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping malformed line {line_no} in {filepath}")
+
+
+def iter_comment_threads(filepath: str) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily rebuild comment threads from a comment file.
+
+    Each top-level record is yielded with its replies in 'replies' as soon as the next
+    thread starts, so only one thread is held in memory at a time. Replies that appear
+    before their parent are kept aside until it shows up; replies whose parent is not in
+    the file are dropped.
+    """
+    current: Optional[Dict[str, Any]] = None
+    current_ids = set()
+    pending: Dict[str, List[Dict[str, Any]]] = {}
+
+    for record in iter_comment_records(filepath):
+        parent_id = record.get("parent_id")
+        if parent_id is None:
+            if current is not None:
+                yield current
+            current = dict(record, replies=pending.pop(record["comment_id"], []))
+            current_ids = {record["comment_id"]}
+            current_ids.update(reply["comment_id"] for reply in current["replies"])
+        elif current is not None and parent_id in current_ids:
+            current["replies"].append(record)
+            current_ids.add(record["comment_id"])
+        else:
+            pending.setdefault(parent_id, []).append(record)
+
+    if current is not None:
+        yield current
+    if pending:
+        logger.debug(f"Dropped {sum(len(v) for v in pending.values())} orphan replies in {filepath}")
+
+
+def migrate_comment_file(filepath: str, compress: bool = True) -> Optional[str]:
+    """
+    Convert a legacy nested JSON comment file to NDJSON and remove the original.
+
+    Returns:
+        The new file path, or None if the file could not be converted.
+    """
+    if not filepath.endswith(LEGACY_SUFFIX):
+        return filepath
+
+    target = filepath[:-len(LEGACY_SUFFIX)] + (".ndjson.gz" if compress else ".ndjson")
+    try:
+        write_comments(target, _iter_legacy_records(filepath))
+    except Exception:
+        logger.exception(f"Error migrating comment file {filepath}")
+        return None
+    os.remove(filepath)
+    return target
@@ -85,23 +85,20 @@ class Search:
             with self.download_lock:
                 self.channels[channel_id] = {"title": title, "url": url, "sub_count": sub_count}
 
-            # Check if channel already exists
-            existing_channels = self.db.fetch(table="CHANNEL", where="channel_id = ?", params=(channel_id,))
-            
-            if not existing_channels:
-                # Channel doesn't exist, insert new one
-                self.db.insert(
-                    "CHANNEL",
-                    {
-                        "channel_id": channel_id,
-                        "name": title,
-                        "url": url,
-                        "sub_count": str(sub_count),
-                        "desc": desc,
-                        "profile_pic": profile_save_path,
-                    },
-                )
-                logger.info(f"Added new channel: {title}")
+            # Insert new channel or refresh the existing row in one statement
+            self.db.upsert_many(
+                "CHANNEL",
+                [{
+                    "channel_id": channel_id,
+                    "name": title,
+                    "url": url,
+                    "sub_count": str(sub_count),
+                    "desc": desc,
+                    "profile_pic": profile_save_path,
+                }],
+                "channel_id",
+            )
+            logger.info(f"Saved channel: {title}")
 
         # Update completion counter
         with self.download_lock:
@@ -1,85 +1,181 @@
 import yt_dlp
-import json
 import os
-from typing import Dict, List
-from PySide6.QtCore import QObject, Signal
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from PySide6.QtCore import QObject, QThread, Signal
+from yt_dlp.extractor.youtube import YoutubeIE
 
+from Backend.CommentArchive import (COMMENT_FILE_SUFFIXES, LEGACY_SUFFIX, comment_file_path, find_comment_file,
+                                    iter_comment_records, iter_comment_threads, migrate_comment_file,
+                                    write_comments)
 from Data.DatabaseManager import DatabaseManager
 from utils.AppState import app_state
 from utils.Logger import logger
 
 
+class CommentTimeBudget:
+    """
+    yt-dlp logger that enforces a time budget on comment extraction.
+
+    yt-dlp reports every comment page it downloads through its logger. Once the budget
+    is spent, the next page report raises KeyboardInterrupt, which yt-dlp's comment
+    extractor handles like a user interrupt: it stops paging and returns the comments
+    collected so far.
+    """
+
+    def __init__(self, seconds: Optional[float]) -> None:
+        self.deadline = time.monotonic() + seconds if seconds else None
+        self.expired = False
+
+    def debug(self, msg: str) -> None:
+        if self.deadline is None or self.expired:
+            return
+        if "comment" in msg.lower() and time.monotonic() >= self.deadline:
+            self.expired = True
+            raise KeyboardInterrupt("Comment time budget exhausted")
+
+    def info(self, msg: str) -> None:
+        pass
+
+    def warning(self, msg: str) -> None:
+        pass
+
+    def error(self, msg: str) -> None:
+        logger.debug(f"yt-dlp: {msg}")
+
+
+class NewCommentsYoutubeIE(YoutubeIE):
+    """
+    YouTube extractor that stops paging comments at the first one already stored.
+
+    With the "new" sort, top-level comments arrive newest first, so every page after the
+    first stored one (the pinned comment, which comes first regardless of age, does not
+    count) only holds comments that are stored already. Select it with
+    ydl.extract_info(..., ie_key=NewCommentsYoutubeIE.ie_key()).
+    """
+
+    def __init__(self, known_ids: Set[str], *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.known_ids = known_ids
+
+    def _get_comments(self, *args, **kwargs):
+        for comment in super()._get_comments(*args, **kwargs):
+            yield comment
+            if (comment.get('parent', 'root') == 'root' and not comment.get('is_pinned')
+                    and comment.get('id') in self.known_ids):
+                return
+
+
 class CommentWorker(QObject):
     """
     Worker thread for fetching comments to keep UI responsive.
     """
     progress_updated = Signal(str)
     progress_percentage = Signal(int)
+    # (channel_id, video_id, result) emitted as soon as each video is done
+    comments_fetched = Signal(str, str, dict)
     finished = Signal()
 
-    def __init__(self, video_details: Dict[str, List[str]]) -> None:
+    def __init__(self, video_details: Dict[str, List[str]], max_workers: Optional[int] = None,
+                 incremental: bool = False, max_comments: Optional[int] = None,
+                 max_replies: Optional[int] = None, time_budget: Optional[float] = None) -> None:
         """
         Initializes the CommentWorker.
 
         Args:
             video_details (Dict[str, List[str]]): Dictionary of channel IDs and video ID lists.
+            max_workers (Optional[int]): Number of videos fetched concurrently.
+                Defaults to CommentFetcher.DEFAULT_WORKERS; 1 fetches one video at a time.
+            incremental (bool): Only fetch comments posted since the last run.
+            max_comments (Optional[int]): Max top-level comments per video (None = all).
+            max_replies (Optional[int]): Max replies per comment thread (None = all).
+            time_budget (Optional[float]): Seconds to spend per video before stopping (None = no limit).
         """
         super().__init__()
         self.video_details = video_details
-        self.fetcher = CommentFetcher()
+        self.max_workers = max_workers
+        self.incremental = incremental
+        self.fetcher = CommentFetcher(max_comments=max_comments, max_replies=max_replies, time_budget=time_budget)
+        self._thread: Optional[QThread] = None
+
+    def _should_stop(self) -> bool:
+        # This uses QThread interruption mechanism to check for cancellation.
+        try:
+            thread = self._thread or QThread.currentThread()
+            return thread.isInterruptionRequested()
+        except Exception:
+            return False
 
     def run(self) -> None:
         """
         Executes the comment fetching process.
+        Videos are fetched concurrently and reported in the order they complete.
         Shows video title / channel name instead of raw IDs when available.
         """
+        self._thread = QThread.currentThread()
         try:
+            self.fetcher.migrate_comment_files(
+                lambda done, total: self.progress_updated.emit(f"Converting comment archive ({done}/{total})...")
+            )
+            if self.incremental:
+                # Comments only present in older per-video files count as already stored
+                self.fetcher.ensure_comments_stored(self.video_details)
+
             total_videos = sum(len(v_list) for v_list in self.video_details.values())
             processed_count = 0
+            workers = self.max_workers or self.fetcher.DEFAULT_WORKERS
 
-            self.progress_updated.emit("Starting comment scrape...")
+            self.progress_updated.emit(
+                f"Starting comment scrape for {total_videos} videos ({min(workers, total_videos)} at a time)..."
+            )
             self.progress_percentage.emit(0)
 
-            # helper to get title from DB
-            def _get_title(vid, ch):
-                try:
-                    rows = self.fetcher.db.fetch("VIDEO", where="video_id=?", params=(vid,))
-                    if rows:
-                        return rows[0].get("title") or vid
-                except Exception:
-                    pass
-                return vid
-
-            def _get_channel_name(ch):
-                try:
-                    rows = self.fetcher.db.fetch("CHANNEL", where="channel_id=?", params=(ch,))
-                    if rows:
-                        return rows[0].get("channel_name") or str(ch)
-                except Exception:
-                    pass
-                return str(ch)
-
-            for channel_id, video_id_list in self.video_details.items():
-                channel_name = _get_channel_name(channel_id)
-                for video_id in video_id_list:
-                    video_title = _get_title(video_id, channel_id)
-                    self.progress_updated.emit(f"Fetching comments for: \"{video_title}\" (channel: {channel_name})")
-
-                    # Perform fetch
-                    result = self.fetcher._fetch(video_id, channel_id)
-
-                    processed_count += 1
-                    percentage = int((processed_count / total_videos) * 100)
-                    self.progress_percentage.emit(percentage)
-
-                    if result.get("filepath"):
-                        count = result.get("comment_count", 0)
-                        self.progress_updated.emit(f"Saved {count} comments for \"{video_title}\"")
-                    else:
-                        self.progress_updated.emit(f"Skipped: \"{video_title}\" ({result.get('remarks')})")
-
-            self.progress_updated.emit("Comment scraping completed!")
-            self.progress_percentage.emit(100)
+            # Titles and channel names for the progress messages, looked up in bulk up front
+            video_ids = [vid for v_list in self.video_details.values() for vid in v_list]
+            try:
+                videos = self.fetcher.db.fetch_many_by_keys("VIDEO", "video_id", video_ids, columns=["title"])
+                channels = self.fetcher.db.fetch_many_by_keys("CHANNEL", "channel_id", list(self.video_details),
+                                                              columns=["name"])
+            except Exception:
+                logger.exception("Error looking up video titles and channel names:")
+                videos, channels = {}, {}
+            titles: Dict[str, str] = {vid: row.get("title") or vid for vid, row in videos.items()}
+            channel_names: Dict[str, str] = {
+                ch: (channels.get(ch) or {}).get("name") or str(ch) for ch in self.video_details
+            }
+
+            for channel_id, video_id, result in self.fetcher.iter_fetch(
+                self.video_details, self.max_workers, should_stop=self._should_stop, incremental=self.incremental
+            ):
+                video_title = titles.get(video_id, video_id)
+
+                processed_count += 1
+                percentage = int((processed_count / total_videos) * 100)
+                self.progress_percentage.emit(percentage)
+
+                prefix = f"[{processed_count}/{total_videos}]"
+                if result.get("truncated"):
+                    video_title = f"{video_title} (sampled)"
+                if result.get("remarks"):
+                    self.progress_updated.emit(f"{prefix} Skipped: \"{video_title}\" ({result.get('remarks')})")
+                elif self.incremental:
+                    count = result.get("new_comment_count", 0)
+                    self.progress_updated.emit(
+                        f"{prefix} {count} new comments for \"{video_title}\" (channel: {channel_names[channel_id]})"
+                    )
+                else:
+                    count = result.get("comment_count", 0)
+                    self.progress_updated.emit(
+                        f"{prefix} Saved {count} comments for \"{video_title}\" (channel: {channel_names[channel_id]})"
+                    )
+                self.comments_fetched.emit(str(channel_id), str(video_id), result)
+
+            if self._should_stop():
+                self.progress_updated.emit("Comment scraping cancelled by user")
+            else:
+                self.progress_updated.emit("Comment scraping completed!")
+                self.progress_percentage.emit(100)
             self.finished.emit()
 
         except Exception as e:
@@ -95,89 +191,248 @@ class CommentFetcher:
     
     Attributes:
         db (DatabaseManager): The database manager instance.
-        video_comments (dict): A dictionary storing the fetched comments.
     """
-    def __init__(self) -> None:
+    # Videos fetched at the same time by iter_fetch
+    DEFAULT_WORKERS = 4
+
+    # Write comment files as gzip-compressed NDJSON (<video_id>.ndjson.gz) instead of plain .ndjson
+    COMPRESS_FILES = True
+
+    def __init__(self, max_comments: Optional[int] = None, max_replies: Optional[int] = None,
+                 time_budget: Optional[float] = None) -> None:
         """
         Initializes the CommentFetcher instance.
+
+        The limits allow fast, sampled scrapes of very large videos; a result that hit
+        any of them is marked with 'truncated'.
+
+        Args:
+            max_comments (Optional[int]): Max top-level comments per video (None = all)
+            max_replies (Optional[int]): Max replies per comment thread (None = all)
+            time_budget (Optional[float]): Seconds to spend per video before stopping (None = no limit)
         """
         self.db: DatabaseManager = app_state.db
-        self.video_comments: Dict[str, List[Dict[str, str]]] = {}
+        self.max_comments = max_comments or None
+        self.max_replies = max_replies or None
+        self.time_budget = time_budget or None
+
+    def _extract_comments(self, video_id: str, sort: str = "top", max_parents: Optional[int] = None,
+                          budget: Optional[CommentTimeBudget] = None,
+                          known_ids: Optional[Set[str]] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Runs yt-dlp comment extraction for a single video, applying the reply cap.
+
+        Args:
+            video_id (str): YouTube video ID
+            sort (str): "top" or "new"
+            max_parents (Optional[int]): Only fetch this many top-level comments (with their replies)
+            budget (Optional[CommentTimeBudget]): Stops paging once the time budget is spent
+            known_ids (Optional[Set[str]]): Stop paging at the first of these top-level comments
+
+        Returns:
+            Flat list of yt-dlp comment dictionaries, or None if comments are unavailable
+        """
+        youtube_args = {'comment_sort': [sort]}
+        if max_parents is not None or self.max_replies is not None:
+            # max_comments is "max-comments,max-parents,max-replies,max-replies-per-thread"
+            youtube_args['max_comments'] = [
+                'all',
+                str(max_parents) if max_parents is not None else 'all',
+                'all',
+                str(self.max_replies) if self.max_replies is not None else 'all',
+            ]
+
+        ydl_opts = {
+            'skip_download': True,
+            'getcomments': True,
+            'extractor_args': {'youtube': youtube_args},
+            'quiet': True,
+            'no_warnings': True,
+        }
+        if budget is not None and budget.deadline is not None:
+            ydl_opts['logger'] = budget
+
+        video_url = f"https://www.youtube.com/watch?v={video_id}"
+        try:
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                ie_key = None
+                if known_ids:
+                    extractor = NewCommentsYoutubeIE(known_ids)
+                    ydl.add_info_extractor(extractor)
+                    ie_key = extractor.ie_key()
+                info = ydl.extract_info(video_url, download=False, ie_key=ie_key)
+        except KeyboardInterrupt:
+            # Only reached if yt-dlp let the budget interrupt escape instead of returning partial comments
+            if budget is None or not budget.expired:
+                raise
+            logger.warning(f"Comment time budget ran out for {video_id} before any comments were returned")
+            return []
+        return info.get('comments')
 
-    def _fetch(self, video_id: str, channel_id: str) -> Dict[str, str]:
+    def _is_truncated(self, comments: List[Dict[str, Any]], max_parents: Optional[int],
+                      budget: Optional[CommentTimeBudget]) -> bool:
+        """
+        Tells whether a fetched comment set was cut short by one of the limits.
+        """
+        if budget is not None and budget.expired:
+            return True
+        top_level = sum(1 for c in comments if c.get('parent', 'root') == 'root')
+        if max_parents is not None and top_level >= max_parents:
+            return True
+        if self.max_replies is not None:
+            replies: Dict[str, int] = {}
+            for c in comments:
+                parent = c.get('parent', 'root')
+                if parent != 'root':
+                    replies[parent] = replies.get(parent, 0) + 1
+            return any(count >= self.max_replies for count in replies.values())
+        return False
+
+    def _extract_new_comments(self, video_id: str, known_ids: Set[str],
+                              budget: Optional[CommentTimeBudget] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetches the comments posted since the last run, newest first.
+
+        Top-level comments are paged newest first in a single extraction, which stops at
+        the first comment that is already stored, so a refresh only transfers the newest
+        pages.
+
+        Args:
+            video_id (str): YouTube video ID
+            known_ids (Set[str]): IDs of the comments already stored for the video
+            budget (Optional[CommentTimeBudget]): Stops paging once the time budget is spent
+
+        Returns:
+            Flat list of yt-dlp comment dictionaries, or None if comments are unavailable
+        """
+        return self._extract_comments(video_id, sort="new", max_parents=self.max_comments,
+                                      budget=budget, known_ids=known_ids)
+
+    def stored_comment_ids(self, video_id: str) -> Set[str]:
+        """
+        Returns the IDs of all comments and replies stored for a video.
+
+        Args:
+            video_id (str): YouTube video ID
+
+        Returns:
+            Set of comment IDs
+        """
+        return {
+            row["comment_id"]
+            for batch in self.db.iter_fetch("COMMENT_ROW", where="video_id=?", params=(video_id,),
+                                            columns=["comment_id"])
+            for row in batch
+        }
+
+    def iter_stored_comments(self, video_id: str, batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """
+        Streams a video's comments out of COMMENT_ROW thread by thread.
+        Threads are ordered by likes, each followed by its replies oldest first.
+
+        Args:
+            video_id (str): YouTube video ID
+            batch_size (int): Number of threads read at a time
+
+        Yields:
+            COMMENT_ROW dictionaries
+        """
+        for parents in self.db.iter_fetch("COMMENT_ROW", where="video_id=? AND parent_id IS NULL",
+                                          params=(video_id,), order_by="like_count DESC, timestamp DESC",
+                                          batch_size=batch_size):
+            parent_ids = [row["comment_id"] for row in parents]
+            replies: Dict[str, List[Dict[str, Any]]] = {}
+            where = f"video_id=? AND parent_id IN ({', '.join(['?'] * len(parent_ids))})"
+            for batch in self.db.iter_fetch("COMMENT_ROW", where=where, params=(video_id, *parent_ids),
+                                            order_by="timestamp"):
+                for row in batch:
+                    replies.setdefault(row["parent_id"], []).append(row)
+
+            for row in parents:
+                yield row
+                yield from replies.get(row["comment_id"], [])
+
+    def iter_threads(self, video_id: str, channel_id: str) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily reads a video's comment threads from its archive file.
+
+        Args:
+            video_id (str): YouTube video ID
+            channel_id (str): Channel ID used for the file location
+
+        Yields:
+            Top-level comments, each with its replies in 'replies'
+        """
+        filepath = find_comment_file(self.db.comment_dir, channel_id, video_id)
+        if filepath:
+            yield from iter_comment_threads(filepath)
+
+    def _fetch(self, video_id: str, channel_id: str, incremental: bool = False) -> Dict[str, str]:
         """
         Fetch comments for a single video including replies (threads).
+
+        In incremental mode, a video that already has stored comments is only checked for
+        comments newer than the stored ones; they are merged into COMMENT_ROW and the comment
+        file is rewritten from the merged store. Replies added later to older threads are
+        picked up by the next full refresh.
         
         Args:
             video_id (str): YouTube video ID
             channel_id (str): Channel ID for organizing storage
+            incremental (bool): Only fetch comments posted since the last run
             
         Returns:
-            Dictionary with video_id, filepath, comment_count, and remarks
+            Dictionary with video_id, filepath, comment_count, new_comment_count, truncated, and remarks
         """
         try:
-            ydl_opts = {
-                'skip_download': True,
-                'getcomments': True,
-                'extractor_args': {'youtube': {'comment_sort': ['top']}},
-                'quiet': True,
-                'no_warnings': True,
-            }
-            
-            video_url = f"https://www.youtube.com/watch?v={video_id}"
-            
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(video_url, download=False)
-                
-                # Check if comments are available
-                if 'comments' not in info or info['comments'] is None:
-                    logger.warning(f"Comments disabled or unavailable for {video_id}")
-                    return {
-                        'video_id': video_id,
-                        'filepath': None,
-                        'comment_count': 0,
-                        'remarks': "Comments disabled"
-                    }
-                
-                # Process comments with thread structure
-                all_comments = []
-                comments_dict = {}  # To track parent comments
-                
-                # First pass: comments by ID
-                for comment in info['comments']:
-                    comment_data = {
-                        'comment_id': comment.get('id'),
-                        'author': comment.get('author'),
-                        'author_id': comment.get('author_id'),
-                        'text': comment.get('text'),
-                        'like_count': comment.get('like_count', 0),
-                        'is_favorited': comment.get('is_favorited', False),
-                        'timestamp': comment.get('timestamp'),
-                        'parent': comment.get('parent', 'root'),
-                        'replies': []
-                    }
-                    comments_dict[comment_data['comment_id']] = comment_data
-                
-                # Second pass: build thread structure
-                for comment_id, comment_data in comments_dict.items():
-                    parent = comment_data['parent']
-                    if parent == 'root':
-                        # Top-level comment
-                        all_comments.append(comment_data)
-                    else:
-                        # Reply to another comment
-                        if parent in comments_dict:
-                            comments_dict[parent]['replies'].append(comment_data)
-                
-                # Save comments to file
-                filename = f"{video_id}.json"
-                filepath = self.save_comments(all_comments, channel_id, filename)
-                
+            budget = CommentTimeBudget(self.time_budget)
+            known_ids = self.stored_comment_ids(video_id) if incremental else set()
+            if known_ids:
+                comments = self._extract_new_comments(video_id, known_ids, budget)
+                # Hitting a limit only loses comments if the known ones were not reached yet
+                truncated = bool(comments) and not any(
+                    c.get('id') in known_ids for c in comments
+                    if c.get('parent', 'root') == 'root' and not c.get('is_pinned')
+                ) and self._is_truncated(comments, self.max_comments, budget)
+            else:
+                comments = self._extract_comments(video_id, sort="top", max_parents=self.max_comments, budget=budget)
+                truncated = bool(comments) and self._is_truncated(comments, self.max_comments, budget)
+
+            # Check if comments are available
+            if comments is None:
+                logger.warning(f"Comments disabled or unavailable for {video_id}")
+                result = {
+                    'video_id': video_id,
+                    'filepath': None,
+                    'comment_count': 0,
+                    'remarks': "Comments disabled"
+                }
+            else:
+                # Store every comment and reply as a row in COMMENT_ROW
+                comment_rows = self.to_comment_rows(comments, video_id, channel_id)
+                self.save_comment_rows(comment_rows)
+                new_count = sum(1 for row in comment_rows if row['comment_id'] not in known_ids)
+
+                # yt-dlp already yields each thread followed by its replies, so fresh
+                # results stream straight to the file; merged results come from the store
+                filepath, thread_count = self.save_comments(
+                    self.iter_stored_comments(video_id) if known_ids else comments, channel_id, video_id
+                )
+                remarks = None
+                if filepath:
+                    self.db.upsert_many("COMMENT", [{"video_id": video_id, "file_path": filepath}], "video_id")
+                else:
+                    # An existing archive is kept when nothing new was written
+                    filepath = find_comment_file(self.db.comment_dir, channel_id, video_id)
+                    remarks = "Error saving comments" if comment_rows else "No comments fetched"
+
                 result = {
                     'video_id': video_id,
                     'filepath': filepath,
-                    'comment_count': len(all_comments),
-                    'remarks': None
+                    'comment_count': thread_count,
+                    'new_comment_count': new_count,
+                    'truncated': truncated,
+                    'remarks': remarks
                 }
                 
         except yt_dlp.utils.DownloadError as e:
@@ -221,56 +476,241 @@ class CommentFetcher:
         finally:
             return result
 
-    def fetch_comments(self, video_details: Dict[str, List[str]]) -> Dict[str, List[Dict[str, str]]]:
+    def iter_fetch(self, video_details: Dict[str, List[str]], max_workers: Optional[int] = None,
+                   should_stop: Optional[Callable[[], bool]] = None,
+                   incremental: bool = False) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
         """
-        Fetch comments for multiple videos organized by channel.
-        
+        Fetch comments for multiple videos with a pool of worker threads.
+
+        Results are yielded as each video completes, not in input order. Only a couple of
+        videos per worker are queued at a time, so cancelling drops the remaining videos
+        immediately; extractions already running finish in the background.
+
         Args:
             video_details (Dict[str, List[str]]): Dictionary with channel_id as key and list of video_ids as value
-            
+            max_workers (Optional[int]): Number of videos fetched concurrently (default DEFAULT_WORKERS)
+            should_stop (Optional[Callable[[], bool]]): Polled while waiting; return True to cancel
+            incremental (bool): Only fetch comments posted since the last run
+
+        Yields:
+            (channel_id, video_id, result) tuples, result as returned by _fetch
+        """
+        jobs = iter([(channel_id, video_id)
+                     for channel_id, video_id_list in video_details.items()
+                     for video_id in video_id_list])
+        workers = max(1, max_workers or self.DEFAULT_WORKERS)
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="comments")
+        pending = {}
+        completed = False
+
+        def submit_next() -> None:
+            job = next(jobs, None)
+            if job is not None:
+                pending[pool.submit(self._fetch, job[1], job[0], incremental)] = job
+
+        try:
+            for _ in range(workers * 2):
+                submit_next()
+
+            while pending:
+                done, _ = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                if should_stop and should_stop():
+                    return
+                for future in done:
+                    channel_id, video_id = pending.pop(future)
+                    submit_next()
+                    yield channel_id, video_id, future.result()
+            completed = True
+        finally:
+            pool.shutdown(wait=completed, cancel_futures=True)
+
+    @staticmethod
+    def to_comment_rows(comments: List[Dict[str, Any]], video_id: str, channel_id: str) -> List[Dict[str, Any]]:
+        """
+        Converts yt-dlp comment dictionaries into COMMENT_ROW records.
+
+        Args:
+            comments (List[Dict[str, Any]]): Flat list of comments as returned by yt-dlp
+            video_id (str): YouTube video ID
+            channel_id (str): Channel ID the video belongs to
+
+        Returns:
+            List of dictionaries matching the COMMENT_ROW columns
+        """
+        rows = []
+        for comment in comments:
+            comment_id = comment.get('id') or comment.get('comment_id')
+            if not comment_id:
+                continue
+            parent = comment.get('parent_id') or comment.get('parent', 'root')
+            rows.append({
+                'comment_id': comment_id,
+                'video_id': video_id,
+                'channel_id': channel_id,
+                'parent_id': None if parent in (None, 'root') else parent,
+                'author': comment.get('author'),
+                'author_id': comment.get('author_id'),
+                'text': comment.get('text'),
+                'like_count': int(comment.get('like_count') or 0),
+                'is_favorited': int(bool(comment.get('is_favorited', False))),
+                'timestamp': comment.get('timestamp'),
+            })
+        return rows
+
+    def save_comment_rows(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Bulk upserts comment rows into the COMMENT_ROW table.
+
+        Args:
+            rows (List[Dict[str, Any]]): Rows built by to_comment_rows
+
         Returns:
-            Dictionary with channel_id as key and video comments as value
+            Number of rows written
         """
+        if not rows:
+            return 0
+        return self.db.upsert_many("COMMENT_ROW", rows, "comment_id")
+
+    def import_comment_file(self, video_id: str, channel_id: str, batch_size: int = 1000) -> int:
+        """
+        Imports a per-video comment file (NDJSON or legacy JSON) into COMMENT_ROW.
+
+        Args:
+            video_id (str): YouTube video ID
+            channel_id (str): Channel ID used for the file location
+            batch_size (int): Number of rows written at a time
+
+        Returns:
+            Number of rows imported
+        """
+        filepath = find_comment_file(self.db.comment_dir, channel_id, video_id)
+        if not filepath:
+            return 0
+
+        imported = 0
+        batch = []
         try:
-            for channel_id, video_id_list in video_details.items():
-                comments = {}
-                for video_id in video_id_list:
-                    result = self._fetch(video_id, channel_id)
-                    comments[video_id] = result
-                
-                self.video_comments[channel_id] = comments
-            
-            return self.video_comments
-            
-        except Exception as e:
-            logger.error("Error fetching comments for multiple videos")
-            logger.exception("Comment fetch general error:")
-            return None
+            for record in iter_comment_records(filepath):
+                batch.append(record)
+                if len(batch) >= batch_size:
+                    imported += self.save_comment_rows(self.to_comment_rows(batch, video_id, channel_id))
+                    batch = []
+            imported += self.save_comment_rows(self.to_comment_rows(batch, video_id, channel_id))
+        except Exception:
+            logger.exception(f"Error reading comment file {filepath}")
+        return imported
 
-    def save_comments(self, comments_data: List[Dict[str, str]], channel_id: str, filename: str) -> str:
+    def migrate_comment_files(self, progress_callback: Optional[Callable[[int, int], None]] = None) -> int:
         """
-        Saves comment data to a JSON file.
-        
+        Converts legacy nested JSON comment files to the NDJSON format.
+
         Args:
-            comments_data (List[Dict[str, str]]): List of comment dictionaries
+            progress_callback (Optional[Callable[[int, int], None]]): Called with (done, total) per file
+
+        Returns:
+            Number of files migrated
+        """
+        comment_dir = str(self.db.comment_dir)
+        legacy_files = []
+        for channel_id in os.listdir(comment_dir) if os.path.isdir(comment_dir) else []:
+            channel_dir = os.path.join(comment_dir, channel_id)
+            if not os.path.isdir(channel_dir):
+                continue
+            for name in os.listdir(channel_dir):
+                if name.endswith(LEGACY_SUFFIX):
+                    legacy_files.append((channel_id, name[:-len(LEGACY_SUFFIX)]))
+
+        migrated = 0
+        for done, (channel_id, video_id) in enumerate(legacy_files, 1):
+            legacy_path = os.path.join(comment_dir, channel_id, video_id + LEGACY_SUFFIX)
+            filepath = migrate_comment_file(legacy_path, compress=self.COMPRESS_FILES)
+            if filepath:
+                migrated += 1
+                self.db.upsert_many("COMMENT", [{"video_id": video_id, "file_path": filepath}], "video_id")
+            if progress_callback:
+                progress_callback(done, len(legacy_files))
+
+        if migrated:
+            logger.info(f"Migrated {migrated} legacy comment files to NDJSON")
+        return migrated
+
+    def ensure_comments_stored(self, video_details: Dict[str, List[str]]) -> None:
+        """
+        Imports legacy JSON comment files for videos that have no COMMENT_ROW entries yet.
+
+        Args:
+            video_details (Dict[str, List[str]]): Dictionary with channel_id as key and list of video_ids as value
+        """
+        for channel_id, video_id_list in video_details.items():
+            for video_id in video_id_list:
+                if self.db.fetch("COMMENT_ROW", where="video_id=?", params=(video_id,),
+                                 columns=["comment_id"], limit=1):
+                    continue
+                self.import_comment_file(video_id, channel_id)
+
+    def iter_comment_texts(self, video_ids: List[str], min_likes: Optional[int] = None,
+                           since: Optional[int] = None, batch_size: int = 1000) -> Iterator[str]:
+        """
+        Streams comment text for the given videos straight out of COMMENT_ROW.
+
+        Args:
+            video_ids (List[str]): Video IDs to read comments for
+            min_likes (Optional[int]): Only include comments with at least this many likes
+            since (Optional[int]): Only include comments posted at or after this Unix timestamp
+            batch_size (int): Number of rows pulled from the cursor at a time
+
+        Yields:
+            Comment text strings
+        """
+        # Stay well below SQLite's bound-parameter limit
+        chunk_size = 500
+        for start in range(0, len(video_ids), chunk_size):
+            chunk = list(video_ids[start:start + chunk_size])
+            where = f"video_id IN ({', '.join(['?'] * len(chunk))})"
+            params = tuple(chunk)
+            if min_likes is not None:
+                where += " AND like_count >= ?"
+                params += (int(min_likes),)
+            if since is not None:
+                where += " AND timestamp >= ?"
+                params += (int(since),)
+
+            for batch in self.db.iter_fetch("COMMENT_ROW", where=where, params=params,
+                                            columns=["text"], batch_size=batch_size):
+                for row in batch:
+                    if row["text"]:
+                        yield row["text"]
+
+    def save_comments(self, comments_data: Iterable[Dict[str, Any]], channel_id: str,
+                      video_id: str) -> Tuple[Union[str, bool], int]:
+        """
+        Streams comment data to the video's NDJSON comment file. Existing files are
+        only replaced once a non-empty set of comments has been written in full.
+
+        Args:
+            comments_data (Iterable[Dict[str, Any]]): Flat comments, each thread followed by its replies
             channel_id (str): Channel ID for organizing storage
-            filename (str): Name of the file to save
-            
+            video_id (str): YouTube video ID used as the file name
+
         Returns:
-            Filepath if successful, False otherwise
+            (filepath, number of top-level comments) if successful, (False, 0) otherwise
         """
-        if not comments_data:
-            return False
-        
-        filepath = os.path.join(self.db.comment_dir, channel_id, filename)
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        
+        filepath = comment_file_path(self.db.comment_dir, channel_id, video_id, compress=self.COMPRESS_FILES)
+
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(comments_data, f, indent=2, ensure_ascii=False)
-            return filepath
-        
-        except Exception as e:
-            logger.error(f"Error saving comments for {filename}")
+            written, thread_count = write_comments(filepath, comments_data, allow_empty=False)
+        except Exception:
+            logger.error(f"Error saving comments for {video_id}")
             logger.exception("Comment save error:")
-            return False
\ No newline at end of file
+            return False, 0
+
+        # Nothing new to write: keep whatever archive the video already has
+        if not written:
+            return False, 0
+
+        # Drop files left over from other formats so readers find the new one
+        for suffix in COMMENT_FILE_SUFFIXES:
+            stale = os.path.join(self.db.comment_dir, str(channel_id), f"{video_id}{suffix}")
+            if stale != filepath and os.path.exists(stale):
+                os.remove(stale)
+        return filepath, thread_count
@@ -1,7 +1,16 @@
-from youtube_transcript_api import YouTubeTranscriptApi, NoTranscriptFound, FetchedTranscript, TranscriptsDisabled
+from youtube_transcript_api import (YouTubeTranscriptApi, NoTranscriptFound, FetchedTranscript, TranscriptsDisabled,
+                                    FailedToCreateConsentCookie, YouTubeRequestFailed)
 from youtube_transcript_api.formatters import JSONFormatter
+import json
 import os
-from PySide6.QtCore import QObject, Signal
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from PySide6.QtCore import QObject, QThread, Signal
 
 from Data.DatabaseManager import DatabaseManager
 from utils.AppState import app_state
@@ -14,26 +23,39 @@ class TranscriptWorker(QObject):
     """
     progress_updated = Signal(str)
     progress_percentage = Signal(int)
+    transcript_fetched = Signal(str, str, dict)  # channel_id, video_id, result
     finished = Signal()
 
-    def __init__(self, video_details: dict[str, list], languages: list = ["en"]) -> None:
+    def __init__(self, video_details: dict[str, list], languages: list = ["en"], force_refresh: bool = False) -> None:
         """
         Initializes the TranscriptWorker.
 
         Args:
             video_details (dict): Dictionary of channel IDs and video ID lists.
             languages (list): List of language codes.
+            force_refresh (bool): Download every transcript again instead of using cached ones.
         """
         super().__init__()
         self.video_details = video_details
         self.languages = languages
-        self.fetcher = TranscriptFetcher()
+        self.fetcher = TranscriptFetcher(force_refresh=force_refresh)
+        self._thread: Optional[QThread] = None
+
+    def _should_stop(self) -> bool:
+        # This uses QThread interruption mechanism to check for cancellation.
+        try:
+            thread = self._thread or QThread.currentThread()
+            return thread.isInterruptionRequested()
+        except Exception:
+            return False
 
     def run(self) -> None:
         """
         Executes the transcript fetching process.
+        Videos are fetched concurrently and reported in input order.
         Shows human-friendly names (video title) in progress messages when available.
         """
+        self._thread = QThread.currentThread()
         try:
             total_videos = sum(len(v_list) for v_list in self.video_details.values())
             processed_count = 0
@@ -43,38 +65,42 @@ class TranscriptWorker(QObject):
 
             language_option = ["en"]
 
-            # helper to get title from DB
-            def _get_title(vid, ch):
-                try:
-                    rows = self.fetcher.db.fetch("VIDEO", where="video_id=?", params=(vid,))
-                    if rows:
-                        return rows[0].get("title") or vid
-                except Exception:
-                    pass
-                return vid
-
-            for channel_id, video_id_list in self.video_details.items():
-                # try get channel name
-                try:
-                    ch_rows = self.fetcher.db.fetch("CHANNEL", where="channel_id=?", params=(channel_id,))
-                    channel_name = ch_rows[0].get("channel_name") if ch_rows else str(channel_id)
-                except Exception:
-                    channel_name = str(channel_id)
-
-                for video_id in video_id_list:
-                    video_title = _get_title(video_id, channel_id)
-                    self.progress_updated.emit(f"Fetching transcript for: \"{video_title}\"")
-                    # Perform fetch
-                    result = self.fetcher._fetch(video_id, channel_id, language_option)
-
-                    processed_count += 1
-                    percentage = int((processed_count / total_videos) * 100)
-                    self.progress_percentage.emit(percentage)
-
-                    if result.get("filepath"):
-                        self.progress_updated.emit(f"Saved: \"{video_title}\"")
-                    else:
-                        self.progress_updated.emit(f"Skipped: \"{video_title}\" ({result.get('remarks')})")
+            # Titles and channel names for the progress messages, looked up in bulk up front
+            video_ids = [vid for v_list in self.video_details.values() for vid in v_list]
+            try:
+                videos = self.fetcher.db.fetch_many_by_keys("VIDEO", "video_id", video_ids, columns=["title"])
+                channels = self.fetcher.db.fetch_many_by_keys("CHANNEL", "channel_id", list(self.video_details),
+                                                              columns=["name"])
+            except Exception:
+                logger.exception("Error looking up video titles and channel names:")
+                videos, channels = {}, {}
+            titles: Dict[str, str] = {vid: row.get("title") or vid for vid, row in videos.items()}
+            channel_names: Dict[str, str] = {
+                ch: (channels.get(ch) or {}).get("name") or str(ch) for ch in self.video_details
+            }
+
+            for channel_id, video_id, result in self.fetcher.iter_fetch(
+                self.video_details, language_option=language_option, should_stop=self._should_stop
+            ):
+                video_title = titles.get(video_id, video_id)
+
+                processed_count += 1
+                percentage = int((processed_count / total_videos) * 100)
+                self.progress_percentage.emit(percentage)
+
+                prefix = f"[{processed_count}/{total_videos}]"
+                if result.get("cached") and not result.get("remarks"):
+                    self.progress_updated.emit(f"{prefix} Cached: \"{video_title}\" (channel: {channel_names[channel_id]})")
+                elif result.get("filepath"):
+                    self.progress_updated.emit(f"{prefix} Saved: \"{video_title}\" (channel: {channel_names[channel_id]})")
+                else:
+                    self.progress_updated.emit(f"{prefix} Skipped: \"{video_title}\" ({result.get('remarks')})")
+                self.transcript_fetched.emit(str(channel_id), str(video_id), result)
+
+            if self._should_stop():
+                self.progress_updated.emit("Transcript scraping cancelled by user")
+                self.finished.emit()
+                return
 
             self.progress_updated.emit("Transcript scraping completed!")
             self.progress_percentage.emit(100)
@@ -86,22 +112,145 @@ class TranscriptWorker(QObject):
             self.finished.emit()
 
 
+class _TimeoutSession(requests.Session):
+    """
+    requests session that applies a default timeout; youtube-transcript-api sets none.
+    """
+
+    def __init__(self, timeout: float) -> None:
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, *args, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(*args, **kwargs)
+
+
 class TranscriptFetcher:
     """
     A class to fetch YouTube video transcripts using youtube-transcript-api.
 
+    Transcripts for many videos are fetched concurrently by iter_fetch. All requests go
+    through one pooled connection adapter, so connections to YouTube are kept alive and
+    reused across videos. youtube-transcript-api keeps consent cookies on its session and
+    is not thread-safe, so each worker thread gets its own session and API instance on
+    top of the shared pool.
+
     Attributes:
         db (DatabaseManager): The database manager instance.
-        video_transcripts (dict): A dictionary storing the fetched transcripts.
     """
-    def __init__(self) -> None:
-        """Initializes the TranscriptFetcher instance."""
+    # Videos fetched at the same time by iter_fetch
+    DEFAULT_WORKERS = 8
+
+    # Per-request timeout in seconds, and retries per video for transient failures
+    REQUEST_TIMEOUT = 15
+    MAX_RETRIES = 2
+    RETRY_BACKOFF = 1.0
+
+    # Stored transcripts are served without any network call. Manually created captions
+    # never expire; auto-generated ones (and videos found to have none) are re-checked
+    # after this many seconds, as YouTube may improve or add them.
+    GENERATED_TTL_SECONDS = 7 * 24 * 3600
+
+    def __init__(self, max_workers: Optional[int] = None, timeout: Optional[float] = None,
+                 retries: Optional[int] = None, force_refresh: bool = False,
+                 generated_ttl: Optional[int] = None) -> None:
+        """
+        Initializes the TranscriptFetcher instance.
+
+        Args:
+            max_workers (Optional[int]): Number of videos fetched concurrently (default DEFAULT_WORKERS).
+            timeout (Optional[float]): Per-request timeout in seconds (default REQUEST_TIMEOUT).
+            retries (Optional[int]): Retries per video on network errors (default MAX_RETRIES).
+            force_refresh (bool): Ignore cached transcripts and download them again.
+            generated_ttl (Optional[int]): Seconds before auto-generated transcripts are re-checked
+                (default GENERATED_TTL_SECONDS).
+        """
         self.db: DatabaseManager = app_state.db
-        self.video_transcripts: dict = {}
+        self.force_refresh = force_refresh
+        self.generated_ttl = self.GENERATED_TTL_SECONDS if generated_ttl is None else generated_ttl
+        self.max_workers = max(1, max_workers or self.DEFAULT_WORKERS)
+        self.timeout = timeout or self.REQUEST_TIMEOUT
+        self.retries = self.MAX_RETRIES if retries is None else max(0, retries)
+        self._adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_workers)
+        self._local = threading.local()
+
+    def _api(self) -> YouTubeTranscriptApi:
+        """
+        Returns this thread's YouTubeTranscriptApi, created on first use over the shared connection pool.
+        """
+        api = getattr(self._local, "api", None)
+        if api is None:
+            session = _TimeoutSession(self.timeout)
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+            api = self._local.api = YouTubeTranscriptApi(http_client=session)
+        return api
+
+    def _with_retries(self, video_id: str, func: Callable[[], Any]) -> Any:
+        """
+        Runs func, retrying with exponential backoff on timeouts, connection errors and failed requests.
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                return func()
+            except (requests.exceptions.RequestException, YouTubeRequestFailed, FailedToCreateConsentCookie) as e:
+                if attempt == self.retries:
+                    raise
+                delay = self.RETRY_BACKOFF * (2 ** attempt)
+                logger.warning(f"Transcript request for {video_id} failed ({type(e).__name__}); retrying in {delay:.0f}s")
+                time.sleep(delay)
+
+    def cached_transcript(self, video_id: str, channel_id: str, language_option: tuple = ("en",)) -> Optional[dict]:
+        """
+        Looks up a stored transcript for the video that is still fresh.
+
+        Entries are keyed by (video_id, language), so a video keeps one transcript per
+        language and its text is never analyzed twice. _fetch asks for manually created
+        captions first, so a manual transcript replaces an auto-generated one once it
+        is downloaded. Manual transcripts never expire, while auto-generated ones and
+        cached "no transcript" results expire after generated_ttl. A legacy JSON file
+        with no database entry is imported and counts as a hit.
+
+        Args:
+            video_id (str): The YouTube video ID.
+            channel_id (str): The channel ID used for the file location.
+            language_option (tuple): Language codes to accept.
+
+        Returns:
+            Optional[dict]: A result like _fetch's with 'cached': True, or None if the transcript must be downloaded.
+        """
+        languages = list(language_option)
+        where = f"video_id=? AND language IN ({', '.join(['?'] * len(languages))})"
+        columns = ["language", "is_generated", "file_path", "fetched_at", "remarks"]
+        rows = self.db.fetch("TRANSCRIPT", where=where, params=(video_id, *languages), columns=columns)
+        if not rows and self.import_transcript_file(video_id, channel_id, languages[0]):
+            rows = self.db.fetch("TRANSCRIPT", where=where, params=(video_id, *languages), columns=columns)
+        if not rows:
+            return None
+
+        # Manual first, then generated / unknown, then cached misses
+        row = min(rows, key=lambda r: (r["remarks"] is not None, r["is_generated"] != 0))
+        if row["is_generated"] != 0 or row["remarks"] is not None:
+            fetched_at = row["fetched_at"]
+            if fetched_at is None and row["file_path"] and os.path.exists(row["file_path"]):
+                fetched_at = os.path.getmtime(row["file_path"])
+            if fetched_at is None or time.time() - fetched_at > self.generated_ttl:
+                return None
+
+        return {
+            'video_id': video_id,
+            'filepath': row["file_path"],
+            'language': row["language"] if row["remarks"] is None else None,
+            'is_generated': None if row["is_generated"] is None else bool(row["is_generated"]),
+            'remarks': row["remarks"],
+            'cached': True
+        }
 
     def _fetch(self, video_id: str, channel_id: str, language_option: tuple = ("en",)) -> dict:
         """
         Fetches a YouTube video transcript using youtube-transcript-api.
+        Fresh stored transcripts are returned without a network call unless force_refresh is set.
 
         Args:
             video_id (str): The YouTube video ID.
@@ -111,23 +260,37 @@ class TranscriptFetcher:
         Returns:
             dict: A dictionary containing the fetched transcript data.
         """
+        if not self.force_refresh:
+            cached = self.cached_transcript(video_id, channel_id, language_option)
+            if cached is not None:
+                return cached
+
         # Try to get a manual transcript first, fall back to generated
         try:
-            transcript_list = YouTubeTranscriptApi().list(video_id=video_id)
+            api = self._api()
+            transcript_list = self._with_retries(video_id, lambda: api.list(video_id=video_id))
             try:
                 # First try to get manual English transcript
-                transcript = transcript_list.find_manually_created_transcript(language_codes=["en"])
+                transcript = transcript_list.find_manually_created_transcript(language_codes=list(language_option))
             except NoTranscriptFound:
                 try:
                     # Then try generated English transcript
-                    transcript = transcript_list.find_generated_transcript(language_codes=["en"])
+                    transcript = transcript_list.find_generated_transcript(language_codes=list(language_option))
                 except NoTranscriptFound:
                     # Finally, try to get English translation from any available transcript
-                    transcript = transcript_list.find_transcript(language_codes=["en"])
+                    transcript = transcript_list.find_transcript(language_codes=list(language_option))
             
-            transcript_data = transcript.fetch()
+            transcript_data = self._with_retries(video_id, transcript.fetch)
             filename = f"{video_id}.json"
             filepath = self.save_transcript(transcript_data, channel_id, filename)
+            self.save_transcript_rows(
+                video_id,
+                transcript.language_code,
+                transcript.is_generated,
+                transcript_data.to_raw_data(),
+                filepath or None,
+                channel_id=channel_id
+            )
             logger.info(f"Transcript saved for video_id={video_id}")
             
             # Structure the result
@@ -139,14 +302,16 @@ class TranscriptFetcher:
                 'remarks': None
             }
         
-        except TranscriptsDisabled:
-            logger.warning(f"Transcripts disabled for {video_id}")
+        except (TranscriptsDisabled, NoTranscriptFound) as e:
+            remarks = "Transcripts disabled" if isinstance(e, TranscriptsDisabled) else "No transcript found"
+            logger.warning(f"{remarks} for {video_id}")
+            self.save_missing_transcript(video_id, language_option[0], remarks)
             result = {
                 'video_id': video_id,
                 'filepath': None,
                 'language': None,
                 'is_generated': None,
-                'remarks': "Transcripts disabled"
+                'remarks': remarks
             }
 
         except Exception as e:
@@ -163,33 +328,207 @@ class TranscriptFetcher:
         finally:
             return result
 
-    def fetch_transcripts(self, video_details: dict[str, list]) -> dict:
+    def iter_fetch(self, video_details: dict[str, list], language_option: tuple = ("en",),
+                   max_workers: Optional[int] = None,
+                   should_stop: Optional[Callable[[], bool]] = None) -> Iterator[Tuple[str, str, dict]]:
         """
-        Fetches YouTube video transcripts for a list of videos organized by channel.
+        Fetches transcripts for multiple videos with a pool of worker threads.
+
+        Results are yielded in input order; videos that finish early wait for the ones
+        before them. Only a couple of videos per worker are queued at a time, so
+        cancelling drops the remaining videos immediately.
 
         Args:
             video_details (dict): A dictionary with channel_id as key and list of video_ids as value.
-            languages (list): A list of language codes to fetch the transcripts.
+            language_option (tuple): A tuple of language codes to fetch the transcript.
+            max_workers (Optional[int]): Number of videos fetched concurrently (default: the fetcher's setting).
+            should_stop (Optional[Callable[[], bool]]): Polled while waiting; return True to cancel.
+
+        Yields:
+            tuple: (channel_id, video_id, result) with result as returned by _fetch.
+        """
+        jobs = iter([(channel_id, video_id)
+                     for channel_id, video_id_list in video_details.items()
+                     for video_id in video_id_list])
+        workers = max(1, max_workers or self.max_workers)
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="transcripts")
+        pending = deque()
+        completed = False
+
+        def submit_next() -> None:
+            job = next(jobs, None)
+            if job is not None:
+                pending.append((job, pool.submit(self._fetch, job[1], job[0], language_option)))
+
+        try:
+            for _ in range(workers * 2):
+                submit_next()
+
+            while pending:
+                (channel_id, video_id), future = pending[0]
+                while not wait([future], timeout=0.5).done:
+                    if should_stop and should_stop():
+                        return
+                if should_stop and should_stop():
+                    return
+                pending.popleft()
+                submit_next()
+                yield channel_id, video_id, future.result()
+            completed = True
+        finally:
+            pool.shutdown(wait=completed, cancel_futures=True)
+
+    def save_transcript_rows(self, video_id: str, language: str, is_generated: Optional[bool],
+                             segments: List[Dict[str, Any]], filepath: Optional[str] = None,
+                             fetched_at: Optional[float] = None, channel_id: Optional[str] = None) -> int:
+        """
+        Stores a transcript and its timed segments in the database.
+
+        Upserts the TRANSCRIPT row for (video_id, language), replacing a transcript of
+        the other kind (manual or auto-generated) in that language, and replaces its
+        TRANSCRIPT_SEGMENT rows in a single transaction.
+
+        Args:
+            video_id (str): The YouTube video ID.
+            language (str): The transcript language code.
+            is_generated (Optional[bool]): Whether the captions are auto-generated.
+            segments (List[Dict[str, Any]]): Segments with text, start and duration keys.
+            filepath (Optional[str]): Path of the JSON export, if any.
+            fetched_at (Optional[float]): When the transcript was downloaded (default: now).
+            channel_id (Optional[str]): The channel of the video, used to scope full-text search.
 
         Returns:
-            dict: A dictionary containing the fetched transcripts organized by channel.
+            int: The number of segments stored.
         """
-        try:                
+        transcript_row = {
+            'video_id': video_id,
+            'language': language,
+            'is_generated': None if is_generated is None else int(bool(is_generated)),
+            'file_path': filepath,
+            'fetched_at': int(time.time() if fetched_at is None else fetched_at),
+            'remarks': None,
+        }
 
-            for channel_id, video_id_list in video_details.items():
-                transcripts = {}
-                for id in video_id_list:
-                    result = self._fetch(id, channel_id)
-                    transcripts[id] = result
-                
-                self.video_transcripts[channel_id] = transcripts
+        def save(conn) -> int:
+            self.db.upsert_many("TRANSCRIPT", [transcript_row], ("video_id", "language"))
+            transcript_id = conn.execute(
+                "SELECT transcript_id FROM TRANSCRIPT WHERE video_id=? AND language=?", (video_id, language)
+            ).fetchone()[0]
+            segment_rows = [
+                {
+                    'transcript_id': transcript_id,
+                    'video_id': video_id,
+                    'channel_id': channel_id,
+                    'seq': seq,
+                    'start': seg.get('start'),
+                    'duration': seg.get('duration'),
+                    'text': seg.get('text'),
+                }
+                for seq, seg in enumerate(segments)
+            ]
+            return self.db.replace_many("TRANSCRIPT_SEGMENT", segment_rows, "transcript_id=?", (transcript_id,))
 
-            return self.video_transcripts     
-            
-        except Exception as e:
-            logger.error(f"Error fetching transcript for {id if id else channel_id}: {e}")
-            logger.exception("Transcript save error:")
-            return None
+        return self.db.transaction(save)
+
+    def save_missing_transcript(self, video_id: str, language: str, remarks: str) -> None:
+        """
+        Caches that a video has no transcript in the language, so it is not re-checked before the TTL.
+        A transcript stored earlier for the language is kept and served until the TTL runs out again.
+
+        Args:
+            video_id (str): The YouTube video ID.
+            language (str): The requested language code.
+            remarks (str): Why no transcript is available.
+        """
+        rows = self.db.fetch("TRANSCRIPT", where="video_id=? AND language=?", params=(video_id, language),
+                             columns=["transcript_id"], limit=1)
+        if rows and self.db.fetch("TRANSCRIPT_SEGMENT", where="transcript_id=?",
+                                  params=(rows[0]["transcript_id"],), columns=["seq"], limit=1):
+            self.db.update("TRANSCRIPT", {'fetched_at': int(time.time())}, "transcript_id=?",
+                           (rows[0]["transcript_id"],))
+            return
+        self.db.upsert_many(
+            "TRANSCRIPT",
+            [{
+                'video_id': video_id,
+                'language': language,
+                'is_generated': None,
+                'file_path': None,
+                'fetched_at': int(time.time()),
+                'remarks': remarks,
+            }],
+            ("video_id", "language")
+        )
+
+    def import_transcript_file(self, video_id: str, channel_id: str, language: str = "en") -> int:
+        """
+        Imports a legacy per-video JSON transcript file into the database.
+
+        Args:
+            video_id (str): The YouTube video ID.
+            channel_id (str): The channel ID used for the file location.
+            language (str): Language to record for the imported transcript.
+
+        Returns:
+            int: The number of segments imported.
+        """
+        filepath = os.path.join(self.db.transcript_dir, str(channel_id), f"{video_id}.json")
+        if not os.path.exists(filepath):
+            return 0
+
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                segments = json.load(f)
+        except Exception:
+            logger.exception(f"Error reading legacy transcript file {filepath}")
+            return 0
+
+        if not isinstance(segments, list):
+            return 0
+        segments = [seg for seg in segments if isinstance(seg, dict)]
+        return self.save_transcript_rows(video_id, language, None, segments, filepath,
+                                         fetched_at=os.path.getmtime(filepath), channel_id=channel_id)
+
+    def ensure_transcripts_stored(self, video_details: dict[str, list]) -> None:
+        """
+        Imports legacy JSON transcript files for videos that have no stored transcript yet.
+
+        Args:
+            video_details (dict): A dictionary with channel_id as key and list of video_ids as value.
+        """
+        for channel_id, video_id_list in video_details.items():
+            for video_id in video_id_list:
+                if self.db.fetch("TRANSCRIPT", where="video_id=?", params=(video_id,),
+                                 columns=["transcript_id"], limit=1):
+                    continue
+                self.import_transcript_file(video_id, channel_id)
+
+    def iter_transcript_segments(self, video_ids: List[str], language: str = "en",
+                                 batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Streams stored transcript segments for the given videos.
+
+        Args:
+            video_ids (List[str]): The video IDs to read.
+            language (str): The transcript language to read.
+            batch_size (int): Number of rows pulled from the cursor at a time.
+
+        Yields:
+            dict: Segments with video_id, start, duration and text keys, in playback order per video.
+        """
+        # Stay well below SQLite's bound-parameter limit
+        chunk_size = 500
+        for start in range(0, len(video_ids), chunk_size):
+            chunk = list(video_ids[start:start + chunk_size])
+            where = (
+                "transcript_id IN (SELECT transcript_id FROM TRANSCRIPT "
+                f"WHERE language=? AND video_id IN ({', '.join(['?'] * len(chunk))}))"
+            )
+            for batch in self.db.iter_fetch("TRANSCRIPT_SEGMENT", where=where, params=(language, *chunk),
+                                            order_by="transcript_id, seq",
+                                            columns=["video_id", "start", "duration", "text"],
+                                            batch_size=batch_size):
+                yield from batch
 
     def save_transcript(self, transcript_data: FetchedTranscript, channel_id: str, filename: str) -> str:
         """
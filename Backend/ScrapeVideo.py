@@ -1,20 +1,86 @@
 # video_worker.py
 import os
+import filecmp
+import json
+import shutil
+import time
 import scrapetube
 import yt_dlp
 from datetime import datetime, timedelta, timezone
 import re
 import asyncio
 import aiohttp
-from typing import List, Dict, Optional, Callable
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from email.utils import formatdate
+from urllib.parse import urlsplit
+from typing import Awaitable, List, Dict, Iterator, Optional, Callable, Set, Tuple
 
-from PySide6.QtCore import QObject, Signal, Slot, QMetaObject, Qt, Q_ARG
+from PySide6.QtCore import QObject, QThread, Signal, Slot, QMetaObject, Qt, Q_ARG
+from PySide6.QtGui import QImage
 
+from Backend.ShortsMetadata import (SHORTS_YDL_OPTS, ShortsMetadataEngine, fetch_shorts_metadata_lean,
+                                    short_metadata_from_info)
 from Data.DatabaseManager import DatabaseManager
 from utils.AppState import app_state
 from utils.Logger import logger
 
 
+# Pre-resized thumbnail variants (width, height), matching the boxes YouTubeVideoDelegate paints
+THUMBNAIL_SIZES: Dict[str, Tuple[int, int]] = {
+    "grid": (256, 144),
+    "list": (178, 100),
+}
+THUMBNAIL_VARIANT_QUALITY = 85
+
+
+def thumbnail_variant_path(thumb_path: str, variant: str) -> str:
+    """
+    Returns the path of a pre-resized thumbnail variant, e.g. <id>.png -> <id>_grid.jpg.
+    """
+    root, _ = os.path.splitext(str(thumb_path))
+    return f"{root}_{variant}.jpg"
+
+
+def make_thumbnail_variants(thumb_path: str) -> bool:
+    """
+    Writes the grid and list variants of a downloaded thumbnail as JPEG, scaled to fit
+    their box with the aspect ratio kept. Variants newer than the source are left alone.
+    Only uses QImage, so it is safe to run in worker threads.
+
+    Returns:
+        True if all variants exist afterwards.
+    """
+    thumb_path = str(thumb_path)
+    try:
+        source_mtime = os.path.getmtime(thumb_path)
+    except OSError:
+        return False
+
+    image: Optional[QImage] = None
+    for variant, (width, height) in THUMBNAIL_SIZES.items():
+        variant_path = thumbnail_variant_path(thumb_path, variant)
+        try:
+            if os.path.getmtime(variant_path) >= source_mtime:
+                continue
+        except OSError:
+            pass
+
+        if image is None:
+            image = QImage(thumb_path)
+            if image.isNull():
+                logger.error(f"Failed to read thumbnail: {thumb_path}")
+                return False
+
+        scaled = image.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        tmp_path = variant_path + ".part"
+        if not scaled.save(tmp_path, "JPEG", THUMBNAIL_VARIANT_QUALITY):
+            logger.error(f"Failed to write thumbnail variant: {variant_path}")
+            return False
+        os.replace(tmp_path, variant_path)
+    return True
+
+
 def parse_duration(duration: Optional[str]) -> int:
     """
     Converts a duration string from YouTube (e.g. "10:20" or "1:10:20") to seconds.
@@ -83,32 +149,192 @@ def parse_time_since_published(text: Optional[str]) -> int:
         return int(now.timestamp())
 
 
-async def download_img_async(url: str, save_path: str, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore) -> bool:
+class ThumbnailCache:
     """
-    Download thumbnail image asynchronously.
+    Thumbnail downloader that remembers what it has already fetched.
+
+    The source URL, ETag/Last-Modified validators and byte size of every file are
+    kept in THUMBNAIL_CACHE. Intact files checked within max_age_seconds are skipped
+    without a request, older ones are revalidated with a conditional request, and
+    concurrent requests for the same URL share a single download.
     """
-    async with semaphore:
-        try:
-            url = str(url)
-            save_path = str(save_path)
-
-            # Fix double https issue
-            if url.startswith("https:https://"):
-                url = url.replace("https:https://", "https://", 1)
-
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as response:
-                response.raise_for_status()
-                # Ensure parent dir exists
-                os.makedirs(os.path.dirname(save_path), exist_ok=True)
-                with open(save_path, "wb") as f:
-                    async for chunk in response.content.iter_chunked(8192):
-                        f.write(chunk)
+
+    # Thumbnails checked more recently than this are trusted without a request
+    MAX_AGE_SECONDS = 7 * 24 * 3600
+    # Cache rows are buffered and written in batches of this size
+    FLUSH_SIZE = 200
+
+    def __init__(self, db: DatabaseManager, channel_id: str, session: aiohttp.ClientSession,
+                 semaphore: asyncio.Semaphore, max_age_seconds: Optional[int] = None):
+        self.db = db
+        self.channel_id = str(channel_id)
+        self.session = session
+        self.semaphore = semaphore
+        self.max_age_seconds = self.MAX_AGE_SECONDS if max_age_seconds is None else max_age_seconds
+        self.entries: Dict[str, Dict] = {}
+        self.stats = {"skipped": 0, "not_modified": 0, "downloaded": 0, "shared": 0, "failed": 0}
+        self._pending: List[Dict] = []
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def load(self) -> None:
+        """
+        Load the cache entries of this channel. Blocking, so run it off the event loop.
+        """
+        for batch in self.db.iter_fetch("THUMBNAIL_CACHE", where="channel_id=?", params=(self.channel_id,)):
+            for row in batch:
+                self.entries[row["file_path"]] = row
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        url = str(url)
+        # Fix double https issue
+        if url.startswith("https:https://"):
+            url = url.replace("https:https://", "https://", 1)
+        return url
+
+    @staticmethod
+    def _same_image(url_a: Optional[str], url_b: Optional[str]) -> bool:
+        # scrapetube URLs carry per-listing signing parameters; the image is identified by its path
+        if not url_a or not url_b:
+            return False
+        return urlsplit(url_a)._replace(query="") == urlsplit(url_b)._replace(query="")
+
+    def _is_intact(self, entry: Optional[Dict], url: str, save_path: str) -> bool:
+        """
+        True if save_path exists, matches the recorded size and came from the same image URL.
+        """
+        if not entry or not os.path.exists(save_path):
+            return False
+        if entry.get("size") is not None and os.path.getsize(save_path) != entry["size"]:
+            return False
+        return self._same_image(entry.get("url"), url)
+
+    def is_fresh(self, url: str, save_path: str) -> bool:
+        entry = self.entries.get(save_path)
+        if not self._is_intact(entry, url, save_path):
+            return False
+        return time.time() - (entry.get("checked_at") or 0) < self.max_age_seconds
+
+    def _remember(self, save_path: str, url: str, etag: Optional[str], last_modified: Optional[str], size: int) -> None:
+        entry = {
+            "file_path": save_path,
+            "channel_id": self.channel_id,
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "size": int(size),
+            "checked_at": int(time.time()),
+        }
+        self.entries[save_path] = entry
+        self._pending.append(entry)
+
+    async def fetch(self, url: str, save_path: str) -> bool:
+        """
+        Make sure save_path holds the current image behind url.
+
+        Args:
+            url: Thumbnail URL as listed by scrapetube.
+            save_path: Destination file.
+
+        Returns:
+            True if the file is present and current, False if the download failed.
+        """
+        url = self.normalize_url(url)
+        save_path = str(save_path)
+
+        if self.is_fresh(url, save_path):
+            self.stats["skipped"] += 1
             return True
 
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._download(url, save_path))
+            self._inflight[url] = task
+            task.add_done_callback(lambda _: self._inflight.pop(url, None))
+
+        ok, path = await task
+        if ok and path != save_path:
+            # Same image requested for another file while it was in flight: reuse the bytes
+            try:
+                if not (os.path.exists(save_path) and filecmp.cmp(path, save_path, shallow=False)):
+                    os.makedirs(os.path.dirname(save_path), exist_ok=True)
+                    shutil.copyfile(path, save_path)
+                source = self.entries.get(path, {})
+                self._remember(save_path, url, source.get("etag"), source.get("last_modified"),
+                               os.path.getsize(save_path))
+                self.stats["shared"] += 1
+            except OSError:
+                logger.exception("Failed to copy thumbnail %s to %s", path, save_path)
+                ok = False
+
+        if len(self._pending) >= self.FLUSH_SIZE:
+            await self.flush()
+        return ok
+
+    async def _download(self, url: str, save_path: str) -> Tuple[bool, str]:
+        """
+        Download url into save_path, conditionally when an intact copy already exists.
+
+        Returns:
+            (success, save_path)
+        """
+        entry = self.entries.get(save_path)
+        headers = {}
+        if os.path.exists(save_path) and (entry is None or self._is_intact(entry, url, save_path)):
+            if entry and entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry and entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+            if not headers:
+                # No validators recorded (file predates the cache): compare against its mtime
+                headers["If-Modified-Since"] = formatdate(os.path.getmtime(save_path), usegmt=True)
+
+        async with self.semaphore:
+            try:
+                async with self.session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as response:
+                    if response.status == 304:
+                        self.stats["not_modified"] += 1
+                        self._remember(
+                            save_path, url,
+                            response.headers.get("ETag") or (entry or {}).get("etag"),
+                            response.headers.get("Last-Modified") or (entry or {}).get("last_modified"),
+                            os.path.getsize(save_path)
+                        )
+                        return True, save_path
+
+                    response.raise_for_status()
+                    os.makedirs(os.path.dirname(save_path), exist_ok=True)
+                    # Write next to the target and swap in, so a failed transfer never leaves a partial image
+                    tmp_path = save_path + ".part"
+                    size = 0
+                    with open(tmp_path, "wb") as f:
+                        async for chunk in response.content.iter_chunked(8192):
+                            f.write(chunk)
+                            size += len(chunk)
+                    os.replace(tmp_path, save_path)
+
+                self.stats["downloaded"] += 1
+                self._remember(save_path, url, response.headers.get("ETag"),
+                               response.headers.get("Last-Modified"), size)
+                return True, save_path
+
+            except Exception:
+                self.stats["failed"] += 1
+                logger.error(f"Failed to download thumbnail: {url}")
+                logger.exception("Thumbnail download error:")
+                return False, save_path
+
+    async def flush(self) -> None:
+        """
+        Write buffered cache entries to the database.
+        """
+        if not self._pending:
+            return
+        rows, self._pending = self._pending, []
+        try:
+            await asyncio.to_thread(self.db.upsert_many, "THUMBNAIL_CACHE", rows, "file_path")
         except Exception:
-            logger.error(f"Failed to download thumbnail: {url}")
-            logger.exception("Thumbnail download error:")
-            return False
+            logger.exception("Failed to save %d thumbnail cache entries", len(rows))
 
 
 async def fetch_shorts_metadata_async(video_id: str, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore) -> dict:
@@ -120,29 +346,14 @@ async def fetch_shorts_metadata_async(video_id: str, session: aiohttp.ClientSess
         try:
             loop = asyncio.get_event_loop()
 
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-                'extract_flat': False,
-                'socket_timeout': 10,
-                'no_check_certificate': True,
-            }
-
             def extract_info():
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                with yt_dlp.YoutubeDL(SHORTS_YDL_OPTS) as ydl:
                     # Use the shorts URL to get short-specific extractor behavior
                     return ydl.extract_info(f"https://www.youtube.com/shorts/{video_id}", download=False)
 
             info = await loop.run_in_executor(None, extract_info)
 
-            return {
-                'video_id': str(video_id),
-                'duration': int(info.get('duration', 0)) if info.get('duration') is not None else 0,
-                'upload_date': info.get('upload_date'),  # YYYYMMDD or None
-                'description': str(info.get('description', '') or ''),
-                'view_count': int(info.get('view_count', 0) or 0),
-                'title': str(info.get('title', '') or 'Untitled'),
-            }
+            return short_metadata_from_info(video_id, info)
         except Exception:
             logger.error(f"Failed to fetch metadata for short video: {video_id}")
             logger.exception("Short metadata fetch error:")
@@ -152,49 +363,69 @@ async def fetch_shorts_metadata_async(video_id: str, session: aiohttp.ClientSess
 async def fetch_shorts_batch_async(
     video_ids: List[str],
     progress_callback: Optional[Callable[[int, int], None]] = None,
-    max_concurrent: int = 100
+    max_concurrent: int = 100,
+    session: Optional[aiohttp.ClientSession] = None,
+    semaphore: Optional[asyncio.Semaphore] = None
 ) -> Dict[str, Dict]:
     """
     Fetch metadata for multiple shorts concurrently.
+
+    Pass session and semaphore to share the caller's HTTP session and concurrency
+    budget; otherwise a private session limited to max_concurrent is used.
+    progress_callback may be a plain callable or a QObject exposing update_from_async.
     """
+    if session is None:
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with aiohttp.ClientSession(timeout=timeout) as own_session:
+            return await fetch_shorts_batch_async(
+                video_ids, progress_callback, max_concurrent, own_session, semaphore
+            )
+
     results: Dict[str, Dict] = {}
     total = len(video_ids)
     completed = 0
 
-    semaphore = asyncio.Semaphore(max_concurrent)
-    timeout = aiohttp.ClientTimeout(total=30)
-
-    async with aiohttp.ClientSession(timeout=timeout) as session:
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max_concurrent)
 
-        async def fetch_with_progress(video_id: str):
-            nonlocal completed
-            result = await fetch_shorts_metadata_async(str(video_id), session, semaphore)
-            completed += 1
+    async def fetch_with_progress(video_id: str):
+        nonlocal completed
+        result = await fetch_shorts_metadata_async(str(video_id), session, semaphore)
+        completed += 1
 
-            if progress_callback:
-                try:
-                    QMetaObject.invokeMethod(
-                        progress_callback,
-                        "update_from_async",
-                        Qt.QueuedConnection,
-                        Q_ARG(int, completed),
-                        Q_ARG(int, total)
-                    )
-                except Exception:
-                    # fallback: call directly (shouldn't happen in Qt main thread)
-                    try:
-                        progress_callback.update_from_async(completed, total)
-                    except Exception:
-                        pass
+        if progress_callback is None:
+            return result
 
+        if not isinstance(progress_callback, QObject):
+            try:
+                progress_callback(completed, total)
+            except Exception:
+                logger.exception("Shorts progress callback failed:")
             return result
 
-        tasks = [fetch_with_progress(vid) for vid in video_ids]
-        all_results = await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            QMetaObject.invokeMethod(
+                progress_callback,
+                "update_from_async",
+                Qt.QueuedConnection,
+                Q_ARG(int, completed),
+                Q_ARG(int, total)
+            )
+        except Exception:
+            # fallback: call directly (shouldn't happen in Qt main thread)
+            try:
+                progress_callback.update_from_async(completed, total)
+            except Exception:
+                pass
+
+        return result
+
+    tasks = [fetch_with_progress(vid) for vid in video_ids]
+    all_results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        for r in all_results:
-            if isinstance(r, dict) and 'video_id' in r:
-                results[r['video_id']] = r
+    for r in all_results:
+        if isinstance(r, dict) and 'video_id' in r:
+            results[r['video_id']] = r
 
     return results
 
@@ -220,17 +451,205 @@ def run_async_shorts_fetch(video_ids: list, progress_callback=None, max_concurre
         pass
 
 
+def parse_view_count(view_text: Optional[str]) -> int:
+    """
+    Converts a view count text such as "1,234 views", "1.2K views" or "1.2M views" to an integer.
+    Returns 0 if the text is empty or unparsable.
+    """
+    if not view_text:
+        return 0
+
+    try:
+        # Remove trailing "views" and whitespace, then handle suffixes
+        vt = view_text.replace("views", "").strip().lower()
+        if vt.endswith("k"):
+            return int(float(vt[:-1].replace(",", "")) * 1_000)
+        elif vt.endswith("m"):
+            return int(float(vt[:-1].replace(",", "")) * 1_000_000)
+        elif vt.endswith("b"):
+            return int(float(vt[:-1].replace(",", "")) * 1_000_000_000)
+        return int(vt.replace(",", "").replace(".", ""))
+    except Exception:
+        # best-effort fallback to remove non-digits
+        digits = re.sub(r"[^\d]", "", view_text)
+        try:
+            return int(digits) if digits else 0
+        except Exception:
+            return 0
+
+
+def format_time_since(dt: datetime) -> str:
+    """
+    Formats a UTC datetime as a YouTube-style relative string such as "3 weeks ago".
+    """
+    days_ago = (datetime.now(timezone.utc) - dt).days
+    if days_ago == 0:
+        return "Today"
+    elif days_ago == 1:
+        return "1 day ago"
+    elif days_ago < 7:
+        return f"{days_ago} days ago"
+    elif days_ago < 30:
+        weeks = days_ago // 7
+        return f"{weeks} week{'s' if weeks > 1 else ''} ago"
+    elif days_ago < 365:
+        months = days_ago // 30
+        return f"{months} month{'s' if months > 1 else ''} ago"
+    years = days_ago // 365
+    return f"{years} year{'s' if years > 1 else ''} ago"
+
+
+def build_video_record(video: dict, vtype: str, channel_id: str, thumb_dir: str,
+                       meta: Optional[dict] = None) -> Tuple[Dict, Optional[str]]:
+    """
+    Parses one scrapetube video payload into a VIDEO row.
+
+    For shorts, fields are taken from the yt-dlp metadata in `meta` when available,
+    falling back to the partial scrapetube info.
+
+    Returns:
+        (record, thumbnail_url) where thumbnail_url is the largest scrapetube thumbnail or None.
+    """
+    video_id = video.get("videoId")
+
+    # Default fields
+    title = (
+        video.get("title", {})
+        .get("runs", [{}])[0]
+        .get("text", "Untitled")
+    )
+
+    description = ""
+    duration_text = None
+    duration_in_seconds = 0
+    time_since_published = None
+    upload_timestamp = int(datetime.now(timezone.utc).timestamp())
+    views = 0
+
+    # Thumbnail from scrapetube if available
+    thumbnails = video.get("thumbnail", {}).get("thumbnails", [])
+    thumbnail_url = thumbnails[-1].get("url") if thumbnails else None
+    thumb_path = os.path.join(thumb_dir, f"{video_id}.png")
+
+    if vtype == "shorts":
+        # SHORTS: enrich from yt-dlp results when available, otherwise keep scrapetube partial info
+        if meta and not meta.get("error"):
+            title = meta.get("title", title)
+            description = meta.get("description", "")
+            duration_in_seconds = int(meta.get("duration", 0) or 0)
+            if duration_in_seconds:
+                # format duration text as M:SS or H:MM:SS
+                h, rem = divmod(duration_in_seconds, 3600)
+                m, s = divmod(rem, 60)
+                duration_text = (f"{h}:{m:02d}:{s:02d}" if h else f"{m}:{s:02d}")
+
+            views = int(meta.get("view_count", 0) or 0)
+
+            upload_date_str = meta.get("upload_date")  # YYYYMMDD
+            if upload_date_str:
+                try:
+                    dt = datetime.strptime(upload_date_str, "%Y%m%d").replace(tzinfo=timezone.utc)
+                    upload_timestamp = int(dt.timestamp())
+                    time_since_published = format_time_since(dt)
+                except Exception:
+                    upload_timestamp = int(datetime.now(timezone.utc).timestamp())
+                    time_since_published = None
+    else:
+        # NON-SHORTS: parse fields from scrapetube payload
+        description = (
+            video.get("descriptionSnippet", {})
+            .get("runs", [{}])[0]
+            .get("text", "")
+        )
+
+        duration_text = (
+            video.get("lengthText", {}).get("simpleText")
+            or video.get("lengthText", {}).get("runs", [{}])[0].get("text")
+            or None
+        )
+        duration_in_seconds = parse_duration(duration_text) if duration_text else 0
+
+        time_since_published = (
+            video.get("publishedTimeText", {}).get("simpleText")
+            or video.get("publishedTimeText", {}).get("runs", [{}])[0].get("text")
+            or None
+        )
+        upload_timestamp = parse_time_since_published(time_since_published)
+
+        view_text = (
+            video.get("viewCountText", {}).get("simpleText")
+            or video.get("viewCountText", {}).get("runs", [{}])[0].get("text", "")
+        )
+        views = parse_view_count(view_text)
+
+    record = {
+        "video_id": video_id,
+        "channel_id": channel_id,
+        "video_type": vtype,
+        "video_url": f"https://www.youtube.com/watch?v={video_id}",
+        "title": title,
+        "desc": description,
+        "duration": duration_text,
+        "duration_in_seconds": int(duration_in_seconds or 0),
+        "thumbnail_path": thumb_path,
+        "view_count": int(views or 0),
+        "time_since_published": time_since_published,
+        "upload_timestamp": int(upload_timestamp or int(datetime.now(timezone.utc).timestamp()))
+    }
+    return record, thumbnail_url
+
+
 class VideoWorker(QObject):
     progress_updated = Signal(str)
     progress_percentage = Signal(int)
+    videos_saved = Signal(list)
     finished = Signal()
 
-    def __init__(self, channel_id: str, channel_url: str, scrape_shorts: bool):
+    # Incremental mode stops listing after this many consecutive already-known videos
+    KNOWN_RUN_TO_STOP = 3
+
+    # Global budget of concurrent network requests (thumbnails + shorts metadata),
+    # shared by all content types scraped in parallel
+    NETWORK_CONCURRENCY = 20
+
+    # Pipeline tuning: bounded queues keep memory flat while stages overlap
+    QUEUE_SIZE = 200
+    PARSE_BATCH_SIZE = 30
+    THUMBNAIL_WORKERS = 20
+    DB_BATCH_SIZE = 200
+    DB_FLUSH_SECONDS = 0.5
+    # How often a listing thread blocked on a full queue checks whether the pipeline was aborted
+    ABORT_POLL_SECONDS = 0.2
+
+    def __init__(self, channel_id: str, channel_url: str, scrape_shorts: bool, incremental: bool = True,
+                 shorts_workers: Optional[int] = None):
+        """
+        Args:
+            channel_id: Channel to scrape.
+            channel_url: Channel URL passed to scrapetube.
+            scrape_shorts: Also scrape the channel's shorts.
+            incremental: Only list videos newer than the last completed scrape.
+            shorts_workers: Worker processes for shorts metadata; 0 extracts in threads
+                instead. Defaults to the STATUBE_SHORTS_WORKERS environment variable,
+                or one per CPU core (capped at 8) when that is unset.
+        """
         super().__init__()
         self.db: DatabaseManager = app_state.db
         self.channel_id = channel_id
         self.channel_url = channel_url
         self.scrape_shorts = bool(scrape_shorts)
+        self.incremental = bool(incremental)
+
+        if shorts_workers is None:
+            try:
+                shorts_workers = int(os.environ.get("STATUBE_SHORTS_WORKERS", "") or -1)
+            except ValueError:
+                shorts_workers = -1
+        # -1 lets the engine pick the worker count
+        self.shorts_workers = shorts_workers
+        self.shorts_engine: Optional[ShortsMetadataEngine] = None
+        # Switched off for the rest of the run if the lean path stops resolving anything
+        self.lean_shorts_metadata = True
 
         # types that scrapetube accepts for content_type parameter
         self.types = {
@@ -242,7 +661,13 @@ class VideoWorker(QObject):
         if not self.scrape_shorts:
             self.types.pop("shorts", None)
 
-        self.current_type_counter = 0
+        self.newest_video_ids: Dict[str, Optional[str]] = {}
+        # High-water marks recorded by the previous scrape, per content type
+        self.last_video_ids: Dict[str, Optional[str]] = {}
+        # Per content type progress lanes, combined into one overall percentage
+        self._lanes: Dict[str, Dict] = {}
+        self._last_percentage = 0
+        self._thread: Optional[QThread] = None
 
     @Slot()
     def run(self):
@@ -250,6 +675,8 @@ class VideoWorker(QObject):
         Entry point callable by a QThread. Uses asyncio.run for the coroutine root.
         Guarantees finished signal in finally block of _fetch_video_urls_async.
         """
+        # Remember the owning QThread so helper threads can check for cancellation
+        self._thread = QThread.currentThread()
         try:
             asyncio.run(self._fetch_video_urls_async())
         except Exception:
@@ -268,254 +695,470 @@ class VideoWorker(QObject):
         """
         msg = f"[Shorts] Fetching metadata: {completed}/{total}"
         self.progress_updated.emit(msg)
-        try:
-            pct = int((self.current_type_counter - 1) * 33 + (completed / total) * 20)
-        except Exception:
-            pct = 0
-        self.progress_percentage.emit(min(pct, 95))
+        self._emit_overall_progress()
+
+    @staticmethod
+    def _lane_fraction(lane: Dict) -> float:
+        """
+        Estimate how far one content type has progressed, from 0.0 to 1.0.
+
+        While the listing is still running the total is unknown, so saved/listed
+        only counts for half of the lane.
+        """
+        if lane["done"]:
+            return 1.0
+        if not lane["listed"]:
+            return 0.0
+        fraction = min(lane["saved"] / lane["listed"], 1.0)
+        return fraction if lane["listing_done"] else fraction * 0.5
+
+    def _emit_overall_progress(self) -> None:
+        """
+        Combine the progress lanes of all content types into one percentage.
+        The emitted value never goes backwards and stays below 100 until completion.
+        """
+        if not self._lanes:
+            return
+        fraction = sum(self._lane_fraction(lane) for lane in self._lanes.values()) / len(self._lanes)
+        pct = min(int(fraction * 95), 95)
+        if pct > self._last_percentage:
+            self._last_percentage = pct
+            self.progress_percentage.emit(pct)
 
     def _should_stop(self):
         # This uses QThread interruption mechanism to check for cancellation.
-        from PySide6.QtCore import QThread
         try:
-            return QThread.currentThread().isInterruptionRequested()
+            thread = self._thread or QThread.currentThread()
+            return thread.isInterruptionRequested()
         except Exception:
             return False
 
-    async def _fetch_video_urls_async(self):
+    def _iter_channel_videos(self, vtype: str, ctype: str) -> Iterator[dict]:
         """
-        Main coroutine that scrapes channel pages via scrapetube, optionally
-        enriches shorts via yt-dlp, downloads thumbnails, and inserts into DB.
-        """
-        try:
-            self.progress_updated.emit("Starting scrapetube scraping...")
-            self.progress_percentage.emit(0)
+        Lazily yield a channel's videos of one content type via scrapetube.
 
-            total_processed = 0
-            channel_thumb_dir = os.path.join(self.db.thumbnail_dir, str(self.channel_id))
-            os.makedirs(channel_thumb_dir, exist_ok=True)
+        The scrapetube generator requests one page at a time. In incremental mode,
+        listing stops at the recorded high-water mark or after a run of already-stored
+        videos, so only new uploads are yielded. Videos that failed in the previous scrape
+        are yielded again, and the run of stored videos only ends the listing once all of
+        them have been seen. Without a completed previous scrape for this content type the
+        full history is listed.
 
-            timeout = aiohttp.ClientTimeout(total=30)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                thumbnail_semaphore = asyncio.Semaphore(20)
+        The first listed video_id is stored in self.newest_video_ids[vtype].
+        """
+        state = None
+        if self.incremental:
+            rows = self.db.fetch(
+                "SCRAPE_STATE",
+                where="channel_id=? AND content_type=?",
+                params=(self.channel_id, vtype),
+                columns=["last_video_id", "pending_video_ids"],
+                limit=1
+            )
+            state = rows[0] if rows else None
+
+        last_video_id = state.get("last_video_id") if state else None
+        pending = set(json.loads(state["pending_video_ids"])) if state and state.get("pending_video_ids") else set()
+        unseen_pending = set(pending)
+        known = set()
+        if state:
+            known = {
+                row["video_id"]
+                for batch in self.db.iter_fetch(
+                    "VIDEO",
+                    where="channel_id=? AND video_type=?",
+                    params=(self.channel_id, vtype),
+                    columns=["video_id"]
+                )
+                for row in batch
+            }
 
-                for i, (vtype, ctype) in enumerate(self.types.items(), start=1):
-                    # cancellation check
-                    if self._should_stop():
-                        self.progress_updated.emit("Scraping cancelled by user")
-                        return
+        self.newest_video_ids[vtype] = last_video_id
+        self.last_video_ids[vtype] = last_video_id
+        first = True
+        known_run = 0
+        for video in scrapetube.get_channel(channel_url=self.channel_url, content_type=ctype):
+            video_id = video.get("videoId")
+            if not video_id:
+                continue
+            if first:
+                self.newest_video_ids[vtype] = video_id
+                first = False
+            if state:
+                if video_id == last_video_id:
+                    break
+                if video_id in pending:
+                    unseen_pending.discard(video_id)
+                elif video_id in known:
+                    known_run += 1
+                    if known_run >= self.KNOWN_RUN_TO_STOP and not unseen_pending:
+                        break
+                    continue
+                known_run = 0
+            yield video
+
+    def _high_water_mark(self, vtype: str, listed: List[str], failed: Set[str]) -> Optional[str]:
+        """
+        The newest listed video that is older than every failed one, so the next
+        incremental scrape lists back down to the failures. Keeps the previous mark if
+        the oldest listed video failed.
+
+        Args:
+            vtype: Content type key (videos, shorts, live).
+            listed: Video IDs in listing order, newest first.
+            failed: Video IDs that failed to parse or to get their shorts metadata.
+        """
+        if not failed:
+            return self.newest_video_ids.get(vtype)
+        mark = self.last_video_ids.get(vtype)
+        for video_id in reversed(listed):
+            if video_id in failed:
+                break
+            mark = video_id
+        return mark
+
+    def _save_scrape_state(self, vtype: str, newest_video_id: Optional[str], failed: Set[str]) -> None:
+        """
+        Record the high-water mark of a completed scrape for one content type, together
+        with the videos that failed and are retried by the next incremental scrape.
+        """
+        if not newest_video_id:
+            return
+        try:
+            self.db.upsert_many(
+                "SCRAPE_STATE",
+                [{
+                    "channel_id": self.channel_id,
+                    "content_type": vtype,
+                    "last_video_id": newest_video_id,
+                    "pending_video_ids": json.dumps(sorted(failed)) if failed else None,
+                    "last_scraped_at": int(datetime.now(timezone.utc).timestamp()),
+                }],
+                ("channel_id", "content_type")
+            )
+        except Exception:
+            logger.exception("Failed to save scrape state for %s/%s", self.channel_id, vtype)
 
-                    self.current_type_counter = i
-                    self.progress_updated.emit(f"Fetching {vtype.capitalize()}...")
-                    self.progress_percentage.emit(int((i - 1) * 33))
+    async def _scrape_type(self, vtype: str, ctype: str, session: aiohttp.ClientSession,
+                           network_semaphore: asyncio.Semaphore,
+                           listing_executor: ThreadPoolExecutor,
+                           thumbnail_cache: ThumbnailCache,
+                           resize_executor: ThreadPoolExecutor) -> int:
+        """
+        Scrape one content type through a pipeline of concurrent stages connected by
+        bounded queues: page fetch -> parse (+ shorts metadata) -> thumbnail download
+        and resize -> batched DB write. Each committed batch is announced through videos_saved.
+
+        Args:
+            vtype: Content type key (videos, shorts, live).
+            ctype: Content type name accepted by scrapetube.
+            session: HTTP session shared by all content types.
+            network_semaphore: Global budget for concurrent network requests.
+            listing_executor: Thread pool running the blocking scrapetube listings.
+            thumbnail_cache: Cache that downloads only missing or changed thumbnails.
+            resize_executor: Thread pool producing the pre-resized thumbnail variants.
+
+        Returns:
+            Number of videos saved.
+        """
+        loop = asyncio.get_running_loop()
+        label = vtype.capitalize()
+        channel_thumb_dir = os.path.join(self.db.thumbnail_dir, str(self.channel_id))
+        os.makedirs(channel_thumb_dir, exist_ok=True)
+
+        raw_queue: asyncio.Queue = asyncio.Queue(self.QUEUE_SIZE)
+        thumb_queue: asyncio.Queue = asyncio.Queue(self.QUEUE_SIZE)
+        db_queue: asyncio.Queue = asyncio.Queue(self.QUEUE_SIZE)
+        state = {
+            "listed": 0, "parsed": 0, "saved": 0, "meta_done": 0,
+            "listing_ok": True, "listing_done": False, "db_ok": True, "done": False,
+            # Listing order and the videos to retry, for the high-water mark
+            "order": [], "failed": set()
+        }
+        self._lanes[vtype] = state
+        # Set when a stage fails; the other stages are cancelled and the listing thread gives up
+        aborted = threading.Event()
+
+        def put_raw(item) -> bool:
+            # Blocks the listing thread while the parse stage is behind (back-pressure).
+            # Returns False if the pipeline was aborted, as nobody drains the queue then.
+            future = asyncio.run_coroutine_threadsafe(raw_queue.put(item), loop)
+            while True:
+                try:
+                    future.result(timeout=self.ABORT_POLL_SECONDS)
+                    return True
+                except FutureTimeoutError:
+                    if aborted.is_set():
+                        future.cancel()
+                        return False
+
+        def fetch_pages() -> None:
+            try:
+                for video in self._iter_channel_videos(vtype, ctype):
+                    if self._should_stop() or aborted.is_set():
+                        break
+                    state["listed"] += 1
+                    state["order"].append(video.get("videoId"))
+                    if not put_raw(video):
+                        break
+            except Exception:
+                logger.exception("[%s] listing stage failed (scrapetube.get_channel)", label)
+                state["listing_ok"] = False
+            finally:
+                state["listing_done"] = True
+                put_raw(None)
+
+        async def run_stage(name: str, stage: Awaitable) -> None:
+            # Name the stage that failed; sibling stages only see the fallout
+            try:
+                await stage
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("[%s] %s stage failed", label, name)
+                raise
 
-                    # scrapetube yields video dicts for the channel and content type
+        async def parse_stage() -> None:
+            try:
+                await parse_batches()
+            finally:
+                # Always release the thumbnail stages, even if parsing failed
+                if not aborted.is_set():
+                    for _ in range(self.THUMBNAIL_WORKERS):
+                        await thumb_queue.put(None)
+
+        async def parse_batches() -> None:
+            done = False
+            # Hand the shorts engine enough IDs per round to keep all of its workers busy
+            batch_size = self.PARSE_BATCH_SIZE
+            if vtype == "shorts" and self.shorts_engine is not None:
+                batch_size = max(batch_size, 2 * self.shorts_engine.workers * self.shorts_engine.batch_size)
+
+            while not done:
+                batch = [await raw_queue.get()]
+                while len(batch) < batch_size and not raw_queue.empty():
+                    batch.append(raw_queue.get_nowait())
+                done = batch[-1] is None
+                batch = [v for v in batch if v is not None]
+                if not batch:
+                    continue
+
+                # If shorts, fetch extended metadata via yt-dlp (more reliable) for this batch
+                shorts_metadata = {}
+                if vtype == "shorts" and not self._should_stop():
+                    video_ids = [v.get("videoId") for v in batch if v.get("videoId")]
+                    if video_ids:
+                        base = state["meta_done"]
+
+                        def progress_from(offset: int) -> Callable[[int, int], None]:
+                            # Progress across the whole listing: offset + items finished in this call
+                            def report(done: int, _total: int) -> None:
+                                self.update_from_async(offset + done, max(state["listed"], base + len(video_ids)))
+                            return report
+
+                        # Lean innertube lookups first; only unresolved IDs pay for full yt-dlp extraction
+                        if self.lean_shorts_metadata:
+                            shorts_metadata = await fetch_shorts_metadata_lean(
+                                video_ids, session, network_semaphore, progress_callback=progress_from(base)
+                            )
+                            if not shorts_metadata and len(video_ids) >= self.PARSE_BATCH_SIZE:
+                                logger.warning("Lean shorts metadata returned nothing; using full extraction only")
+                                self.lean_shorts_metadata = False
+
+                        missing = [vid for vid in video_ids if vid not in shorts_metadata]
+                        if missing:
+                            report_fallback = progress_from(base + len(shorts_metadata))
+                            if self.shorts_engine is not None:
+                                fallback = await self.shorts_engine.fetch(missing, report_fallback)
+                            else:
+                                fallback = await fetch_shorts_batch_async(
+                                    missing,
+                                    progress_callback=report_fallback,
+                                    session=session,
+                                    semaphore=network_semaphore
+                                )
+                            shorts_metadata.update(fallback)
+                        state["meta_done"] += len(video_ids)
+
+                for video in batch:
+                    video_id = video.get("videoId")
+                    if not video_id:
+                        continue
                     try:
-                        videos = list(scrapetube.get_channel(channel_url=self.channel_url, content_type=ctype))
+                        record, thumbnail_url = build_video_record(
+                            video, vtype, self.channel_id, channel_thumb_dir, shorts_metadata.get(video_id)
+                        )
                     except Exception:
-                        logger.exception("scrapetube.get_channel failed:")
-                        videos = []
-
-                    if not videos:
-                        self.progress_updated.emit(f"No {vtype} found.")
+                        logger.exception("Failed to parse video_id=%s", video_id)
+                        state["failed"].add(video_id)
                         continue
+                    meta = shorts_metadata.get(video_id)
+                    if vtype == "shorts" and (not meta or meta.get("error")):
+                        # Saved with listing data only; retried by the next incremental scrape
+                        state["failed"].add(video_id)
+                    await thumb_queue.put((record, thumbnail_url))
+                    state["parsed"] += 1
 
-                    self.progress_updated.emit(f"Fetched {len(videos)} {vtype}")
-
-                    # If shorts, prefetch extended metadata via yt-dlp (more reliable)
-                    shorts_metadata = {}
-                    if vtype == "shorts":
-                        video_ids = [v.get("videoId") for v in videos if v.get("videoId")]
-                        if video_ids:
-                            self.progress_updated.emit(f"[Shorts] Fetching metadata for {len(video_ids)} shorts (async)...")
-                            shorts_metadata = await fetch_shorts_batch_async(video_ids, progress_callback=self, max_concurrent=30)
-                            self.progress_updated.emit(f"[Shorts] Metadata fetched ({len(shorts_metadata)}).")
-
-                    thumbnail_tasks = []
-                    videos_to_insert = []
-
-                    for idx, video in enumerate(videos):
-                        if self._should_stop():
-                            self.progress_updated.emit("Scraping cancelled by user")
-                            return
-
-                        video_id = video.get("videoId")
-                        if not video_id:
-                            continue
-
-                        # Default fields
-                        title = (
-                            video.get("title", {})
-                            .get("runs", [{}])[0]
-                            .get("text", "Untitled")
-                        )
+                self.progress_updated.emit(f"[{label}] Processing: {state['parsed']}/{state['listed']}")
 
-                        description = ""
-                        duration_text = None
-                        duration_in_seconds = 0
-                        time_since_published = None
-                        upload_timestamp = int(datetime.now(timezone.utc).timestamp())
-                        views = 0
-
-                        # Thumbnail from scrapetube if available
-                        thumbnails = video.get("thumbnail", {}).get("thumbnails", [])
-                        thumbnail_url = thumbnails[-1].get("url") if thumbnails else None
-                        thumb_path = os.path.join(channel_thumb_dir, f"{video_id}.png")
-
-                        # SHORTS: enrich from yt-dlp results when available
-                        if vtype == "shorts":
-                            meta = shorts_metadata.get(video_id, {})
-                            if meta and not meta.get("error"):
-                                title = meta.get("title", title)
-                                description = meta.get("description", "")
-                                duration_in_seconds = int(meta.get("duration", 0) or 0)
-                                if duration_in_seconds:
-                                    # format duration text as M:SS or H:MM:SS
-                                    h, rem = divmod(duration_in_seconds, 3600)
-                                    m, s = divmod(rem, 60)
-                                    duration_text = (f"{h}:{m:02d}:{s:02d}" if h else f"{m}:{s:02d}")
-                                else:
-                                    duration_text = None
-
-                                views = int(meta.get("view_count", 0) or 0)
-
-                                upload_date_str = meta.get("upload_date")  # YYYYMMDD
-                                if upload_date_str:
-                                    try:
-                                        dt = datetime.strptime(upload_date_str, "%Y%m%d").replace(tzinfo=timezone.utc)
-                                        upload_timestamp = int(dt.timestamp())
-                                        days_ago = (datetime.now(timezone.utc) - dt).days
-                                        if days_ago == 0:
-                                            time_since_published = "Today"
-                                        elif days_ago == 1:
-                                            time_since_published = "1 day ago"
-                                        elif days_ago < 7:
-                                            time_since_published = f"{days_ago} days ago"
-                                        elif days_ago < 30:
-                                            weeks = days_ago // 7
-                                            time_since_published = f"{weeks} week{'s' if weeks > 1 else ''} ago"
-                                        elif days_ago < 365:
-                                            months = days_ago // 30
-                                            time_since_published = f"{months} month{'s' if months > 1 else ''} ago"
-                                        else:
-                                            years = days_ago // 365
-                                            time_since_published = f"{years} year{'s' if years > 1 else ''} ago"
-                                    except Exception:
-                                        upload_timestamp = int(datetime.now(timezone.utc).timestamp())
-                                        time_since_published = None
-                            else:
-                                # fallback to scrapetube partial info if yt-dlp failed
-                                title = (
-                                    video.get("title", {})
-                                    .get("runs", [{}])[0]
-                                    .get("text", "Untitled")
-                                )
-                                description = ""
-                                duration_text = None
-                                duration_in_seconds = 0
-                                views = 0
-                                upload_timestamp = int(datetime.now(timezone.utc).timestamp())
-                                time_since_published = None
-
-                        else:
-                            # NON-SHORTS: parse fields from scrapetube payload (same logic as old module)
-                            # Title already pulled above
-                            description = (
-                                video.get("descriptionSnippet", {})
-                                .get("runs", [{}])[0]
-                                .get("text", "")
-                            )
+        async def thumbnail_stage() -> None:
+            try:
+                while True:
+                    item = await thumb_queue.get()
+                    if item is None:
+                        break
+                    record, thumbnail_url = item
+                    thumb_path = record["thumbnail_path"]
+                    if thumbnail_url and not self._should_stop():
+                        await thumbnail_cache.fetch(thumbnail_url, thumb_path)
+                    if os.path.exists(thumb_path) and not self._should_stop():
+                        await loop.run_in_executor(resize_executor, make_thumbnail_variants, thumb_path)
+                    await db_queue.put(record)
+            finally:
+                if not aborted.is_set():
+                    await db_queue.put(None)
+
+        async def flush(batch: List[Dict]) -> None:
+            try:
+                await asyncio.to_thread(self.db.upsert_many, "VIDEO", batch, "video_id")
+            except Exception:
+                logger.exception("DB upsert failed for %d %s", len(batch), vtype)
+                state["db_ok"] = False
+                return
+            state["saved"] += len(batch)
+            self.videos_saved.emit([r["video_id"] for r in batch])
+            self.progress_updated.emit(f"[{label}] ✓ Saved {state['saved']} videos")
+            self._emit_overall_progress()
+
+        async def db_stage() -> None:
+            remaining = self.THUMBNAIL_WORKERS
+            batch: List[Dict] = []
+            # wait_for can swallow a cancellation that races with a completed get(), so
+            # also stop on the abort flag rather than waiting for sentinels that never come
+            while remaining and not aborted.is_set():
+                try:
+                    item = await asyncio.wait_for(db_queue.get(), timeout=self.DB_FLUSH_SECONDS)
+                except asyncio.TimeoutError:
+                    # Commit what we have so rows show up while slower stages keep running
+                    if batch:
+                        await flush(batch)
+                        batch = []
+                    continue
+                if item is None:
+                    remaining -= 1
+                    continue
+                batch.append(item)
+                if len(batch) >= self.DB_BATCH_SIZE:
+                    await flush(batch)
+                    batch = []
+            if batch:
+                await flush(batch)
+
+        listing = loop.run_in_executor(listing_executor, fetch_pages)
+        stages = [
+            asyncio.ensure_future(run_stage("parse", parse_stage())),
+            *(asyncio.ensure_future(run_stage("thumbnail", thumbnail_stage()))
+              for _ in range(self.THUMBNAIL_WORKERS)),
+            asyncio.ensure_future(run_stage("database", db_stage())),
+        ]
+        try:
+            await asyncio.gather(*stages)
+        except BaseException:
+            # Stop the remaining stages; the listing thread notices and stops putting
+            aborted.set()
+            for task in stages:
+                task.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
+            raise
+        finally:
+            await asyncio.wait([listing])
 
-                            duration_text = (
-                                video.get("lengthText", {}).get("simpleText")
-                                or video.get("lengthText", {}).get("runs", [{}])[0].get("text")
-                                or None
-                            )
-                            duration_in_seconds = parse_duration(duration_text) if duration_text else 0
+        if self._should_stop():
+            return state["saved"]
 
-                            time_since_published = (
-                                video.get("publishedTimeText", {}).get("simpleText")
-                                or video.get("publishedTimeText", {}).get("runs", [{}])[0].get("text")
-                                or None
-                            )
-                            upload_timestamp = parse_time_since_published(time_since_published)
+        if state["listing_ok"] and state["db_ok"]:
+            self._save_scrape_state(
+                vtype, self._high_water_mark(vtype, state["order"], state["failed"]), state["failed"]
+            )
 
-                            # Parse view count text (may be like "1,234,567 views" or "1.2M views")
-                            view_text = (
-                                video.get("viewCountText", {}).get("simpleText")
-                                or video.get("viewCountText", {}).get("runs", [{}])[0].get("text", "")
-                            )
-                            views = 0
-                            if view_text:
-                                try:
-                                    # Normalize common formats:
-                                    # - "1,234 views"
-                                    # - "1.2M views"
-                                    # - "1.2K views"
-                                    # Remove trailing "views" and whitespace
-                                    vt = view_text.replace("views", "").strip().lower()
-                                    # Handle suffixes
-                                    if vt.endswith("k"):
-                                        views = int(float(vt[:-1].replace(",", "")) * 1_000)
-                                    elif vt.endswith("m"):
-                                        views = int(float(vt[:-1].replace(",", "")) * 1_000_000)
-                                    elif vt.endswith("b"):
-                                        views = int(float(vt[:-1].replace(",", "")) * 1_000_000_000)
-                                    else:
-                                        views = int(vt.replace(",", "").replace(".", ""))
-                                except Exception:
-                                    # best-effort fallback to remove non-digits
-                                    digits = re.sub(r"[^\d]", "", view_text)
-                                    try:
-                                        views = int(digits) if digits else 0
-                                    except Exception:
-                                        views = 0
-
-                        # Schedule thumbnail download if needed
-                        if thumbnail_url and not os.path.exists(thumb_path):
-                            thumbnail_tasks.append(download_img_async(thumbnail_url, thumb_path, session, thumbnail_semaphore))
-
-                        # Prepare DB record per your (new) schema
-                        video_record = {
-                            "video_id": video_id,
-                            "channel_id": self.channel_id,
-                            "video_type": vtype,
-                            "video_url": f"https://www.youtube.com/watch?v={video_id}",
-                            "title": title,
-                            "desc": description,
-                            "duration": duration_text,
-                            "duration_in_seconds": int(duration_in_seconds or 0),
-                            "thumbnail_path": thumb_path,
-                            "view_count": int(views or 0),
-                            "time_since_published": time_since_published,
-                            "upload_timestamp": int(upload_timestamp or int(datetime.now(timezone.utc).timestamp()))
-                        }
-
-                        videos_to_insert.append(video_record)
-
-                        # progress update per chunk
-                        if (idx + 1) % 10 == 0 or idx == len(videos) - 1:
-                            self.progress_updated.emit(f"[{vtype.capitalize()}] Processing: {idx+1}/{len(videos)}")
-
-                    # Wait thumbnails
-                    if thumbnail_tasks:
-                        self.progress_updated.emit(f"[{vtype.capitalize()}] Downloading {len(thumbnail_tasks)} thumbnails...")
-                        await asyncio.gather(*thumbnail_tasks, return_exceptions=True)
-                        self.progress_updated.emit(f"[{vtype.capitalize()}] ✓ All thumbnails downloaded")
-
-                    # Insert into DB (one by one to allow DB layer to handle duplicates/constraints)
-                    self.progress_updated.emit(f"[{vtype.capitalize()}] Saving {len(videos_to_insert)} videos to database...")
-                    for video_data in videos_to_insert:
-                        try:
-                            # Depending on your DB manager, you may prefer upsert.
-                            # Here we call insert() and let DatabaseManager handle uniqueness/constraints.
-                            self.db.insert("VIDEO", video_data)
-                        except Exception:
-                            logger.exception("DB insert failed for video_id=%s", video_data.get("video_id"))
-
-                    total_processed += len(videos_to_insert)
-                    self.progress_updated.emit(f"[{vtype.capitalize()}] ✓ Saved {len(videos_to_insert)} videos")
-                    self.progress_percentage.emit(min(i * 33, 95))
+        if state["listed"] == 0:
+            if self.newest_video_ids.get(vtype):
+                self.progress_updated.emit(f"No new {vtype} since last scrape.")
+            else:
+                self.progress_updated.emit(f"No {vtype} found.")
+        else:
+            self.progress_updated.emit(f"[{label}] Done: {state['saved']} videos saved")
+
+        state["done"] = True
+        self._emit_overall_progress()
+        return state["saved"]
+
+    async def _fetch_video_urls_async(self):
+        """
+        Main coroutine that scrapes all content types concurrently, each through its
+        own parse/thumbnail/DB pipeline and progress lane. The content types share one
+        aiohttp session and one network concurrency budget, so a full refresh takes
+        about as long as the slowest type.
+        """
+        try:
+            self.progress_updated.emit("Starting scrapetube scraping...")
+            self.progress_percentage.emit(0)
+            self._lanes = {}
+            self._last_percentage = 0
+
+            if self._should_stop():
+                self.progress_updated.emit("Scraping cancelled by user")
+                return
+
+            if "shorts" in self.types and self.shorts_workers != 0:
+                self.shorts_engine = ShortsMetadataEngine(
+                    workers=self.shorts_workers if self.shorts_workers > 0 else None
+                )
+
+            labels = ", ".join(vtype.capitalize() for vtype in self.types)
+            self.progress_updated.emit(f"Fetching {labels}...")
+
+            timeout = aiohttp.ClientTimeout(total=30)
+            network_semaphore = asyncio.Semaphore(self.NETWORK_CONCURRENCY)
+            # Dedicated threads for the blocking listings, so they never wait behind
+            # yt-dlp or DB jobs in the default executor
+            listing_executor = ThreadPoolExecutor(max_workers=len(self.types), thread_name_prefix="scrapetube")
+            resize_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 2, thread_name_prefix="thumbnails")
+            try:
+                async with aiohttp.ClientSession(timeout=timeout) as session:
+                    thumbnail_cache = ThumbnailCache(self.db, self.channel_id, session, network_semaphore)
+                    await asyncio.to_thread(thumbnail_cache.load)
+
+                    results = await asyncio.gather(
+                        *(self._scrape_type(vtype, ctype, session, network_semaphore,
+                                            listing_executor, thumbnail_cache, resize_executor)
+                          for vtype, ctype in self.types.items()),
+                        return_exceptions=True
+                    )
+                    await thumbnail_cache.flush()
+            finally:
+                # Join off the event loop: a listing thread may still need it to finish a put
+                for executor in (listing_executor, resize_executor):
+                    await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+            stats = thumbnail_cache.stats
+            logger.info("Thumbnails for %s: %s", self.channel_id, stats)
+            self.progress_updated.emit(
+                f"Thumbnails: {stats['downloaded']} downloaded, "
+                f"{stats['skipped'] + stats['not_modified'] + stats['shared']} already up to date"
+            )
+
+            total_processed = 0
+            for vtype, result in zip(self.types, results):
+                if isinstance(result, BaseException):
+                    logger.error("Scraping %s failed", vtype, exc_info=result)
+                    self.progress_updated.emit(f"[{vtype.capitalize()}] Scraping failed — check logs.")
+                else:
+                    total_processed += result
+
+            if self._should_stop():
+                self.progress_updated.emit("Scraping cancelled by user")
+                return
 
             self.progress_updated.emit(f"Completed scraping! Total {total_processed} videos saved.")
             self.progress_percentage.emit(100)
@@ -525,3 +1168,7 @@ class VideoWorker(QObject):
             self.progress_updated.emit("Scraping failed — check logs.")
             self.progress_percentage.emit(0)
             # Do not swallow the exception silently — finalizer will emit finished
+        finally:
+            if self.shorts_engine is not None:
+                self.shorts_engine.shutdown()
+                self.shorts_engine = None
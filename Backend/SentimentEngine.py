@@ -0,0 +1,138 @@
+# sentiment_engine.py
+import hashlib
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional
+
+from nltk.sentiment import SentimentIntensityAnalyzer
+
+from utils.Logger import logger
+
+
+def sentence_hash(sentence: str) -> str:
+    """
+    Key of a sentence in SENTIMENT_CACHE.
+    """
+    return hashlib.blake2b(sentence.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# VADER instance of a pool worker process, set up once by _init_worker
+_worker_vader: Optional[SentimentIntensityAnalyzer] = None
+
+
+def _init_worker() -> None:
+    global _worker_vader
+    _worker_vader = SentimentIntensityAnalyzer()
+
+
+def _score_chunk(sentences: List[str]) -> List[float]:
+    """
+    Runs in a pool worker: VADER compound score of each sentence.
+    """
+    return [_worker_vader.polarity_scores(s)["compound"] for s in sentences]
+
+
+class SentimentEngine:
+    """
+    Scores sentences with VADER across several processes, memoizing the results.
+
+    VADER is pure Python, so scoring on one thread is bound to a single core. Large sets
+    of new sentences are sharded across a pool of worker processes, each of which loads
+    the lexicon once. Compound scores are cached in SENTIMENT_CACHE by sentence hash, so
+    analyzing an overlapping set of videos again only scores the text not seen before.
+    The VADER lexicon must be available (see ensure_vader) before scoring.
+    """
+
+    DEFAULT_CHUNK_SIZE = 1000
+
+    # Fewer uncached sentences than this are scored in-process; starting the pool costs more
+    MIN_PARALLEL_SENTENCES = 4000
+
+    def __init__(self, db=None, workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Args:
+            db: DatabaseManager holding SENTIMENT_CACHE, or None to disable caching.
+            workers: Number of worker processes. Defaults to the CPU count, capped at 8.
+            chunk_size: Number of sentences sent to a worker per task.
+        """
+        self.db = db
+        self.workers = max(1, workers or min(8, os.cpu_count() or 2))
+        self.chunk_size = max(1, chunk_size)
+        self.stats = {"cached": 0, "scored": 0}
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._vader: Optional[SentimentIntensityAnalyzer] = None
+
+    def start(self) -> None:
+        """
+        Start the worker processes. Called lazily when a large batch needs scoring.
+        """
+        if self._pool is not None:
+            return
+        # Forking a process that runs Qt and database threads is unsafe; always spawn
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker
+        )
+        logger.info(f"Started sentiment engine with {self.workers} worker processes")
+
+    def _score_uncached(self, sentences: List[str]) -> List[float]:
+        if self.workers > 1 and len(sentences) >= self.MIN_PARALLEL_SENTENCES:
+            self.start()
+            chunks = [sentences[i:i + self.chunk_size] for i in range(0, len(sentences), self.chunk_size)]
+            try:
+                return [score for chunk in self._pool.map(_score_chunk, chunks) for score in chunk]
+            except BrokenProcessPool:
+                logger.error("Sentiment worker pool broke; scoring in-process instead")
+                self.shutdown()
+
+        if self._vader is None:
+            self._vader = SentimentIntensityAnalyzer()
+        return [self._vader.polarity_scores(s)["compound"] for s in sentences]
+
+    def scores(self, sentences: List[str]) -> List[float]:
+        """
+        VADER compound scores of the sentences, in order.
+
+        Cached scores are reused; the remaining distinct sentences are scored and cached.
+        """
+        hashes = [sentence_hash(s) for s in sentences]
+        known: Dict[str, float] = {}
+        if self.db is not None:
+            try:
+                rows = self.db.fetch_many_by_keys("SENTIMENT_CACHE", "sentence_hash", hashes, columns=["compound"])
+                known = {h: row["compound"] for h, row in rows.items()}
+            except Exception:
+                logger.exception("Error reading the sentiment cache:")
+
+        missing: Dict[str, str] = {}
+        for h, sentence in zip(hashes, sentences):
+            if h not in known and h not in missing:
+                missing[h] = sentence
+        self.stats["cached"] += len(sentences) - len(missing)
+
+        if missing:
+            fresh = dict(zip(missing, self._score_uncached(list(missing.values()))))
+            known.update(fresh)
+            self.stats["scored"] += len(fresh)
+            if self.db is not None:
+                try:
+                    self.db.upsert_many(
+                        "SENTIMENT_CACHE",
+                        [{"sentence_hash": h, "compound": score} for h, score in fresh.items()],
+                        "sentence_hash"
+                    )
+                except Exception:
+                    logger.exception("Error writing the sentiment cache:")
+
+        return [known[h] for h in hashes]
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker processes.
+        """
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
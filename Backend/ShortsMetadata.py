@@ -0,0 +1,337 @@
+# shorts_metadata.py
+import asyncio
+import itertools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional
+
+import aiohttp
+import yt_dlp
+
+from utils.Logger import logger
+
+
+SHORTS_YDL_OPTS: Dict[str, Any] = {
+    'quiet': True,
+    'no_warnings': True,
+    'extract_flat': False,
+    'socket_timeout': 10,
+    'no_check_certificate': True,
+}
+
+
+def short_metadata_from_info(video_id: str, info: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce a yt-dlp info dict to the fields the video scraper stores for a short.
+    """
+    return {
+        'video_id': str(video_id),
+        'duration': int(info.get('duration', 0)) if info.get('duration') is not None else 0,
+        'upload_date': info.get('upload_date'),  # YYYYMMDD or None
+        'description': str(info.get('description', '') or ''),
+        'view_count': int(info.get('view_count', 0) or 0),
+        'title': str(info.get('title', '') or 'Untitled'),
+    }
+
+
+# Lean path: a single innertube player request returns videoDetails and microformat,
+# which hold every field the video scraper stores, without formats or player JS
+INNERTUBE_PLAYER_URL = "https://www.youtube.com/youtubei/v1/player?prettyPrint=false"
+
+
+def _innertube_web_client() -> Dict[str, Any]:
+    """
+    WEB client of the installed yt-dlp, whose clientVersion is kept current by yt-dlp
+    releases. Falls back to a pinned version if yt-dlp moves its client table; requests
+    YouTube rejects then go through full extraction.
+    """
+    try:
+        try:
+            from yt_dlp.extractor.youtube import INNERTUBE_CLIENTS
+        except ImportError:
+            from yt_dlp.extractor.youtube._base import INNERTUBE_CLIENTS
+        web = INNERTUBE_CLIENTS["web"]
+        client = dict(web["INNERTUBE_CONTEXT"]["client"])
+        client_name = web.get("INNERTUBE_CONTEXT_CLIENT_NAME", 1)
+    except Exception:
+        logger.warning("yt-dlp innertube clients not found; using a pinned WEB client version")
+        client = {"clientName": "WEB", "clientVersion": "2.20240726.00.00"}
+        client_name = 1
+    client.update({"hl": "en", "gl": "US"})
+    return {
+        "context": {"client": client},
+        "headers": {
+            "X-YouTube-Client-Name": str(client_name),
+            "X-YouTube-Client-Version": client["clientVersion"],
+        },
+    }
+
+
+_WEB_CLIENT = _innertube_web_client()
+INNERTUBE_CONTEXT: Dict[str, Any] = _WEB_CLIENT["context"]
+INNERTUBE_HEADERS: Dict[str, str] = _WEB_CLIENT["headers"]
+
+
+def short_metadata_from_player(video_id: str, player: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Reduce an innertube player response to the fields the video scraper stores for a short.
+
+    Returns:
+        The metadata dict, or None if the response does not describe this video.
+    """
+    details = player.get("videoDetails") or {}
+    if details.get("videoId") != video_id:
+        return None
+
+    microformat = (player.get("microformat") or {}).get("playerMicroformatRenderer") or {}
+    # publishDate is either YYYY-MM-DD or a full ISO timestamp
+    published = microformat.get("publishDate") or microformat.get("uploadDate")
+    upload_date = published[:10].replace("-", "") if published else None
+
+    try:
+        duration = int(details.get("lengthSeconds") or 0)
+        view_count = int(details.get("viewCount") or 0)
+    except ValueError:
+        return None
+
+    return {
+        'video_id': str(video_id),
+        'duration': duration,
+        'upload_date': upload_date,  # YYYYMMDD or None
+        'description': str(details.get('shortDescription', '') or ''),
+        'view_count': view_count,
+        'title': str(details.get('title', '') or 'Untitled'),
+    }
+
+
+async def fetch_short_metadata_lean(video_id: str, session: aiohttp.ClientSession,
+                                    semaphore: asyncio.Semaphore) -> Optional[Dict[str, Any]]:
+    """
+    Fetch a short's metadata with one innertube player request.
+
+    Returns:
+        The metadata dict, or None if the request or parsing failed (use full extraction then).
+    """
+    payload = {"context": INNERTUBE_CONTEXT, "videoId": str(video_id)}
+    async with semaphore:
+        try:
+            async with session.post(INNERTUBE_PLAYER_URL, json=payload, headers=INNERTUBE_HEADERS,
+                                    timeout=aiohttp.ClientTimeout(total=10)) as response:
+                if response.status != 200:
+                    logger.debug(f"Lean metadata request for {video_id} returned HTTP {response.status}")
+                    return None
+                player = await response.json(content_type=None)
+        except Exception as e:
+            logger.debug(f"Lean metadata request for {video_id} failed: {e}")
+            return None
+    return short_metadata_from_player(str(video_id), player)
+
+
+async def fetch_shorts_metadata_lean(
+    video_ids: List[str],
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    progress_callback: Optional[Callable[[int, int], None]] = None
+) -> Dict[str, Dict]:
+    """
+    Fetch metadata for many shorts through the lean innertube path.
+
+    IDs that could not be resolved are left out of the result, so the caller can
+    send just those through full yt-dlp extraction. progress_callback is called
+    with (resolved, total) each time an ID is resolved.
+    """
+    results: Dict[str, Dict] = {}
+    total = len(video_ids)
+
+    async def fetch_one(video_id: str) -> None:
+        meta = await fetch_short_metadata_lean(video_id, session, semaphore)
+        if meta is None:
+            return
+        results[meta['video_id']] = meta
+        if progress_callback:
+            progress_callback(len(results), total)
+
+    await asyncio.gather(*(fetch_one(str(vid)) for vid in video_ids))
+    return results
+
+
+def extract_short_metadata(ydl: yt_dlp.YoutubeDL, video_id: str) -> Dict[str, Any]:
+    """
+    Extract the metadata of one short with an existing YoutubeDL instance.
+
+    Returns:
+        The metadata dict, or {'video_id', 'error': True, 'message'} if extraction failed.
+    """
+    try:
+        # Use the shorts URL to get short-specific extractor behavior
+        info = ydl.extract_info(f"https://www.youtube.com/shorts/{video_id}", download=False)
+        return short_metadata_from_info(video_id, info)
+    except Exception as e:
+        return {'video_id': str(video_id), 'error': True, 'message': str(e)}
+
+
+# State of a pool worker process, set up once by _init_worker
+_worker_ydl: Optional[yt_dlp.YoutubeDL] = None
+_worker_progress = None
+
+
+def _init_worker(progress_queue) -> None:
+    global _worker_ydl, _worker_progress
+    _worker_ydl = yt_dlp.YoutubeDL(SHORTS_YDL_OPTS)
+    _worker_progress = progress_queue
+
+
+def _extract_batch(token: int, video_ids: List[str]) -> List[Dict[str, Any]]:
+    """
+    Runs in a pool worker: extract a batch of shorts and report each finished ID.
+    """
+    results = []
+    for video_id in video_ids:
+        results.append(extract_short_metadata(_worker_ydl, video_id))
+        _worker_progress.put((token, video_id))
+    return results
+
+
+class ShortsMetadataEngine:
+    """
+    Pool of worker processes extracting shorts metadata with yt-dlp.
+
+    yt-dlp extraction is mostly pure Python, so threads contend for the GIL; the pool
+    spreads it over several cores instead. Each worker keeps one long-lived YoutubeDL
+    instance and handles IDs in batches, and every finished ID is reported back through
+    a shared queue so progress is tracked per item.
+    """
+
+    DEFAULT_BATCH_SIZE = 5
+
+    # Seconds shutdown() waits for the progress pump to drain up to its stop sentinel
+    PUMP_JOIN_TIMEOUT = 5
+
+    def __init__(self, workers: Optional[int] = None, batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Args:
+            workers: Number of worker processes. Defaults to the CPU count, capped at 8.
+            batch_size: Number of IDs sent to a worker per task.
+        """
+        self.workers = max(1, workers or min(8, os.cpu_count() or 2))
+        self.batch_size = max(1, batch_size)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._progress = None
+        self._pump: Optional[threading.Thread] = None
+        self._listeners: Dict[int, Callable[[str], None]] = {}
+        self._tokens = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """
+        Start the worker processes. Called lazily by fetch().
+        """
+        if self._pool is not None:
+            return
+        # Forking a process that runs Qt and database threads is unsafe; always spawn
+        ctx = multiprocessing.get_context("spawn")
+        self._progress = ctx.Queue()
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(self._progress,)
+        )
+        self._pump = threading.Thread(target=self._pump_progress, args=(self._progress,),
+                                      name="shorts-progress", daemon=True)
+        self._pump.start()
+        logger.info(f"Started shorts metadata engine with {self.workers} worker processes")
+
+    def _pump_progress(self, progress_queue) -> None:
+        # Route per-item completions from the workers to the fetch() call that submitted them
+        while True:
+            item = progress_queue.get()
+            if item is None:
+                break
+            token, video_id = item
+            with self._lock:
+                listener = self._listeners.get(token)
+            if listener:
+                listener(video_id)
+
+    async def fetch(self, video_ids: List[str],
+                    progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, Dict]:
+        """
+        Extract metadata for the given shorts in the worker pool.
+
+        Args:
+            video_ids: IDs of the shorts.
+            progress_callback: Called on the event loop with (completed, total) per finished ID.
+
+        Returns:
+            Metadata dicts keyed by video_id; failed IDs carry 'error': True.
+        """
+        if not video_ids:
+            return {}
+        self.start()
+
+        loop = asyncio.get_running_loop()
+        total = len(video_ids)
+        completed = 0
+
+        def report() -> None:
+            nonlocal completed
+            completed += 1
+            if progress_callback and completed <= total:
+                progress_callback(completed, total)
+
+        def listener(_video_id: str) -> None:
+            try:
+                loop.call_soon_threadsafe(report)
+            except RuntimeError:
+                # The loop closed while this completion was being routed
+                pass
+
+        token = next(self._tokens)
+        with self._lock:
+            self._listeners[token] = listener
+
+        results: Dict[str, Dict] = {}
+        try:
+            batches = [video_ids[i:i + self.batch_size] for i in range(0, total, self.batch_size)]
+            futures = [loop.run_in_executor(self._pool, _extract_batch, token, batch) for batch in batches]
+            for batch_result in await asyncio.gather(*futures, return_exceptions=True):
+                if isinstance(batch_result, BrokenProcessPool):
+                    logger.error("Shorts metadata worker pool broke; restarting it on next use")
+                    self.shutdown()
+                    continue
+                if isinstance(batch_result, BaseException):
+                    logger.error("Shorts metadata batch failed", exc_info=batch_result)
+                    continue
+                for item in batch_result:
+                    if item.get('error'):
+                        logger.error(f"Failed to fetch metadata for short video: {item['video_id']} "
+                                     f"({item.get('message', '')})")
+                    results[item['video_id']] = item
+        finally:
+            with self._lock:
+                self._listeners.pop(token, None)
+
+        return results
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker processes, dropping batches that have not started yet, and wait
+        for the progress pump so it never reports to an event loop that has been closed.
+        """
+        pool, progress, pump = self._pool, self._progress, self._pump
+        self._pool = self._progress = self._pump = None
+        if pool is None:
+            return
+        pool.shutdown(wait=False, cancel_futures=True)
+        try:
+            progress.put(None)
+        except Exception:
+            return
+        if pump is not None and pump is not threading.current_thread():
+            pump.join(self.PUMP_JOIN_TIMEOUT)
+            if pump.is_alive():
+                logger.warning("Shorts progress pump did not stop in time")
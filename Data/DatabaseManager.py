@@ -1,25 +1,260 @@
 import sqlite3
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple, Optional, Union
+from concurrent.futures import Future
 import json
 import platform
 import os
+import queue
 import sys
 import threading
+import time
+
+from utils.Logger import logger
+
+
+# Ordered schema migrations applied on top of schema.sql.
+# Each entry is (version, [statements]); existing databases are brought up to
+# the latest version on startup and the applied version is stored in SCHEMA_VERSION.
+SCHEMA_MIGRATIONS: List[Tuple[int, List[str]]] = [
+    (1, [
+        # VideoPage filters on channel_id (and optionally video_type) and sorts by one of these columns
+        "CREATE INDEX IF NOT EXISTS idx_video_channel_duration ON VIDEO(channel_id, duration_in_seconds)",
+        "CREATE INDEX IF NOT EXISTS idx_video_channel_uploaded ON VIDEO(channel_id, upload_timestamp)",
+        "CREATE INDEX IF NOT EXISTS idx_video_channel_views ON VIDEO(channel_id, view_count)",
+        "CREATE INDEX IF NOT EXISTS idx_video_channel_type_duration ON VIDEO(channel_id, video_type, duration_in_seconds)",
+        "CREATE INDEX IF NOT EXISTS idx_video_channel_type_uploaded ON VIDEO(channel_id, video_type, upload_timestamp)",
+        "CREATE INDEX IF NOT EXISTS idx_video_channel_type_views ON VIDEO(channel_id, video_type, view_count)",
+    ]),
+    (2, [
+        # One row per comment or reply; parent_id is NULL for top-level comments
+        """CREATE TABLE IF NOT EXISTS COMMENT_ROW (
+            comment_id TEXT PRIMARY KEY,
+            video_id TEXT NOT NULL,
+            channel_id TEXT,
+            parent_id TEXT,
+            author TEXT,
+            author_id TEXT,
+            text TEXT,
+            like_count INTEGER,
+            is_favorited INTEGER,
+            timestamp INTEGER,
+            FOREIGN KEY(video_id) REFERENCES VIDEO(video_id)
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_comment_row_video_time ON COMMENT_ROW(video_id, timestamp)",
+        "CREATE INDEX IF NOT EXISTS idx_comment_row_video_likes ON COMMENT_ROW(video_id, like_count)",
+        "CREATE INDEX IF NOT EXISTS idx_comment_row_parent ON COMMENT_ROW(parent_id)",
+    ]),
+    (3, [
+        # One TRANSCRIPT row per (video, language), manual or auto-generated as recorded in
+        # is_generated; its timed segments live in TRANSCRIPT_SEGMENT
+        "ALTER TABLE TRANSCRIPT ADD COLUMN is_generated INTEGER",
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_transcript_video_language ON TRANSCRIPT(video_id, language)",
+        """CREATE TABLE IF NOT EXISTS TRANSCRIPT_SEGMENT (
+            transcript_id INTEGER NOT NULL,
+            video_id TEXT NOT NULL,
+            seq INTEGER NOT NULL,
+            start REAL,
+            duration REAL,
+            text TEXT,
+            PRIMARY KEY(transcript_id, seq),
+            FOREIGN KEY(transcript_id) REFERENCES TRANSCRIPT(transcript_id),
+            FOREIGN KEY(video_id) REFERENCES VIDEO(video_id)
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_transcript_segment_video ON TRANSCRIPT_SEGMENT(video_id)",
+    ]),
+    (4, [
+        # Full-text indexes over the stored text, kept in sync by triggers so that every
+        # save made by the scrapers (inserts, upserts, replaces) updates them incrementally
+        """CREATE VIRTUAL TABLE IF NOT EXISTS VIDEO_FTS USING fts5(
+            title, "desc", content='VIDEO', content_rowid='rowid'
+        )""",
+        """CREATE TRIGGER IF NOT EXISTS video_fts_insert AFTER INSERT ON VIDEO BEGIN
+            INSERT INTO VIDEO_FTS(rowid, title, "desc") VALUES (new.rowid, new.title, new."desc");
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS video_fts_delete AFTER DELETE ON VIDEO BEGIN
+            INSERT INTO VIDEO_FTS(VIDEO_FTS, rowid, title, "desc") VALUES ('delete', old.rowid, old.title, old."desc");
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS video_fts_update AFTER UPDATE OF title, "desc" ON VIDEO BEGIN
+            INSERT INTO VIDEO_FTS(VIDEO_FTS, rowid, title, "desc") VALUES ('delete', old.rowid, old.title, old."desc");
+            INSERT INTO VIDEO_FTS(rowid, title, "desc") VALUES (new.rowid, new.title, new."desc");
+        END""",
+        "INSERT INTO VIDEO_FTS(VIDEO_FTS) VALUES ('rebuild')",
+
+        """CREATE VIRTUAL TABLE IF NOT EXISTS COMMENT_FTS USING fts5(
+            text, content='COMMENT_ROW', content_rowid='rowid'
+        )""",
+        """CREATE TRIGGER IF NOT EXISTS comment_fts_insert AFTER INSERT ON COMMENT_ROW BEGIN
+            INSERT INTO COMMENT_FTS(rowid, text) VALUES (new.rowid, new.text);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS comment_fts_delete AFTER DELETE ON COMMENT_ROW BEGIN
+            INSERT INTO COMMENT_FTS(COMMENT_FTS, rowid, text) VALUES ('delete', old.rowid, old.text);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS comment_fts_update AFTER UPDATE OF text ON COMMENT_ROW BEGIN
+            INSERT INTO COMMENT_FTS(COMMENT_FTS, rowid, text) VALUES ('delete', old.rowid, old.text);
+            INSERT INTO COMMENT_FTS(rowid, text) VALUES (new.rowid, new.text);
+        END""",
+        "INSERT INTO COMMENT_FTS(COMMENT_FTS) VALUES ('rebuild')",
+
+        """CREATE VIRTUAL TABLE IF NOT EXISTS TRANSCRIPT_FTS USING fts5(
+            text, content='TRANSCRIPT_SEGMENT', content_rowid='rowid'
+        )""",
+        """CREATE TRIGGER IF NOT EXISTS transcript_fts_insert AFTER INSERT ON TRANSCRIPT_SEGMENT BEGIN
+            INSERT INTO TRANSCRIPT_FTS(rowid, text) VALUES (new.rowid, new.text);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS transcript_fts_delete AFTER DELETE ON TRANSCRIPT_SEGMENT BEGIN
+            INSERT INTO TRANSCRIPT_FTS(TRANSCRIPT_FTS, rowid, text) VALUES ('delete', old.rowid, old.text);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS transcript_fts_update AFTER UPDATE OF text ON TRANSCRIPT_SEGMENT BEGIN
+            INSERT INTO TRANSCRIPT_FTS(TRANSCRIPT_FTS, rowid, text) VALUES ('delete', old.rowid, old.text);
+            INSERT INTO TRANSCRIPT_FTS(rowid, text) VALUES (new.rowid, new.text);
+        END""",
+        "INSERT INTO TRANSCRIPT_FTS(TRANSCRIPT_FTS) VALUES ('rebuild')",
+    ]),
+    (5, [
+        # High-water mark of the last completed scrape per channel and content type
+        """CREATE TABLE IF NOT EXISTS SCRAPE_STATE (
+            channel_id TEXT NOT NULL,
+            content_type TEXT NOT NULL,
+            last_video_id TEXT,
+            last_scraped_at INTEGER,
+            PRIMARY KEY(channel_id, content_type),
+            FOREIGN KEY(channel_id) REFERENCES CHANNEL(channel_id)
+        )""",
+    ]),
+    (6, [
+        # Validators of every downloaded thumbnail, used to skip or revalidate on re-scrape
+        """CREATE TABLE IF NOT EXISTS THUMBNAIL_CACHE (
+            file_path TEXT PRIMARY KEY,
+            channel_id TEXT,
+            url TEXT,
+            etag TEXT,
+            last_modified TEXT,
+            size INTEGER,
+            checked_at INTEGER
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_thumbnail_cache_channel ON THUMBNAIL_CACHE(channel_id)",
+    ]),
+    (7, [
+        # Transcript cache: when each transcript was downloaded, and why none was available
+        # (rows with remarks and no segments cache a missing transcript)
+        "ALTER TABLE TRANSCRIPT ADD COLUMN fetched_at INTEGER",
+        "ALTER TABLE TRANSCRIPT ADD COLUMN remarks TEXT",
+    ]),
+    (8, [
+        # Memoized VADER compound scores, keyed by a hash of the sentence text
+        """CREATE TABLE IF NOT EXISTS SENTIMENT_CACHE (
+            sentence_hash TEXT PRIMARY KEY,
+            compound REAL NOT NULL
+        )""",
+    ]),
+    (9, [
+        # Index channel_id in the full-text tables so a channel search is restricted inside
+        # the MATCH instead of joining every hit; bm25 ignores it (weight 0)
+        "ALTER TABLE TRANSCRIPT_SEGMENT ADD COLUMN channel_id TEXT",
+        """UPDATE TRANSCRIPT_SEGMENT SET channel_id =
+            (SELECT channel_id FROM VIDEO WHERE VIDEO.video_id = TRANSCRIPT_SEGMENT.video_id)""",
+        """UPDATE COMMENT_ROW SET channel_id =
+            (SELECT channel_id FROM VIDEO WHERE VIDEO.video_id = COMMENT_ROW.video_id)
+            WHERE channel_id IS NULL""",
+
+        "DROP TRIGGER IF EXISTS video_fts_insert",
+        "DROP TRIGGER IF EXISTS video_fts_delete",
+        "DROP TRIGGER IF EXISTS video_fts_update",
+        "DROP TABLE IF EXISTS VIDEO_FTS",
+        """CREATE VIRTUAL TABLE VIDEO_FTS USING fts5(
+            title, "desc", channel_id, content='VIDEO', content_rowid='rowid'
+        )""",
+        "INSERT INTO VIDEO_FTS(VIDEO_FTS, rank) VALUES ('rank', 'bm25(1.0, 1.0, 0.0)')",
+        """CREATE TRIGGER video_fts_insert AFTER INSERT ON VIDEO BEGIN
+            INSERT INTO VIDEO_FTS(rowid, title, "desc", channel_id) VALUES (new.rowid, new.title, new."desc", new.channel_id);
+        END""",
+        """CREATE TRIGGER video_fts_delete AFTER DELETE ON VIDEO BEGIN
+            INSERT INTO VIDEO_FTS(VIDEO_FTS, rowid, title, "desc", channel_id) VALUES ('delete', old.rowid, old.title, old."desc", old.channel_id);
+        END""",
+        """CREATE TRIGGER video_fts_update AFTER UPDATE OF title, "desc", channel_id ON VIDEO BEGIN
+            INSERT INTO VIDEO_FTS(VIDEO_FTS, rowid, title, "desc", channel_id) VALUES ('delete', old.rowid, old.title, old."desc", old.channel_id);
+            INSERT INTO VIDEO_FTS(rowid, title, "desc", channel_id) VALUES (new.rowid, new.title, new."desc", new.channel_id);
+        END""",
+        "INSERT INTO VIDEO_FTS(VIDEO_FTS) VALUES ('rebuild')",
+
+        "DROP TRIGGER IF EXISTS comment_fts_insert",
+        "DROP TRIGGER IF EXISTS comment_fts_delete",
+        "DROP TRIGGER IF EXISTS comment_fts_update",
+        "DROP TABLE IF EXISTS COMMENT_FTS",
+        """CREATE VIRTUAL TABLE COMMENT_FTS USING fts5(
+            text, channel_id, content='COMMENT_ROW', content_rowid='rowid'
+        )""",
+        "INSERT INTO COMMENT_FTS(COMMENT_FTS, rank) VALUES ('rank', 'bm25(1.0, 0.0)')",
+        """CREATE TRIGGER comment_fts_insert AFTER INSERT ON COMMENT_ROW BEGIN
+            INSERT INTO COMMENT_FTS(rowid, text, channel_id) VALUES (new.rowid, new.text, new.channel_id);
+        END""",
+        """CREATE TRIGGER comment_fts_delete AFTER DELETE ON COMMENT_ROW BEGIN
+            INSERT INTO COMMENT_FTS(COMMENT_FTS, rowid, text, channel_id) VALUES ('delete', old.rowid, old.text, old.channel_id);
+        END""",
+        """CREATE TRIGGER comment_fts_update AFTER UPDATE OF text, channel_id ON COMMENT_ROW BEGIN
+            INSERT INTO COMMENT_FTS(COMMENT_FTS, rowid, text, channel_id) VALUES ('delete', old.rowid, old.text, old.channel_id);
+            INSERT INTO COMMENT_FTS(rowid, text, channel_id) VALUES (new.rowid, new.text, new.channel_id);
+        END""",
+        "INSERT INTO COMMENT_FTS(COMMENT_FTS) VALUES ('rebuild')",
+
+        "DROP TRIGGER IF EXISTS transcript_fts_insert",
+        "DROP TRIGGER IF EXISTS transcript_fts_delete",
+        "DROP TRIGGER IF EXISTS transcript_fts_update",
+        "DROP TABLE IF EXISTS TRANSCRIPT_FTS",
+        """CREATE VIRTUAL TABLE TRANSCRIPT_FTS USING fts5(
+            text, channel_id, content='TRANSCRIPT_SEGMENT', content_rowid='rowid'
+        )""",
+        "INSERT INTO TRANSCRIPT_FTS(TRANSCRIPT_FTS, rank) VALUES ('rank', 'bm25(1.0, 0.0)')",
+        """CREATE TRIGGER transcript_fts_insert AFTER INSERT ON TRANSCRIPT_SEGMENT BEGIN
+            INSERT INTO TRANSCRIPT_FTS(rowid, text, channel_id) VALUES (new.rowid, new.text, new.channel_id);
+        END""",
+        """CREATE TRIGGER transcript_fts_delete AFTER DELETE ON TRANSCRIPT_SEGMENT BEGIN
+            INSERT INTO TRANSCRIPT_FTS(TRANSCRIPT_FTS, rowid, text, channel_id) VALUES ('delete', old.rowid, old.text, old.channel_id);
+        END""",
+        """CREATE TRIGGER transcript_fts_update AFTER UPDATE OF text, channel_id ON TRANSCRIPT_SEGMENT BEGIN
+            INSERT INTO TRANSCRIPT_FTS(TRANSCRIPT_FTS, rowid, text, channel_id) VALUES ('delete', old.rowid, old.text, old.channel_id);
+            INSERT INTO TRANSCRIPT_FTS(rowid, text, channel_id) VALUES (new.rowid, new.text, new.channel_id);
+        END""",
+        "INSERT INTO TRANSCRIPT_FTS(TRANSCRIPT_FTS) VALUES ('rebuild')",
+    ]),
+    (10, [
+        # JSON list of videos that failed to parse or to get their shorts metadata; the
+        # high-water mark stays behind them and the next incremental scrape retries them
+        "ALTER TABLE SCRAPE_STATE ADD COLUMN pending_video_ids TEXT",
+    ]),
+]
+
 
 class DatabaseManager:
     """
     A class to manage SQLite database for YTAnalysis.
+
+    The database runs in WAL mode. Every thread reads through its own connection,
+    while all writes are serialized through a single writer thread so that scrape
+    workers never contend for the write lock and readers never wait on a commit.
     """
 
-    def __init__(self, base_dir: Optional[str] = None, db_name: str = "data.db", schema_path: str = "schema.sql"):
+    # Connection tuning
+    BUSY_TIMEOUT_SECONDS = 30
+    CACHE_SIZE_KIB = 64 * 1024          # 64 MiB page cache per connection
+    MMAP_SIZE_BYTES = 256 * 1024 * 1024  # 256 MiB memory-mapped I/O
+    SEARCH_CANDIDATES_PER_RESULT = 20   # best matches per source considered for each search result
+
+    def __init__(self, base_dir: Optional[str] = None, db_name: str = "data.db", schema_path: str = "schema.sql",
+                 explain_queries: Optional[bool] = None):
         """
         Initialize DatabaseManager instance.
 
         :param base_dir: The base directory to store database files.
         :param db_name: The name of the SQLite database file.
         :param schema_path: The path to the schema.sql file.
+        :param explain_queries: Log EXPLAIN QUERY PLAN for every fetch. Defaults to
+            the STATUBE_EXPLAIN_QUERIES environment variable.
         """
+        if explain_queries is None:
+            explain_queries = os.environ.get("STATUBE_EXPLAIN_QUERIES", "") not in ("", "0")
+        self.explain_queries = bool(explain_queries)
 
         # Determine OS and set appropriate AppData directory
         system = platform.system()
@@ -50,7 +285,7 @@ class DatabaseManager:
         ]:
             folder.mkdir(parents=True, exist_ok=True)
 
-        # Thread-local storage
+        # Thread-local storage for reader connections
         self._local = threading.local()
         self.db_path = self.db_dir / db_name
 
@@ -64,20 +299,116 @@ class DatabaseManager:
             base_dir = os.path.dirname(os.path.abspath(__file__))
         self.schema_path = Path(os.path.join(base_dir, schema_path))
 
-        # Create tables using schema.sql
+        # Start the single writer thread, then create tables using schema.sql
+        self._write_queue: "queue.Queue[Optional[Tuple[Callable, Future]]]" = queue.Queue()
+        self._writer_conn: Optional[sqlite3.Connection] = None
+        self._writer_ready = threading.Event()
+        # Set by shutdown(); the lock makes "not closing" and the enqueue one step
+        self._closing = False
+        self._closing_lock = threading.Lock()
+        self._writer = threading.Thread(target=self._writer_loop, name="DatabaseWriter", daemon=True)
+        self._writer.start()
+        self._writer_ready.wait()
+        if self._writer_conn is None:
+            raise sqlite3.OperationalError(f"Unable to open database: {self.db_path}")
+
         self._create_tables()
 
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a new tuned SQLite connection.
+
+        :return: SQLite database connection.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=self.BUSY_TIMEOUT_SECONDS)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA cache_size=-{self.CACHE_SIZE_KIB}")
+        conn.execute(f"PRAGMA mmap_size={self.MMAP_SIZE_BYTES}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
     def _get_connection(self) -> sqlite3.Connection:
         """
-        Get thread-specific database connection.
+        Get thread-specific database connection used for reads.
 
         :return: SQLite database connection.
         """
         if not hasattr(self._local, 'conn'):
-            self._local.conn = sqlite3.connect(self.db_path)
-            self._local.conn.row_factory = sqlite3.Row
+            self._local.conn = self._connect()
         return self._local.conn
 
+    def _writer_loop(self):
+        """
+        Run queued write jobs one at a time on the writer connection.
+
+        Each job runs inside its own transaction; a ``None`` job stops the loop and
+        any job still queued behind it fails instead of waiting forever.
+        """
+        try:
+            conn = self._connect()
+            # WAL is persistent in the database file, so setting it once here is enough
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._writer_conn = conn
+        finally:
+            self._writer_ready.set()
+
+        while True:
+            job = self._write_queue.get()
+            if job is None:
+                break
+            func, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                with conn:
+                    result = func(conn)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+        while True:
+            try:
+                job = self._write_queue.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None and job[1].set_running_or_notify_cancel():
+                job[1].set_exception(sqlite3.ProgrammingError("Database writer has been shut down"))
+
+        conn.close()
+        self._writer_conn = None
+
+    def _execute_write(self, func: Callable[[sqlite3.Connection], Any]) -> Any:
+        """
+        Run a write job on the writer thread and wait for it to commit.
+
+        :param func: A callable receiving the writer connection.
+        :return: Whatever ``func`` returns.
+        """
+        if threading.current_thread() is self._writer:
+            return func(self._writer_conn)
+
+        future: Future = Future()
+        with self._closing_lock:
+            if self._closing or not self._writer.is_alive():
+                raise sqlite3.ProgrammingError("Database writer has been shut down")
+            self._write_queue.put((func, future))
+        return future.result()
+
+    def transaction(self, func: Callable[[sqlite3.Connection], Any]) -> Any:
+        """
+        Run several writes as one transaction on the writer connection.
+
+        ``upsert_many``, ``replace_many`` and the other write helpers called inside
+        ``func`` join the transaction. Reads that must see its uncommitted rows have
+        to go through ``conn``; ``fetch`` uses a separate reader connection.
+
+        :param func: A callable receiving the writer connection.
+        :return: Whatever ``func`` returns.
+        """
+        return self._execute_write(func)
+
     def _create_tables(self):
         """
         Load schema.sql and execute it.
@@ -88,10 +419,35 @@ class DatabaseManager:
         with open(self.schema_path, "r", encoding="utf-8") as f:
             schema_sql = f.read()
 
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.executescript(schema_sql)
-        conn.commit()
+        self._execute_write(lambda conn: conn.executescript(schema_sql))
+        self._execute_write(self._apply_migrations)
+
+    def _apply_migrations(self, conn: sqlite3.Connection):
+        """
+        Apply every migration newer than the version stored in SCHEMA_VERSION.
+
+        Each migration runs in its own transaction together with its version bump.
+
+        :param conn: The writer connection.
+        """
+        current = conn.execute("SELECT MAX(version) FROM SCHEMA_VERSION").fetchone()[0] or 0
+        for version, statements in SCHEMA_MIGRATIONS:
+            if version <= current:
+                continue
+            logger.info(f"Applying database migration {version}")
+            conn.execute("BEGIN")
+            try:
+                for statement in statements:
+                    conn.execute(statement)
+                conn.execute(
+                    "INSERT INTO SCHEMA_VERSION (version, applied_at) VALUES (?, ?)",
+                    (version, int(time.time()))
+                )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            current = version
 
     # ---------- Core Helpers ----------
     def insert(self, table: str, data: Dict[str, Any]) -> int:
@@ -102,17 +458,13 @@ class DatabaseManager:
         :param data: A dictionary containing the data to insert.
         :return: The row ID of the inserted data.
         """
-        conn = self._get_connection()
         keys = ", ".join(data.keys())
         placeholders = ", ".join(["?"] * len(data))
         values = tuple(data.values())
         query = f"INSERT INTO {table} ({keys}) VALUES ({placeholders})"
-        cursor = conn.cursor()
-        
+
         try:
-            cursor.execute(query, values)
-            conn.commit()
-            return cursor.lastrowid
+            return self._execute_write(lambda conn: conn.execute(query, values).lastrowid)
         except sqlite3.IntegrityError as e:
             if "UNIQUE constraint failed" in str(e):
                 if table == "VIDEO":
@@ -131,8 +483,98 @@ class DatabaseManager:
             else:
                 raise
 
+    def upsert_many(self, table: str, rows: Iterable[Dict[str, Any]],
+                    conflict_key: Union[str, Tuple[str, ...]]) -> int:
+        """
+        Insert or update many rows in a single transaction.
+
+        Uses ``INSERT ... ON CONFLICT DO UPDATE`` through ``executemany`` so that
+        existing rows are refreshed in place instead of failing and falling back
+        to a second UPDATE round-trip. The column list is taken from the first row.
+
+        :param table: The name of the table to upsert into.
+        :param rows: An iterable of dictionaries sharing the same keys.
+        :param conflict_key: The column (or tuple of columns) with a UNIQUE/PRIMARY KEY constraint.
+        :return: The number of rows written.
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+
+        columns = list(rows[0].keys())
+        conflict_columns = [conflict_key] if isinstance(conflict_key, str) else list(conflict_key)
+        update_columns = [c for c in columns if c not in conflict_columns]
+
+        query = (
+            f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join(['?'] * len(columns))}) "
+            f"ON CONFLICT({', '.join(conflict_columns)}) "
+        )
+        if update_columns:
+            query += "DO UPDATE SET " + ", ".join(f"{c}=excluded.{c}" for c in update_columns)
+        else:
+            query += "DO NOTHING"
+
+        values = [tuple(row.get(c) for c in columns) for row in rows]
+
+        self._execute_write(lambda conn: conn.executemany(query, values))
+        return len(values)
+
+    def replace_many(self, table: str, rows: Iterable[Dict[str, Any]], where: str, params: Tuple = ()) -> int:
+        """
+        Delete the rows matching ``where`` and insert ``rows`` in a single transaction.
+
+        Readers see either the old rows or the new ones, never a partially replaced set.
+
+        :param table: The name of the table.
+        :param rows: An iterable of dictionaries sharing the same keys.
+        :param where: A WHERE clause selecting the rows to replace.
+        :param params: A tuple of parameters for the WHERE clause.
+        :return: The number of rows inserted.
+        """
+        rows = list(rows)
+        delete_query = f"DELETE FROM {table} WHERE {where}"
+        insert_query = None
+        values = []
+        if rows:
+            columns = list(rows[0].keys())
+            insert_query = (
+                f"INSERT INTO {table} ({', '.join(columns)}) "
+                f"VALUES ({', '.join(['?'] * len(columns))})"
+            )
+            values = [tuple(row.get(c) for c in columns) for row in rows]
+
+        def _replace(conn: sqlite3.Connection):
+            conn.execute(delete_query, params)
+            if insert_query:
+                conn.executemany(insert_query, values)
+
+        self._execute_write(_replace)
+        return len(values)
+
+    def _build_select(self, table: str, columns: Optional[Sequence[str]], where: Optional[str],
+                      order_by: Optional[str], params: Tuple, limit: Optional[int],
+                      offset: Optional[int]) -> Tuple[str, Tuple]:
+        """
+        Build a SELECT statement and its parameters.
+
+        :return: A tuple of (query, params).
+        """
+        query = f"SELECT {', '.join(columns) if columns else '*'} FROM {table}"
+        if where:
+            query += f" WHERE {where}"
+        if order_by:
+            query += f" ORDER BY {order_by}"
+        if limit is not None or offset is not None:
+            # SQLite only accepts OFFSET together with LIMIT; -1 means no limit
+            query += " LIMIT ? OFFSET ?"
+            params = tuple(params) + (-1 if limit is None else int(limit), int(offset or 0))
+        return query, tuple(params)
+
     def fetch(self, table: str, where: Optional[str] = None,
-              order_by: Optional[str] = None, params: Tuple = ()) -> List[Dict[str, Any]]:
+              order_by: Optional[str] = None, params: Tuple = (),
+              columns: Optional[Sequence[str]] = None, limit: Optional[int] = None,
+              offset: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Fetch data from the specified table.
 
@@ -140,19 +582,195 @@ class DatabaseManager:
         :param where: An optional WHERE clause to filter results.
         :param order_by: An optional ORDER BY column to sort results.
         :param params: A tuple of parameters to pass to the query.
+        :param columns: Optional list of columns to select instead of all columns.
+        :param limit: Optional maximum number of rows to return.
+        :param offset: Optional number of rows to skip.
         :return: A list of dictionaries containing the fetched data.
         """
         conn = self._get_connection()
-        query = f"SELECT * FROM {table}"
-        if where:
-            query += f" WHERE {where}"
-        if order_by:
-            query += f" ORDER BY {order_by}"
+        query, params = self._build_select(table, columns, where, order_by, params, limit, offset)
+
+        if self.explain_queries:
+            self._log_query_plan(conn, query, params)
 
         cursor = conn.cursor()
         cursor.execute(query, params)
         return [dict(row) for row in cursor.fetchall()]
 
+    def iter_fetch(self, table: str, where: Optional[str] = None,
+                   order_by: Optional[str] = None, params: Tuple = (),
+                   columns: Optional[Sequence[str]] = None, batch_size: int = 500) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream data from the specified table in batches.
+
+        Rows are pulled from the cursor with ``fetchmany`` so large tables can be
+        processed without holding the whole result in memory.
+
+        :param table: The name of the table to fetch from.
+        :param where: An optional WHERE clause to filter results.
+        :param order_by: An optional ORDER BY column to sort results.
+        :param params: A tuple of parameters to pass to the query.
+        :param columns: Optional list of columns to select instead of all columns.
+        :param batch_size: The number of rows per yielded batch.
+        :return: An iterator of lists of dictionaries.
+        """
+        conn = self._get_connection()
+        query, params = self._build_select(table, columns, where, order_by, params, None, None)
+
+        if self.explain_queries:
+            self._log_query_plan(conn, query, params)
+
+        cursor = conn.cursor()
+        cursor.execute(query, params)
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield [dict(row) for row in rows]
+        finally:
+            cursor.close()
+
+    def fetch_many_by_keys(self, table: str, key: str, ids: Iterable[Any],
+                           columns: Optional[Sequence[str]] = None,
+                           chunk_size: int = 500) -> Dict[Any, Dict[str, Any]]:
+        """
+        Fetch the rows matching many key values with chunked ``IN (...)`` queries.
+
+        Replaces one query per key; chunks stay well below SQLite's bound-parameter limit.
+
+        :param table: The name of the table to fetch from.
+        :param key: The column to match the ids against.
+        :param ids: The key values to look up; duplicates are ignored.
+        :param columns: Optional list of columns to select; the key column is always included.
+        :param chunk_size: The maximum number of ids per query.
+        :return: A dictionary mapping each found key value to its row; missing ids are left out.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        if columns is not None and key not in columns:
+            columns = [key, *columns]
+
+        rows: Dict[Any, Dict[str, Any]] = {}
+        for start in range(0, len(unique_ids), chunk_size):
+            chunk = unique_ids[start:start + chunk_size]
+            where = f"{key} IN ({', '.join(['?'] * len(chunk))})"
+            for row in self.fetch(table, where=where, params=tuple(chunk), columns=columns):
+                rows[row[key]] = row
+        return rows
+
+    def _log_query_plan(self, conn: sqlite3.Connection, query: str, params: Tuple) -> None:
+        """
+        Log the EXPLAIN QUERY PLAN output for a query, warning on full scans and temp sorts.
+
+        :param conn: The connection the query will run on.
+        :param query: The SQL query.
+        :param params: The query parameters.
+        """
+        try:
+            plan = [row["detail"] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", params)]
+        except sqlite3.Error:
+            logger.exception(f"EXPLAIN QUERY PLAN failed for: {query}")
+            return
+
+        # "SCAN <table>" without "USING ... INDEX" is a full table scan
+        slow = [
+            d for d in plan
+            if (d.startswith("SCAN ") and " USING " not in d) or "USE TEMP B-TREE" in d
+        ]
+        if slow:
+            logger.warning(f"Query plan for [{query}]: {' | '.join(plan)}")
+        else:
+            logger.debug(f"Query plan for [{query}]: {' | '.join(plan)}")
+
+    @staticmethod
+    def _to_fts_query(text: str) -> str:
+        """
+        Turn free text into a safe FTS5 query matching all terms, the last one as a prefix.
+
+        :param text: The user's search text.
+        :return: An FTS5 MATCH expression, or an empty string if there are no terms.
+        """
+        terms = [t.replace('"', '""') for t in text.split() if t.strip('"')]
+        if not terms:
+            return ""
+        quoted = [f'"{t}"' for t in terms]
+        quoted[-1] += "*"
+        return " ".join(quoted)
+
+    def search_text(self, text: str, channel_id: Optional[str] = None, limit: int = 50,
+                    snippet_tokens: int = 12) -> List[Dict[str, Any]]:
+        """
+        Full-text search over video titles, descriptions, comments and transcripts.
+
+        Results are grouped per video and ranked by the best BM25 score among its matches.
+        The channel restriction is part of each MATCH, and every source only contributes its
+        best SEARCH_CANDIDATES_PER_RESULT * limit matches, so large comment and transcript
+        tables are never joined or grouped in full.
+
+        :param text: The search text; every term must match, the last one as a prefix.
+        :param channel_id: Optional channel to restrict the search to.
+        :param limit: Maximum number of videos to return.
+        :param snippet_tokens: Approximate number of tokens in each snippet.
+        :return: A list of dictionaries with video_id, source ("video", "comment" or
+            "transcript"), snippet, rank (lower is better) and hits (matches among the
+            candidates considered).
+        """
+        terms = self._to_fts_query(text)
+        if not terms:
+            return []
+
+        # source -> (fts table, content table, searched columns, snippet column)
+        sources = {
+            "video": ("VIDEO_FTS", "VIDEO", 'title "desc"', -1),
+            "comment": ("COMMENT_FTS", "COMMENT_ROW", "text", 0),
+            "transcript": ("TRANSCRIPT_FTS", "TRANSCRIPT_SEGMENT", "text", 0),
+        }
+        candidates = max(1, int(limit)) * self.SEARCH_CANDIDATES_PER_RESULT
+        matches: Dict[str, str] = {}
+        parts = []
+        params: List[Any] = []
+        for source, (fts, content, columns, _) in sources.items():
+            # The terms never match the channel_id column, which only serves as a filter
+            matches[source] = f"{{{columns}}} : ({terms})"
+            match = matches[source]
+            if channel_id:
+                match += ' AND channel_id : "{}"'.format(str(channel_id).replace('"', '""'))
+
+            if content == "VIDEO":
+                join = "JOIN VIDEO v ON v.rowid = m.rowid"
+            else:
+                join = f"JOIN {content} c ON c.rowid = m.rowid JOIN VIDEO v ON v.video_id = c.video_id"
+            parts.append(
+                f"SELECT * FROM (SELECT v.video_id AS video_id, '{source}' AS source, m.rowid AS match_rowid, "
+                f"m.rank AS rank FROM (SELECT rowid, rank FROM {fts} WHERE {fts} MATCH ? ORDER BY rank LIMIT ?) m "
+                f"{join})"
+            )
+            params.extend((match, candidates))
+
+        # Rank without snippets first; SQLite returns the bare columns of the row that produced MIN(rank)
+        query = (
+            "SELECT video_id, source, match_rowid, MIN(rank) AS rank, COUNT(*) AS hits "
+            f"FROM ({' UNION ALL '.join(parts)}) "
+            "GROUP BY video_id ORDER BY rank LIMIT ?"
+        )
+        params.append(int(limit))
+
+        conn = self._get_connection()
+        if self.explain_queries:
+            self._log_query_plan(conn, query, tuple(params))
+        results = [dict(row) for row in conn.execute(query, params)]
+
+        # Only build snippets for the rows that are actually returned
+        for result in results:
+            fts, _, _, column = sources[result["source"]]
+            row = conn.execute(
+                f"SELECT snippet({fts}, {column}, '[', ']', '…', {int(snippet_tokens)}) "
+                f"FROM {fts} WHERE {fts} MATCH ? AND rowid = ?",
+                (matches[result["source"]], result.pop("match_rowid"))
+            ).fetchone()
+            result["snippet"] = row[0] if row else ""
+        return results
+
     def update(self, table: str, data: Dict[str, Any], where: str, params: Tuple) -> int:
         """
         Update data in the specified table.
@@ -163,14 +781,10 @@ class DatabaseManager:
         :param params: A tuple of parameters to pass to the query.
         :return: The number of rows affected by the update.
         """
-        conn = self._get_connection()
         set_clause = ", ".join([f"{k}=?" for k in data.keys()])
         values = tuple(data.values()) + params
         query = f"UPDATE {table} SET {set_clause} WHERE {where}"
-        cursor = conn.cursor()
-        cursor.execute(query, values)
-        conn.commit()
-        return cursor.rowcount
+        return self._execute_write(lambda conn: conn.execute(query, values).rowcount)
 
     # ---------- File Helpers ----------
     def save_json_file(self, folder: Path, filename: str, data: Dict) -> Path:
@@ -201,8 +815,22 @@ class DatabaseManager:
 
     def close(self):
         """
-        Close the database connection.
+        Close the calling thread's database connection.
         """
         if hasattr(self._local, 'conn'):
             self._local.conn.close()
             del self._local.conn
+
+    def shutdown(self):
+        """
+        Flush pending writes, stop the writer thread and close this thread's connection.
+
+        Writes submitted after this call raise ``sqlite3.ProgrammingError``.
+        """
+        with self._closing_lock:
+            stop = not self._closing and self._writer.is_alive()
+            self._closing = True
+            if stop:
+                self._write_queue.put(None)
+        self._writer.join()
+        self.close()
@@ -1,3 +1,8 @@
+CREATE TABLE IF NOT EXISTS SCHEMA_VERSION (
+    version INTEGER PRIMARY KEY,
+    applied_at INTEGER
+);
+
 CREATE TABLE IF NOT EXISTS CHANNEL (
     channel_id TEXT PRIMARY KEY,
     name TEXT,
@@ -37,3 +42,5 @@ CREATE TABLE IF NOT EXISTS COMMENT (
     file_path TEXT,
     FOREIGN KEY(video_id) REFERENCES VIDEO(video_id)
 );
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_comment_video_id ON COMMENT(video_id);
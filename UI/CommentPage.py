@@ -4,10 +4,8 @@ from PySide6.QtWidgets import (
 )
 from typing import Optional, List
 import re
-import json
-import os
 
-from Backend.ScrapeComments import CommentFetcher
+from Backend.ScrapeComments import CommentFetcher, CommentWorker
 from Backend.AnalysisWorker import AnalysisWorker
 from UI.SplashScreen import SplashScreen
 from utils.AppState import app_state
@@ -70,11 +68,21 @@ class Comment(QWidget):
         self.scroll_area.setWidget(self.scroll_content)
 
         self.comments: List[str] = []
+        self.splash = None
+        self._fetch_done = False
+        self._analysis_running = False
+        self._analysis_cancelled = False
+        self._progress = 0
 
         # Auto-run on load
         QTimer.singleShot(0, self.scrape_comments)
 
     def scrape_comments(self):
+        if self._stop_previous_run():
+            # Start over once the stopped run's pending signals have been delivered
+            QTimer.singleShot(0, self.scrape_comments)
+            return
+
         video_details = app_state.video_list
         if not video_details:
             logger.warning("CommentPage: No videos in app_state.video_list")
@@ -88,37 +96,94 @@ class Comment(QWidget):
         if isinstance(video_details, list):
             video_details = {"default": video_details}
 
-        results = self.comment_fetcher.fetch_comments(video_details)
-        if not results:
-            logger.error("CommentPage: fetch_comments returned no results")
+        self.comments = []
+        self.sentiment_image = None
+        self.wordcloud_image = None
+        self._fetch_done = False
+
+        # Analysis starts right away and takes in each video as soon as its comments are in
+        self._generate_and_display_images(streaming=True)
+
+        self.comment_thread = QThread()
+        self.comment_worker = CommentWorker(video_details, incremental=True)
+        self.comment_worker.moveToThread(self.comment_thread)
+
+        self.comment_thread.started.connect(self.comment_worker.run)
+        self.comment_worker.progress_updated.connect(lambda m: (self.splash.update_status(m) if self.splash else None))
+        # Fetching covers the sentiment stage of the analysis, which keeps pace with it
+        self.comment_worker.progress_percentage.connect(lambda p: self._set_progress(int(p * 0.7)))
+        self.comment_worker.comments_fetched.connect(self._on_comments_fetched)
+        self.comment_worker.finished.connect(self._on_fetch_finished)
+        self.comment_worker.finished.connect(self.comment_thread.quit)
+        self.comment_worker.finished.connect(self.comment_worker.deleteLater)
+        self.comment_thread.finished.connect(self.comment_thread.deleteLater)
+
+        self.comment_thread.start()
+
+    def _stop_previous_run(self) -> bool:
+        """
+        Cancel a fetch or analysis that is still running and wait for its threads to exit,
+        so a new run never replaces a live QThread.
+
+        Returns:
+            True if a previous run had to be stopped
+        """
+        threads = []
+        for name in ("comment_thread", "analysis_thread"):
+            thread = getattr(self, name, None)
+            try:
+                if thread is not None and thread.isRunning():
+                    threads.append(thread)
+            except RuntimeError:
+                # thread already finished and deleted
+                pass
+        if not threads:
+            return False
+
+        logger.info("CommentPage: Stopping the previous run before starting a new one")
+        self._analysis_cancelled = True
+        if getattr(self, "analysis_worker", None) is not None:
+            self.analysis_worker.cancel()
+        for thread in threads:
+            thread.requestInterruption()
+            # The worker's finished -> quit connection is queued to this (blocked) thread
+            thread.quit()
+            thread.wait()
+        return True
+
+    def _video_sentences(self, video_id: str):
+        # Generator: runs on the analysis thread once the worker gets to this video
+        texts = self.comment_fetcher.iter_comment_texts([video_id])
+        yield from comments_to_sentences(list(texts))
+
+    def _on_comments_fetched(self, channel_id: str, video_id: str, result: dict):
+        if self._analysis_running:
+            self.analysis_worker.add_sentences(self._video_sentences(video_id))
+
+    def _on_fetch_finished(self):
+        self._fetch_done = True
+        if self._analysis_running:
+            self.analysis_worker.close_input()
+
+    def _on_analysis_finished(self):
+        self._analysis_running = False
+        if self.sentiment_image is None and not self._analysis_cancelled:
             self.scroll_layout.addWidget(QLabel("No comments found."))
-            return
 
-        all_comment_dicts = []
-        for channel_id, vids in results.items():
-            for vid, meta in vids.items():
-                filepath = meta.get("filepath")
-                if not filepath or not os.path.exists(filepath):
-                    continue
-                try:
-                    with open(filepath, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                    if isinstance(data, list):
-                        all_comment_dicts.extend(data)
-                except Exception:
-                    logger.exception("Error reading comments file")
-
-        self.comments = comments_to_sentences(all_comment_dicts)
-        self._generate_and_display_images()
-
-    def _generate_and_display_images(self):
+    def _set_progress(self, percentage: int):
+        # Fetch and analysis both report progress; never move the bar backwards
+        if self.splash and percentage > self._progress:
+            self._progress = percentage
+            self.splash.set_progress(percentage)
+
+    def _generate_and_display_images(self, streaming: bool = False):
         # Clear previous
         for i in reversed(range(self.scroll_layout.count())):
             w = self.scroll_layout.itemAt(i).widget()
             if w:
                 w.deleteLater()
 
-        if not self.comments:
+        if not streaming and not self.comments:
             self.scroll_layout.addWidget(QLabel("No comments found."))
             return
 
@@ -131,24 +196,31 @@ class Comment(QWidget):
         logger.info(f"CommentPage: Queuing analysis sentiment {sent_w}x{sent_h}, wordcloud {wc_w}x{wc_h}")
 
         self.analysis_thread = QThread()
-        self.analysis_worker = AnalysisWorker(self.comments, sentiment_size=(sent_w, sent_h), wordcloud_size=(wc_w, wc_h), max_words=100)
+        self.analysis_worker = AnalysisWorker(self.comments, sentiment_size=(sent_w, sent_h), wordcloud_size=(wc_w, wc_h),
+                                              max_words=100, streaming=streaming)
         self.analysis_worker.moveToThread(self.analysis_thread)
+        self._analysis_running = True
+        self._analysis_cancelled = False
+        self._progress = 0
 
         # Create splash
         parent_win = self.window() if hasattr(self, "window") else None
         self.splash = SplashScreen(parent=parent_win)
-        self.splash.set_title("Analyzing comments...")
+        self.splash.set_title("Scraping and analyzing comments..." if streaming else "Analyzing comments...")
         self.splash.update_status("Preparing analysis...")
         self.splash.set_progress(0)
         self.splash.enable_runtime_mode(parent_window=parent_win, cancel_callback=self._cancel_analysis)
         self.splash.show_with_animation()
 
-        # Wire signals
+        # Wire signals; while comments are still being fetched the splash shows the fetch messages
         self.analysis_thread.started.connect(self.analysis_worker.run)
-        self.analysis_worker.progress_updated.connect(lambda m: (self.splash.update_status(m) if self.splash else None))
-        self.analysis_worker.progress_percentage.connect(lambda p: (self.splash.set_progress(p) if self.splash else None))
+        self.analysis_worker.progress_updated.connect(
+            lambda m: (self.splash.update_status(m) if self.splash and (self._fetch_done or not streaming) else None)
+        )
+        self.analysis_worker.progress_percentage.connect(self._set_progress)
         self.analysis_worker.sentiment_ready.connect(self._on_sentiment_ready)
         self.analysis_worker.wordcloud_ready.connect(self._on_wordcloud_ready)
+        self.analysis_worker.finished.connect(self._on_analysis_finished)
         self.analysis_worker.finished.connect(self.analysis_thread.quit)
         self.analysis_worker.finished.connect(self.analysis_worker.deleteLater)
         self.analysis_thread.finished.connect(self.analysis_thread.deleteLater)
@@ -159,6 +231,15 @@ class Comment(QWidget):
 
     # helper cancel method
     def _cancel_analysis(self):
+        self._analysis_cancelled = True
+        # stop fetching the remaining videos too
+        if hasattr(self, "comment_thread"):
+            try:
+                if self.comment_thread.isRunning():
+                    self.comment_thread.requestInterruption()
+            except RuntimeError:
+                # thread already finished and deleted
+                pass
         if hasattr(self, "analysis_worker") and self.analysis_worker:
             try:
                 self.analysis_worker.cancel()
@@ -184,10 +265,11 @@ class Comment(QWidget):
         self.sentiment_image = qimage
         # show immediately (title)
         channel_name = next(iter(app_state.video_list.keys()), "unknown")
-        self.scroll_layout.addWidget(QLabel("<b>Sentiment Analysis</b>"))
+        # The word cloud may arrive first; keep the sentiment summary on top
+        self.scroll_layout.insertWidget(0, QLabel("<b>Sentiment Analysis</b>"))
         sent_widget = DownloadableImage(qimage, default_name=f"comment_sentiment_{channel_name}.png")
         sent_widget.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        self.scroll_layout.addWidget(sent_widget)
+        self.scroll_layout.insertWidget(1, sent_widget)
 
     def _on_wordcloud_ready(self, qimage):
         self.wordcloud_image = qimage
@@ -312,7 +312,8 @@ class Home(QWidget):
         channels_copy = self.channels.copy()
         
         for channel_id, info in channels_copy.items():
-            inf = self.db.fetch(table="CHANNEL", where="channel_id=?", params=(channel_id,))
+            inf = self.db.fetch(table="CHANNEL", where="channel_id=?", params=(channel_id,),
+                                columns=["name", "sub_count", "profile_pic"], limit=1)
             if not inf:
                 # No DB row found — use sensible defaults and warn
                 channel_name = info.get("title", "Unknown")
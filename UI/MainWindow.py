@@ -229,11 +229,41 @@ class MainWindow(QMainWindow):
 
     # ---------- Close Event ----------
 
+    def _stop_worker_threads(self):
+        """
+        Interrupt the scrape and analysis threads that are still running and wait for them,
+        so no worker is writing to the database when it shuts down.
+        """
+        # Pages only exist once finish_initialization() has run
+        for page in (getattr(self, name, None) for name in ("video_page", "transcript_page", "comment_page")):
+            if page is None:
+                continue
+            # A streaming analysis waits for input that the blocked UI thread would deliver
+            analysis_worker = getattr(page, "analysis_worker", None)
+            if analysis_worker is not None:
+                analysis_worker.cancel()
+            for name in ("worker_thread", "transcript_thread", "comment_thread", "analysis_thread"):
+                thread = getattr(page, name, None)
+                try:
+                    if thread is None or not thread.isRunning():
+                        continue
+                    logger.info(f"Stopping {type(page).__name__}.{name} before exit")
+                    thread.requestInterruption()
+                    # The worker's finished -> quit connection is queued to this (blocked) thread
+                    thread.quit()
+                    thread.wait()
+                except RuntimeError:
+                    # thread already finished and deleted
+                    pass
+
     def closeEvent(self, event):
         """
         Handle window close event (cleanup if needed).
         """
-        # If you need to close DB connections or save state, do it here.
+        self._stop_worker_threads()
+        # Flush pending writes and stop the database writer thread
+        if app_state.db is not None:
+            app_state.db.shutdown()
         super().closeEvent(event)
 
 
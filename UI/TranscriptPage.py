@@ -1,6 +1,4 @@
-import json
 import re
-import os
 from typing import Optional, List
 
 from PySide6.QtCore import Signal, QTimer, QThread
@@ -8,7 +6,7 @@ from PySide6.QtWidgets import (
     QWidget, QLabel, QVBoxLayout, QScrollArea, QSizePolicy
 )
 
-from Backend.ScrapeTranscription import TranscriptFetcher
+from Backend.ScrapeTranscription import TranscriptFetcher, TranscriptWorker
 from Backend.AnalysisWorker import AnalysisWorker
 from UI.SplashScreen import SplashScreen
 from utils.AppState import app_state
@@ -54,11 +52,21 @@ class Transcript(QWidget):
         self.scroll_area.setWidget(self.scroll_content)
 
         self.transcript_sentences: List[str] = []
+        self.splash = None
+        self._fetch_done = False
+        self._analysis_running = False
+        self._analysis_cancelled = False
+        self._progress = 0
 
         # Auto-run on load (post-init)
         QTimer.singleShot(0, self.scrape_transcript)
 
     def scrape_transcript(self):
+        if self._stop_previous_run():
+            # Start over once the stopped run's pending signals have been delivered
+            QTimer.singleShot(0, self.scrape_transcript)
+            return
+
         video_list = app_state.video_list
         if not video_list:
             logger.warning("TranscriptPage: No videos in app_state.video_list")
@@ -70,36 +78,95 @@ class Transcript(QWidget):
             self.scroll_layout.addWidget(QLabel("No transcript found."))
             return
 
-        result = self.transcript_fetcher.fetch_transcripts(video_list)
-
-        all_segments = []
-        for channel_id, video_dict in result.items():
-            if not isinstance(video_dict, dict):
-                continue
-            for video_id, meta in video_dict.items():
-                filepath = None
-                if isinstance(meta, dict):
-                    filepath = meta.get("filepath")
-                if not filepath or not os.path.exists(filepath):
-                    continue
-                try:
-                    with open(filepath, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                    if isinstance(data, list):
-                        all_segments.extend(data)
-                except Exception:
-                    logger.exception("TranscriptPage: Error reading transcript file")
-
-        self.transcript_sentences = transcript_to_sentences(all_segments)
-        self._generate_and_display_images()
-
-    def _generate_and_display_images(self):
+        self.transcript_sentences = []
+        self.sentiment_image = None
+        self.wordcloud_image = None
+        self._fetch_done = False
+
+        # Analysis starts right away and takes in each video as soon as its transcript is in
+        self._generate_and_display_images(streaming=True)
+
+        self.transcript_thread = QThread()
+        self.transcript_worker = TranscriptWorker(video_list)
+        self.transcript_worker.moveToThread(self.transcript_thread)
+
+        self.transcript_thread.started.connect(self.transcript_worker.run)
+        self.transcript_worker.progress_updated.connect(lambda m: (self.splash.update_status(m) if self.splash else None))
+        # Fetching covers the sentiment stage of the analysis, which keeps pace with it
+        self.transcript_worker.progress_percentage.connect(lambda p: self._set_progress(int(p * 0.7)))
+        self.transcript_worker.transcript_fetched.connect(self._on_transcript_fetched)
+        self.transcript_worker.finished.connect(self._on_fetch_finished)
+        self.transcript_worker.finished.connect(self.transcript_thread.quit)
+        self.transcript_worker.finished.connect(self.transcript_worker.deleteLater)
+        self.transcript_thread.finished.connect(self.transcript_thread.deleteLater)
+
+        self.transcript_thread.start()
+
+    def _stop_previous_run(self) -> bool:
+        """
+        Cancel a fetch or analysis that is still running and wait for its threads to exit,
+        so a new run never replaces a live QThread.
+
+        Returns:
+            True if a previous run had to be stopped
+        """
+        threads = []
+        for name in ("transcript_thread", "analysis_thread"):
+            thread = getattr(self, name, None)
+            try:
+                if thread is not None and thread.isRunning():
+                    threads.append(thread)
+            except RuntimeError:
+                # thread already finished and deleted
+                pass
+        if not threads:
+            return False
+
+        logger.info("TranscriptPage: Stopping the previous run before starting a new one")
+        self._analysis_cancelled = True
+        if getattr(self, "analysis_worker", None) is not None:
+            self.analysis_worker.cancel()
+        for thread in threads:
+            thread.requestInterruption()
+            # The worker's finished -> quit connection is queued to this (blocked) thread
+            thread.quit()
+            thread.wait()
+        return True
+
+    def _video_sentences(self, channel_id: str, video_id: str):
+        # Generator: runs on the analysis thread once the worker gets to this video.
+        # Picks up transcripts that only exist in older per-video JSON files
+        self.transcript_fetcher.ensure_transcripts_stored({channel_id: [video_id]})
+        segments = self.transcript_fetcher.iter_transcript_segments([video_id])
+        yield from transcript_to_sentences(list(segments))
+
+    def _on_transcript_fetched(self, channel_id: str, video_id: str, result: dict):
+        if self._analysis_running:
+            self.analysis_worker.add_sentences(self._video_sentences(channel_id, video_id))
+
+    def _on_fetch_finished(self):
+        self._fetch_done = True
+        if self._analysis_running:
+            self.analysis_worker.close_input()
+
+    def _on_analysis_finished(self):
+        self._analysis_running = False
+        if self.sentiment_image is None and not self._analysis_cancelled:
+            self.scroll_layout.addWidget(QLabel("No transcript found."))
+
+    def _set_progress(self, percentage: int):
+        # Fetch and analysis both report progress; never move the bar backwards
+        if self.splash and percentage > self._progress:
+            self._progress = percentage
+            self.splash.set_progress(percentage)
+
+    def _generate_and_display_images(self, streaming: bool = False):
         for i in reversed(range(self.scroll_layout.count())):
             w = self.scroll_layout.itemAt(i).widget()
             if w:
                 w.deleteLater()
 
-        if not self.transcript_sentences:
+        if not streaming and not self.transcript_sentences:
             self.scroll_layout.addWidget(QLabel("No transcript found."))
             return
 
@@ -112,22 +179,30 @@ class Transcript(QWidget):
         logger.info(f"TranscriptPage: Queuing analysis sentiment {sent_w}x{sent_h}, wordcloud {wc_w}x{wc_h}")
 
         self.analysis_thread = QThread()
-        self.analysis_worker = AnalysisWorker(self.transcript_sentences, sentiment_size=(sent_w, sent_h), wordcloud_size=(wc_w, wc_h), max_words=120)
+        self.analysis_worker = AnalysisWorker(self.transcript_sentences, sentiment_size=(sent_w, sent_h), wordcloud_size=(wc_w, wc_h),
+                                              max_words=120, streaming=streaming)
         self.analysis_worker.moveToThread(self.analysis_thread)
+        self._analysis_running = True
+        self._analysis_cancelled = False
+        self._progress = 0
 
         parent_win = self.window() if hasattr(self, "window") else None
         self.splash = SplashScreen(parent=parent_win)
-        self.splash.set_title("Analyzing transcripts...")
+        self.splash.set_title("Scraping and analyzing transcripts..." if streaming else "Analyzing transcripts...")
         self.splash.update_status("Preparing analysis...")
         self.splash.set_progress(0)
         self.splash.enable_runtime_mode(parent_window=parent_win, cancel_callback=self._cancel_analysis)
         self.splash.show_with_animation()
 
+        # While transcripts are still being fetched the splash shows the fetch messages
         self.analysis_thread.started.connect(self.analysis_worker.run)
-        self.analysis_worker.progress_updated.connect(lambda m: (self.splash.update_status(m) if self.splash else None))
-        self.analysis_worker.progress_percentage.connect(lambda p: (self.splash.set_progress(p) if self.splash else None))
+        self.analysis_worker.progress_updated.connect(
+            lambda m: (self.splash.update_status(m) if self.splash and (self._fetch_done or not streaming) else None)
+        )
+        self.analysis_worker.progress_percentage.connect(self._set_progress)
         self.analysis_worker.sentiment_ready.connect(self._on_sentiment_ready)
         self.analysis_worker.wordcloud_ready.connect(self._on_wordcloud_ready)
+        self.analysis_worker.finished.connect(self._on_analysis_finished)
         self.analysis_worker.finished.connect(self.analysis_thread.quit)
         self.analysis_worker.finished.connect(self.analysis_worker.deleteLater)
         self.analysis_thread.finished.connect(self.analysis_thread.deleteLater)
@@ -136,6 +211,15 @@ class Transcript(QWidget):
         self.analysis_thread.start()
 
     def _cancel_analysis(self):
+        self._analysis_cancelled = True
+        # stop fetching the remaining videos too
+        if hasattr(self, "transcript_thread"):
+            try:
+                if self.transcript_thread.isRunning():
+                    self.transcript_thread.requestInterruption()
+            except RuntimeError:
+                # thread already finished and deleted
+                pass
         if hasattr(self, "analysis_worker") and self.analysis_worker:
             try:
                 self.analysis_worker.cancel()
@@ -158,10 +242,11 @@ class Transcript(QWidget):
     def _on_sentiment_ready(self, qimage):
         self.sentiment_image = qimage
         channel_name = next(iter(app_state.video_list.keys()), "unknown")
-        self.scroll_layout.addWidget(QLabel("<b>Sentiment Analysis</b>"))
+        # The word cloud may arrive first; keep the sentiment summary on top
+        self.scroll_layout.insertWidget(0, QLabel("<b>Sentiment Analysis</b>"))
         sent_widget = DownloadableImage(qimage, default_name=f"transcript_sentiment_{channel_name}.png")
         sent_widget.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        self.scroll_layout.addWidget(sent_widget)
+        self.scroll_layout.insertWidget(1, sent_widget)
 
     def _on_wordcloud_ready(self, qimage):
         self.wordcloud_image = qimage
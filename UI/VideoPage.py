@@ -1,20 +1,38 @@
 from PySide6.QtWidgets import (QWidget, QLabel, QGridLayout, QStyle, QPushButton,
                                QListView, QVBoxLayout, QAbstractItemView, QStyledItemDelegate,
-                               QCheckBox, QHBoxLayout, QFrame, QComboBox, QLayout, QStyleOptionViewItem)
+                               QCheckBox, QHBoxLayout, QFrame, QComboBox, QLayout, QStyleOptionViewItem,
+                               QLineEdit, QSpinBox)
 from PySide6.QtCore import (QThread, Qt, QSize, QRect, Property, QItemSelectionModel,
                             QItemSelection, QTimer, Signal, QModelIndex)
-from PySide6.QtGui import (QStandardItemModel, QStandardItem, QPixmap, QPainter, QFont, QColor, QIcon,)
-from typing import Optional, Dict, List, Any
+from PySide6.QtGui import (QStandardItemModel, QStandardItem, QPixmap, QPixmapCache, QPainter, QFont, QColor, QIcon,)
+from typing import Optional, Dict, List, Any, Tuple
 import os
 
 from Data.DatabaseManager import DatabaseManager
-from Backend.ScrapeVideo import VideoWorker
+from Backend.ScrapeVideo import VideoWorker, THUMBNAIL_SIZES, thumbnail_variant_path
 from Backend.ScrapeTranscription import TranscriptWorker
 from Backend.ScrapeComments import CommentWorker
 from UI.SplashScreen import SplashScreen, BlurOverlay
 from utils.AppState import app_state
 from utils.Logger import logger
 
+# Sort combo option -> (VIDEO column, descending)
+SORT_OPTIONS: Dict[str, Tuple[str, bool]] = {
+    "Longest": ("duration_in_seconds", True),
+    "Shortest": ("duration_in_seconds", False),
+    "Newest": ("upload_timestamp", True),
+    "Oldest": ("upload_timestamp", False),
+    "Most Viewed": ("view_count", True),
+    "Least Viewed": ("view_count", False),
+}
+
+# Columns loaded for the video list, including every sortable column
+VIDEO_LIST_COLUMNS: List[str] = ["video_id", "title", "duration", "view_count", "video_type",
+                                 "time_since_published", "duration_in_seconds", "upload_timestamp"]
+
+# Item role holding the value of the active sort column, used to place streamed rows
+SORT_KEY_ROLE = Qt.UserRole + 1
+
 def clear_layout(layout: QLayout) -> None:
     """
     Recursively clears items from the given layout.
@@ -57,7 +75,7 @@ class YouTubeVideoItem:
     Represents a YouTube video or short item.
 
     Attributes:
-        thumbnail (QPixmap): The video thumbnail.
+        thumbnail_path (str): Path of the downloaded video thumbnail.
         title (str): The video title.
         duration (str): The video duration in the format "HH:MM:SS".
         views (str): The number of views for the video.
@@ -66,13 +84,13 @@ class YouTubeVideoItem:
         video_id (str): The ID of the video.
     """
 
-    def __init__(self, thumbnail: QPixmap, title: str, duration: str, views: str,
+    def __init__(self, thumbnail_path: str, title: str, duration: str, views: str,
                  video_type: str, time_since_published: str = "", video_id: str = "") -> None:
         """
         Initializes the YouTube video item.
 
         Parameters:
-            thumbnail (QPixmap): The video thumbnail.
+            thumbnail_path (str): Path of the downloaded video thumbnail.
             title (str): The video title.
             duration (str): The video duration in the format "HH:MM:SS".
             views (str): The number of views for the video.
@@ -80,7 +98,7 @@ class YouTubeVideoItem:
             time_since_published (str): The time since the video was published.
             video_id (str): The ID of the video.
         """
-        self.thumbnail = thumbnail
+        self.thumbnail_path = thumbnail_path
         self.title = title
         self.duration = duration
         self.views = views
@@ -94,8 +112,46 @@ class YouTubeVideoDelegate(QStyledItemDelegate):
     Custom delegate for drawing YouTube videos and Shorts with grid and list layouts.
 
     This delegate is responsible for painting and providing size hints for the YouTube video items.
+    Thumbnails are painted from the pre-resized grid/list variants, so no scaling happens on repaint.
     """
 
+    # Room for a few thousand pre-resized thumbnails
+    PIXMAP_CACHE_KIB = 256 * 1024
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), self.PIXMAP_CACHE_KIB))
+
+    @staticmethod
+    def thumbnail(thumb_path: str, variant: str) -> QPixmap:
+        """
+        Returns the thumbnail at the exact size painted for the given variant.
+
+        Pre-resized files written by the VideoWorker are used as-is. Thumbnails downloaded
+        before those existed are scaled once here; either way the result is kept in QPixmapCache.
+
+        Parameters:
+            thumb_path (str): Path of the downloaded thumbnail.
+            variant (str): "grid" or "list".
+
+        Returns:
+            QPixmap: The thumbnail, or a null pixmap if it cannot be loaded.
+        """
+        key = f"{variant}:{thumb_path}"
+        cached: Optional[QPixmap] = QPixmapCache.find(key)
+        if cached is not None:
+            return cached
+
+        pixmap = QPixmap(thumbnail_variant_path(thumb_path, variant))
+        if pixmap.isNull():
+            source = QPixmap(thumb_path)
+            if source.isNull():
+                return pixmap
+            width, height = THUMBNAIL_SIZES[variant]
+            pixmap = source.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+
     def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
         """
         Paints the YouTube video item.
@@ -118,7 +174,6 @@ class YouTubeVideoDelegate(QStyledItemDelegate):
         view: QListView = option.widget
         is_list_mode: bool = view.viewMode() == QListView.ListMode
 
-        thumbnail: QPixmap = data.thumbnail
         title: str = data.title
         duration: str = data.duration
         views: str = data.views
@@ -126,12 +181,11 @@ class YouTubeVideoDelegate(QStyledItemDelegate):
 
         # === LIST MODE ===
         if is_list_mode:
-            target_height: int = 100
-            target_width: int = 178
+            target_width, target_height = THUMBNAIL_SIZES["list"]
 
-            if isinstance(thumbnail, QPixmap) and not thumbnail.isNull():
-                scaled: QPixmap = thumbnail.scaled(target_width, target_height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                painter.drawPixmap(option.rect.x() + 12, option.rect.y() + 10, scaled)
+            thumbnail: QPixmap = self.thumbnail(data.thumbnail_path, "list")
+            if not thumbnail.isNull():
+                painter.drawPixmap(option.rect.x() + 12, option.rect.y() + 10, thumbnail)
 
             # Text
             text_x: int = option.rect.x() + target_width + 24
@@ -147,15 +201,14 @@ class YouTubeVideoDelegate(QStyledItemDelegate):
 
         # === GRID MODE ===
         else:
-            target_height: int = 144
-            target_width: int = 256
+            target_width, target_height = THUMBNAIL_SIZES["grid"]
             thumb_x: int = option.rect.x() + (option.rect.width() - target_width) // 2
             thumb_y: int = option.rect.y() + 8
             thumb_rect: QRect = QRect(thumb_x, thumb_y, target_width, target_height)
 
-            if isinstance(thumbnail, QPixmap) and not thumbnail.isNull():
-                scaled: QPixmap = thumbnail.scaled(target_width, target_height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                painter.drawPixmap(thumb_x, thumb_y, scaled)
+            thumbnail: QPixmap = self.thumbnail(data.thumbnail_path, "grid")
+            if not thumbnail.isNull():
+                painter.drawPixmap(thumb_x, thumb_y, thumbnail)
 
             # Duration overlay
             if duration:
@@ -406,6 +459,32 @@ class Video(QWidget):
         bottom_layout.addWidget(self.add_to_list_button, stretch=2)
         bottom_layout.addWidget(self.scrape_comments_button)
 
+        # Comment limits for very large videos; 0 means no limit
+        self.max_comments_spin: QSpinBox = QSpinBox()
+        self.max_comments_spin.setRange(0, 1_000_000)
+        self.max_comments_spin.setSingleStep(500)
+        self.max_comments_spin.setPrefix("Comments: ")
+        self.max_comments_spin.setSpecialValueText("Comments: All")
+        self.max_comments_spin.setToolTip("Maximum top-level comments per video (0 = all)")
+        self.max_replies_spin: QSpinBox = QSpinBox()
+        self.max_replies_spin.setRange(0, 100_000)
+        self.max_replies_spin.setSingleStep(10)
+        self.max_replies_spin.setPrefix("Replies: ")
+        self.max_replies_spin.setSpecialValueText("Replies: All")
+        self.max_replies_spin.setToolTip("Maximum replies per comment thread (0 = all)")
+        self.comment_budget_spin: QSpinBox = QSpinBox()
+        self.comment_budget_spin.setRange(0, 3600)
+        self.comment_budget_spin.setSingleStep(30)
+        self.comment_budget_spin.setPrefix("Time: ")
+        self.comment_budget_spin.setSuffix(" s")
+        self.comment_budget_spin.setSpecialValueText("Time: No limit")
+        self.comment_budget_spin.setToolTip(
+            "Seconds to spend on each video before keeping the comments fetched so far (0 = no limit)"
+        )
+        bottom_layout.addWidget(self.max_comments_spin)
+        bottom_layout.addWidget(self.max_replies_spin)
+        bottom_layout.addWidget(self.comment_budget_spin)
+
         self.filter_combo: QComboBox = QComboBox()
         self.filter_combo.addItems(["All", "Live", "Shorts", "Videos"])
         self.sort_combo: QComboBox = QComboBox()
@@ -415,10 +494,27 @@ class Video(QWidget):
 
         self.scrape_shorts_checkbox: QCheckBox = QCheckBox("Scrape Shorts")
         self.scrape_shorts_checkbox.setChecked(False)
+        self.full_refresh_checkbox: QCheckBox = QCheckBox("Full Refresh")
+        self.full_refresh_checkbox.setToolTip(
+            "Re-list the channel's entire history, re-download all comments instead of only new ones "
+            "and re-download transcripts that are already cached"
+        )
+        self.full_refresh_checkbox.setChecked(False)
+
+        scrape_options_layout: QHBoxLayout = QHBoxLayout()
+        scrape_options_layout.addWidget(self.full_refresh_checkbox)
+        scrape_options_layout.addWidget(self.scrape_shorts_checkbox)
+
+        self.search_box: QLineEdit = QLineEdit()
+        self.search_box.setPlaceholderText("Search titles, comments, transcripts...")
+        self.search_box.setClearButtonEnabled(True)
+        self.search_box.returnPressed.connect(lambda: self.search_videos(self.search_box.text()))
+        self.search_box.textChanged.connect(lambda text: self.search_videos(text) if not text else None)
 
         filter_sort_layout: QHBoxLayout = QHBoxLayout()
         filter_sort_layout.addWidget(self.filter_combo)
         filter_sort_layout.addWidget(self.sort_combo)
+        filter_sort_layout.addWidget(self.search_box)
 
         # === Segmented Control ===
         self._create_segmented_control()
@@ -434,6 +530,7 @@ class Video(QWidget):
         self.video_view.setSelectionBehavior(QAbstractItemView.SelectRows)
 
         self.model: QStandardItemModel = QStandardItemModel()
+        self._loaded_video_ids: set = set()
         self.video_view.setModel(self.model)
         self.video_delegate: YouTubeVideoDelegate = YouTubeVideoDelegate(self.video_view)
         self.video_view.setItemDelegate(self.video_delegate)
@@ -442,7 +539,7 @@ class Video(QWidget):
         self.main_layout.addWidget(self.segment_container, 0, 0, 1, 1, alignment=Qt.AlignLeft)
         self.main_layout.addLayout(filter_sort_layout, 0, 1, 1, 1, alignment=Qt.AlignLeft)
         self.main_layout.addLayout(self.channel_label_layout, 0, 2, 1, 3, alignment=Qt.AlignCenter)
-        self.main_layout.addWidget(self.scrape_shorts_checkbox, 0, 5, 1, 1, alignment=Qt.AlignRight)
+        self.main_layout.addLayout(scrape_options_layout, 0, 5, 1, 1, alignment=Qt.AlignRight)
         self.main_layout.addWidget(self.video_view, 1, 0, 1, 6)
         self.main_layout.addLayout(bottom_layout, 2, 1, 1, 4, alignment=Qt.AlignCenter)
 
@@ -564,12 +661,17 @@ class Video(QWidget):
         self.show_splash_screen()
 
         self.worker_thread: QThread = QThread()
-        self.worker = VideoWorker(channel_id, channel_url, scrape_shorts)
+        self.worker = VideoWorker(channel_id, channel_url, scrape_shorts,
+                                  incremental=not self.full_refresh_checkbox.isChecked())
         self.worker.moveToThread(self.worker_thread)
 
+        # Show what is already stored; new batches are inserted as they are committed
+        self.refresh_view()
+
         self.worker_thread.started.connect(self.worker.run)
         self.worker.progress_updated.connect(self.update_splash_progress)
         self.worker.progress_percentage.connect(self.update_splash_percentage)
+        self.worker.videos_saved.connect(self.on_videos_saved)
         self.worker.finished.connect(self.on_worker_finished)
         self.worker.finished.connect(self.worker_thread.quit)
         self.worker.finished.connect(self.worker.deleteLater)
@@ -684,7 +786,7 @@ class Video(QWidget):
             self.splash = None
 
         logger.info("Video scraping completed!")
-        self.load_videos_from_db()
+        self.refresh_view()
 
     def on_transcript_worker_finished(self) -> None:
         """
@@ -729,33 +831,177 @@ class Video(QWidget):
             table="VIDEO",
             where=f"channel_id=? AND {where}" if where else "channel_id=?",
             order_by=order_by,
-            params=(channel_id,)
+            params=(channel_id,),
+            columns=VIDEO_LIST_COLUMNS
         )
-        self.model.clear()
+        self._populate_model(videos, channel_id)
+
+    def refresh_view(self) -> None:
+        """
+        Reloads the video list with the active search, or else the active filter and sort.
+        """
+        if self.search_box.text().strip():
+            self.search_videos(self.search_box.text())
+        else:
+            self.on_combo_changed(self.sort_combo.currentText(), self.filter_combo.currentText())
 
+    @staticmethod
+    def _view_query(sort: str, filter: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Returns the SQL WHERE and ORDER BY clauses of a filter and sort option.
+        """
+        where_clause: Optional[str] = None if filter == "All" else f"video_type = '{filter.lower()}'"
+        order_by_clause: Optional[str] = None
+        if sort in SORT_OPTIONS:
+            column, descending = SORT_OPTIONS[sort]
+            order_by_clause = f"{column} {'DESC' if descending else 'ASC'}"
+        return where_clause, order_by_clause
+
+    def _populate_model(self, videos: List[Dict[str, Any]], channel_id: str,
+                        tooltips: Optional[Dict[str, str]] = None) -> None:
+        """
+        Replaces the contents of the video list with the given video rows.
+
+        Args:
+            videos (List[Dict[str, Any]]): Video rows in display order.
+            channel_id (str): The channel the videos belong to.
+            tooltips (Optional[Dict[str, str]]): Optional tooltip text per video_id.
+        """
+        self.model.clear()
+        self._loaded_video_ids.clear()
         for video in videos:
-            thumb_path: str = os.path.join(self.db.thumbnail_dir, str(channel_id), f"{video['video_id']}.png")
-            if not os.path.exists(thumb_path):
-                logger.debug(f"Thumbnail missing for video_id={video['video_id']}")
-                continue
-            pixmap: QPixmap = QPixmap(thumb_path)
-            if pixmap.isNull():
-                continue
-
-            duration: str = self._format_duration(video.get("duration", 0))
-            views: str = self._format_views(video.get("view_count", 0))
-            title: str = video.get("title", "Untitled")
-            video_type: str = video.get("video_type", "video").lower()
-            time_since_published: str = video.get("time_since_published", "")
-            video_id: str = video.get("video_id", "")
-
-            item_data: YouTubeVideoItem = YouTubeVideoItem(pixmap, title, duration, views, video_type, time_since_published, video_id)
-            item: QStandardItem = QStandardItem()
-            item.setData(item_data, Qt.UserRole)
-            item.setEditable(False)
+            item: Optional[QStandardItem] = self._make_item(video, channel_id, tooltips)
+            if item is not None:
+                self.model.appendRow(item)
+        logger.info(f"Loaded {self.model.rowCount()} videos for channel {channel_id}")
+
+    def _make_item(self, video: Dict[str, Any], channel_id: str,
+                   tooltips: Optional[Dict[str, str]] = None) -> Optional[QStandardItem]:
+        """
+        Builds the list item of a video row and marks the video as shown.
+
+        Args:
+            video (Dict[str, Any]): The video row.
+            channel_id (str): The channel the video belongs to.
+            tooltips (Optional[Dict[str, str]]): Optional tooltip text per video_id.
+
+        Returns:
+            Optional[QStandardItem]: The item, or None if the video is already shown or has no thumbnail.
+        """
+        if video["video_id"] in self._loaded_video_ids:
+            return None
+        thumb_path: str = os.path.join(self.db.thumbnail_dir, str(channel_id), f"{video['video_id']}.png")
+        if not os.path.exists(thumb_path):
+            logger.debug(f"Thumbnail missing for video_id={video['video_id']}")
+            return None
+
+        duration: str = self._format_duration(video.get("duration", 0))
+        views: str = self._format_views(video.get("view_count", 0))
+        title: str = video.get("title", "Untitled")
+        video_type: str = video.get("video_type", "video").lower()
+        time_since_published: str = video.get("time_since_published", "")
+        video_id: str = video.get("video_id", "")
+
+        item_data: YouTubeVideoItem = YouTubeVideoItem(thumb_path, title, duration, views, video_type, time_since_published, video_id)
+        item: QStandardItem = QStandardItem()
+        item.setData(item_data, Qt.UserRole)
+        sort = SORT_OPTIONS.get(self.sort_combo.currentText())
+        if sort:
+            item.setData(video.get(sort[0]) or 0, SORT_KEY_ROLE)
+        item.setEditable(False)
+        if tooltips and video_id in tooltips:
+            item.setToolTip(tooltips[video_id])
+        self._loaded_video_ids.add(video_id)
+        return item
+
+    def _insert_sorted(self, item: QStandardItem) -> None:
+        """
+        Inserts an item at its position under the active sort, after rows with an equal key.
+        Without a sort the item is appended.
+        """
+        sort = SORT_OPTIONS.get(self.sort_combo.currentText())
+        if not sort:
             self.model.appendRow(item)
+            return
+        descending: bool = sort[1]
+        key = item.data(SORT_KEY_ROLE)
+        low, high = 0, self.model.rowCount()
+        while low < high:
+            mid = (low + high) // 2
+            other = self.model.item(mid).data(SORT_KEY_ROLE) or 0
+            if (other < key) if descending else (other > key):
+                high = mid
+            else:
+                low = mid + 1
+        self.model.insertRow(low, item)
 
-        logger.info(f"Loaded {self.model.rowCount()} videos for channel {channel_id}")
+    def on_videos_saved(self, video_ids: List[str]) -> None:
+        """
+        Called each time the VideoWorker commits a batch of videos, so that
+        new rows show up while the rest of the channel is still being scraped.
+
+        Args:
+            video_ids (List[str]): IDs of the videos in the committed batch.
+        """
+        if not video_ids or not app_state.channel_info:
+            return
+        # Search results are ranked as a whole; they are refreshed when the scrape finishes
+        if self.search_box.text().strip():
+            return
+        channel_id: str = app_state.channel_info.get("channel_id", 0)
+        where_clause, _ = self._view_query(self.sort_combo.currentText(), self.filter_combo.currentText())
+        where: str = f"channel_id=? AND video_id IN ({', '.join(['?'] * len(video_ids))})"
+        videos: List[Dict[str, Any]] = self.db.fetch(
+            table="VIDEO",
+            where=f"{where} AND {where_clause}" if where_clause else where,
+            params=(channel_id, *video_ids),
+            columns=VIDEO_LIST_COLUMNS
+        )
+        for video in videos:
+            item: Optional[QStandardItem] = self._make_item(video, channel_id)
+            if item is not None:
+                self._insert_sorted(item)
+
+    def search_videos(self, text: str) -> None:
+        """
+        Shows the videos of the selected channel whose title, description, comments
+        or transcript match the search text, best match first.
+
+        An empty search restores the normal filter/sort view.
+
+        Args:
+            text (str): The search text.
+        """
+        if not app_state.channel_info:
+            return
+
+        if not text.strip():
+            self.on_combo_changed(self.sort_combo.currentText(), self.filter_combo.currentText())
+            return
+
+        channel_id: str = app_state.channel_info.get("channel_id", 0)
+        try:
+            results: List[Dict[str, Any]] = self.db.search_text(text, channel_id=channel_id, limit=500)
+        except Exception:
+            logger.exception("Full-text search failed:")
+            results = []
+
+        order: Dict[str, int] = {r["video_id"]: i for i, r in enumerate(results)}
+        tooltips: Dict[str, str] = {r["video_id"]: f"{r['source'].capitalize()}: {r['snippet']}" for r in results}
+
+        videos: List[Dict[str, Any]] = []
+        if order:
+            ids: List[str] = list(order.keys())
+            videos = self.db.fetch(
+                table="VIDEO",
+                where=f"video_id IN ({', '.join(['?'] * len(ids))})",
+                params=tuple(ids),
+                columns=VIDEO_LIST_COLUMNS
+            )
+            videos.sort(key=lambda v: order.get(v["video_id"], len(order)))
+
+        self._populate_model(videos, channel_id, tooltips)
+        logger.info(f"Search '{text}' matched {len(videos)} videos")
 
     def _format_duration(self, duration: Optional[int]) -> str:
         """
@@ -804,21 +1050,7 @@ class Video(QWidget):
         Returns:
             None
         """
-        where_clause: Optional[str] = None if filter == "All" else f"video_type = '{filter.lower()}'"
-        order_by_clause: Optional[str] = None
-        if sort == "Longest":
-            order_by_clause = "duration_in_seconds DESC"
-        elif sort == "Shortest":
-            order_by_clause = "duration_in_seconds ASC"
-        elif sort == "Newest":
-            order_by_clause = "upload_timestamp DESC"
-        elif sort == "Oldest":
-            order_by_clause = "upload_timestamp ASC"
-        elif sort == "Most Viewed":
-            order_by_clause = "view_count DESC"
-        elif sort == "Least Viewed":
-            order_by_clause = "view_count ASC"
-
+        where_clause, order_by_clause = self._view_query(sort, filter)
         self.load_videos_from_db(where_clause, order_by_clause)
 
     def select_videos(self) -> Dict[int, List[str]]:
@@ -897,7 +1129,7 @@ class Video(QWidget):
         self.show_splash_screen(title="Scraping Transcripts...")
         
         self.transcript_thread = QThread()
-        self.transcript_worker = TranscriptWorker(video_list)
+        self.transcript_worker = TranscriptWorker(video_list, force_refresh=self.full_refresh_checkbox.isChecked())
         self.transcript_worker.moveToThread(self.transcript_thread)
         
         self.transcript_thread.started.connect(self.transcript_worker.run)
@@ -931,7 +1163,13 @@ class Video(QWidget):
         self.show_splash_screen(title="Scraping Comments...")
 
         self.comment_thread = QThread()
-        self.comment_worker = CommentWorker(video_list)
+        self.comment_worker = CommentWorker(
+            video_list,
+            incremental=not self.full_refresh_checkbox.isChecked(),
+            max_comments=self.max_comments_spin.value() or None,
+            max_replies=self.max_replies_spin.value() or None,
+            time_budget=self.comment_budget_spin.value() or None
+        )
         self.comment_worker.moveToThread(self.comment_thread)
 
         self.comment_thread.started.connect(self.comment_worker.run)
@@ -1,4 +1,5 @@
 from PySide6.QtWidgets import QApplication
+import multiprocessing
 import sys
 
 from utils.Logger import logger
@@ -30,4 +31,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Needed by the shorts metadata worker processes in frozen (Nuitka) builds
+    multiprocessing.freeze_support()
     main()
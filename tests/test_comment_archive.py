@@ -0,0 +1,102 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from Backend.CommentArchive import (
+    find_comment_file, iter_comment_records, iter_comment_threads, migrate_comment_file, write_comments
+)
+
+
+def comment(comment_id, parent="root", text=""):
+    return {"id": comment_id, "parent": parent, "text": text or comment_id, "like_count": 1}
+
+
+class CommentArchiveTest(unittest.TestCase):
+    """
+    NDJSON comment archives, plain and gzipped, and the migration from nested JSON.
+    """
+
+    def setUp(self):
+        self.comment_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.comment_dir, ignore_errors=True)
+
+    def path(self, name):
+        return os.path.join(self.comment_dir, "c1", name)
+
+    def test_threads_round_trip(self):
+        for name in ("v1.ndjson", "v1.ndjson.gz"):
+            path = self.path(name)
+            written, threads = write_comments(path, [
+                comment("a"), comment("a1", "a"), comment("a2", "a"), comment("b"), {"text": "no id"}
+            ])
+            self.assertEqual((written, threads), (4, 2))
+
+            result = list(iter_comment_threads(path))
+            self.assertEqual([t["comment_id"] for t in result], ["a", "b"])
+            self.assertEqual([r["comment_id"] for r in result[0]["replies"]], ["a1", "a2"])
+            self.assertIsNone(result[0]["parent_id"])
+            self.assertFalse(os.path.exists(path + ".part"))
+
+    def test_reply_before_parent_and_orphans(self):
+        path = self.path("v1.ndjson")
+        write_comments(path, [comment("a1", "a"), comment("a"), comment("x1", "x")])
+        result = list(iter_comment_threads(path))
+        self.assertEqual([t["comment_id"] for t in result], ["a"])
+        self.assertEqual([r["comment_id"] for r in result[0]["replies"]], ["a1"])
+
+    def test_empty_write_keeps_existing_archive(self):
+        path = self.path("v1.ndjson.gz")
+        write_comments(path, [comment("a")])
+        self.assertEqual(write_comments(path, [], allow_empty=False), (0, 0))
+        self.assertEqual([r["comment_id"] for r in iter_comment_records(path)], ["a"])
+
+        write_comments(path, [])
+        self.assertEqual(list(iter_comment_records(path)), [])
+
+    def test_failed_write_leaves_no_partial_file(self):
+        path = self.path("v1.ndjson")
+
+        def comments():
+            yield comment("a")
+            raise RuntimeError("download interrupted")
+
+        with self.assertRaises(RuntimeError):
+            write_comments(path, comments())
+        self.assertEqual(os.listdir(os.path.dirname(path)), [])
+
+    def test_malformed_lines_are_skipped(self):
+        path = self.path("v1.ndjson")
+        write_comments(path, [comment("a")])
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("{not json\n\n")
+        self.assertEqual([r["comment_id"] for r in iter_comment_records(path)], ["a"])
+
+    def test_migrate_legacy_file(self):
+        legacy = self.path("v1.json")
+        os.makedirs(os.path.dirname(legacy))
+        with open(legacy, "w", encoding="utf-8") as f:
+            json.dump([
+                {"comment_id": "a", "text": "A", "parent": "root",
+                 "replies": [{"comment_id": "a1", "text": "A1", "parent": "a", "replies": []}]},
+                {"comment_id": "b", "text": "B", "parent": "root", "replies": []},
+            ], f)
+
+        # Legacy files can be read as they are
+        self.assertEqual([t["comment_id"] for t in iter_comment_threads(legacy)], ["a", "b"])
+
+        target = migrate_comment_file(legacy)
+        self.assertEqual(target, self.path("v1.ndjson.gz"))
+        self.assertFalse(os.path.exists(legacy))
+        self.assertEqual(find_comment_file(self.comment_dir, "c1", "v1"), target)
+        threads = list(iter_comment_threads(target))
+        self.assertEqual([t["comment_id"] for t in threads], ["a", "b"])
+        self.assertEqual([(r["comment_id"], r["parent_id"]) for r in threads[0]["replies"]], [("a1", "a")])
+        self.assertEqual(migrate_comment_file(target), target)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from yt_dlp.extractor.youtube import YoutubeIE
+
+from Backend.ScrapeComments import CommentFetcher
+from Data.DatabaseManager import DatabaseManager
+from utils.AppState import app_state
+
+
+# Newest first, as with the "new" sort; the pinned comment is old but comes first
+COMMENTS = [
+    {"id": "pinned", "parent": "root", "text": "pinned", "is_pinned": True},
+    {"id": "new2", "parent": "root", "text": "new2"},
+    {"id": "new1", "parent": "root", "text": "new1"},
+    {"id": "new1.r", "parent": "new1", "text": "reply"},
+    {"id": "old2", "parent": "root", "text": "old2"},
+    {"id": "old1", "parent": "root", "text": "old1"},
+]
+
+
+class IncrementalCommentsTest(unittest.TestCase):
+    """
+    An incremental refresh pages newest first once and stops at the first stored comment.
+    """
+
+    def setUp(self):
+        self.base_dir = tempfile.mkdtemp()
+        self.previous_db = app_state._db
+        app_state.db = DatabaseManager(base_dir=self.base_dir)
+        self.fetcher = CommentFetcher()
+        self.yielded = []
+        self.extractions = 0
+
+        def fake_get_comments(ie, *args, **kwargs):
+            for comment in COMMENTS:
+                self.yielded.append(comment["id"])
+                yield dict(comment)
+
+        def fake_real_extract(ie, url):
+            self.extractions += 1
+            video_id = ie._match_id(url)
+            return {"id": video_id, "title": video_id, "formats": [{"url": "https://example.com/v.mp4"}],
+                    "__post_extractor": ie.extract_comments(None, video_id, None, None)}
+
+        patches = [
+            mock.patch.object(YoutubeIE, "_get_comments", fake_get_comments),
+            mock.patch.object(YoutubeIE, "_real_extract", fake_real_extract),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        app_state.db.shutdown()
+        app_state._db = self.previous_db
+        shutil.rmtree(self.base_dir, ignore_errors=True)
+
+    def test_stops_at_first_stored_comment(self):
+        comments = self.fetcher._extract_new_comments("dQw4w9WgXcQ", {"pinned", "old2", "old1"})
+        self.assertEqual([c["id"] for c in comments], ["pinned", "new2", "new1", "new1.r", "old2"])
+        self.assertEqual(self.yielded, ["pinned", "new2", "new1", "new1.r", "old2"])
+        self.assertEqual(self.extractions, 1)
+
+    def test_full_fetch_reads_everything(self):
+        comments = self.fetcher._extract_comments("dQw4w9WgXcQ")
+        self.assertEqual(len(comments), len(COMMENTS))
+
+
+if __name__ == "__main__":
+    unittest.main()
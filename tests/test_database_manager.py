@@ -0,0 +1,232 @@
+import shutil
+import sqlite3
+import tempfile
+import threading
+import sys
+import time
+import unittest
+from pathlib import Path
+
+from Data.DatabaseManager import DatabaseManager, SCHEMA_MIGRATIONS
+
+
+class DatabaseTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.base_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(base_dir=self.base_dir)
+
+    def tearDown(self):
+        self.db.shutdown()
+        shutil.rmtree(self.base_dir, ignore_errors=True)
+
+    def add_video(self, video_id, channel_id="c1", title="", desc=""):
+        self.db.upsert_many("CHANNEL", [{"channel_id": channel_id, "name": channel_id}], "channel_id")
+        self.db.upsert_many(
+            "VIDEO", [{"video_id": video_id, "channel_id": channel_id, "title": title, "desc": desc}], "video_id"
+        )
+
+
+class DatabaseWriteTest(DatabaseTestCase):
+    """
+    Batched writes: upserts refresh rows in place, replaces swap a whole set.
+    """
+
+    def test_upsert_many_updates_existing_rows(self):
+        self.db.upsert_many("CHANNEL", [{"channel_id": "c1", "name": "Old"}, {"channel_id": "c2", "name": "Two"}],
+                            "channel_id")
+        written = self.db.upsert_many("CHANNEL", [{"channel_id": "c1", "name": "New"}], "channel_id")
+
+        self.assertEqual(written, 1)
+        rows = self.db.fetch("CHANNEL", order_by="channel_id", columns=["channel_id", "name"])
+        self.assertEqual(rows, [{"channel_id": "c1", "name": "New"}, {"channel_id": "c2", "name": "Two"}])
+
+    def test_upsert_many_with_only_key_columns_keeps_rows(self):
+        self.db.upsert_many("SENTIMENT_CACHE", [{"sentence_hash": "h", "compound": 0.5}], "sentence_hash")
+        self.db.upsert_many("SCRAPE_STATE", [{"channel_id": "c1", "content_type": "videos"}],
+                            ("channel_id", "content_type"))
+        self.db.upsert_many("SCRAPE_STATE", [{"channel_id": "c1", "content_type": "videos"}],
+                            ("channel_id", "content_type"))
+        self.assertEqual(len(self.db.fetch("SCRAPE_STATE")), 1)
+
+    def test_replace_many_swaps_matching_rows_only(self):
+        self.add_video("v1")
+        self.add_video("v2")
+        rows = [
+            {"comment_id": f"{video_id}-{i}", "video_id": video_id, "channel_id": "c1", "text": "old"}
+            for video_id in ("v1", "v2") for i in range(3)
+        ]
+        self.db.replace_many("COMMENT_ROW", rows, "video_id IN ('v1', 'v2')")
+
+        inserted = self.db.replace_many(
+            "COMMENT_ROW", [{"comment_id": "v1-new", "video_id": "v1", "channel_id": "c1", "text": "new"}],
+            "video_id=?", ("v1",)
+        )
+
+        self.assertEqual(inserted, 1)
+        v1 = self.db.fetch("COMMENT_ROW", where="video_id=?", params=("v1",), columns=["comment_id"])
+        self.assertEqual(v1, [{"comment_id": "v1-new"}])
+        self.assertEqual(len(self.db.fetch("COMMENT_ROW", where="video_id=?", params=("v2",))), 3)
+
+    def test_replace_many_without_rows_deletes(self):
+        self.add_video("v1")
+        self.db.replace_many("COMMENT_ROW", [{"comment_id": "a", "video_id": "v1", "text": "x"}], "video_id=?", ("v1",))
+        self.assertEqual(self.db.replace_many("COMMENT_ROW", [], "video_id=?", ("v1",)), 0)
+        self.assertEqual(self.db.fetch("COMMENT_ROW"), [])
+
+
+class MigrationTest(unittest.TestCase):
+    """
+    Every migration applies, to a fresh database and to one created by schema.sql alone.
+    """
+
+    def setUp(self):
+        self.base_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.base_dir, ignore_errors=True)
+
+    def schema_version(self, db):
+        return db.fetch("SCHEMA_VERSION", order_by="version", columns=["version"])
+
+    def test_fresh_database_reaches_latest_version(self):
+        db = DatabaseManager(base_dir=self.base_dir)
+        try:
+            versions = [row["version"] for row in self.schema_version(db)]
+            self.assertEqual(versions, [version for version, _ in SCHEMA_MIGRATIONS])
+        finally:
+            db.shutdown()
+
+        # Opening it again applies nothing twice
+        db = DatabaseManager(base_dir=self.base_dir)
+        try:
+            self.assertEqual(len(self.schema_version(db)), len(SCHEMA_MIGRATIONS))
+        finally:
+            db.shutdown()
+
+    def test_existing_rows_are_migrated_and_indexed(self):
+        db_dir = Path(self.base_dir) / "DB"
+        db_dir.mkdir()
+        schema = Path(sys.modules[DatabaseManager.__module__].__file__).with_name("schema.sql")
+        conn = sqlite3.connect(db_dir / "data.db")
+        conn.executescript(schema.read_text(encoding="utf-8"))
+        conn.execute("INSERT INTO CHANNEL (channel_id, name) VALUES ('c1', 'One')")
+        conn.execute("INSERT INTO VIDEO (video_id, channel_id, title) VALUES ('v1', 'c1', 'Migrated title')")
+        conn.commit()
+        conn.close()
+
+        db = DatabaseManager(base_dir=self.base_dir)
+        try:
+            self.assertEqual(self.schema_version(db)[-1]["version"], SCHEMA_MIGRATIONS[-1][0])
+            self.assertEqual([r["video_id"] for r in db.search_text("migrated", channel_id="c1")], ["v1"])
+            columns = {row[1] for row in db._get_connection().execute("PRAGMA table_info(SCRAPE_STATE)")}
+            self.assertIn("pending_video_ids", columns)
+        finally:
+            db.shutdown()
+
+
+class SearchTextTest(DatabaseTestCase):
+    """
+    Full-text search over videos, comments and transcripts, kept in sync by triggers.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.add_video("v1", "c1", title="Sourdough bread at home")
+        self.add_video("v2", "c2", title="Bread machine review")
+        self.add_video("v3", "c1", title="Unrelated")
+        self.db.replace_many("COMMENT_ROW", [
+            {"comment_id": "k1", "video_id": "v3", "channel_id": "c1", "text": "more bread videos please"}
+        ], "video_id=?", ("v3",))
+
+    def test_all_sources_match(self):
+        results = self.db.search_text("bread")
+        self.assertEqual({r["video_id"] for r in results}, {"v1", "v2", "v3"})
+        by_video = {r["video_id"]: r for r in results}
+        self.assertEqual(by_video["v3"]["source"], "comment")
+        self.assertIn("[bread]", by_video["v3"]["snippet"])
+
+    def test_channel_filter(self):
+        results = self.db.search_text("bread", channel_id="c1")
+        self.assertEqual({r["video_id"] for r in results}, {"v1", "v3"})
+
+    def test_terms_do_not_match_channel_id(self):
+        self.assertEqual(self.db.search_text("c1"), [])
+
+    def test_last_term_is_a_prefix(self):
+        self.assertEqual([r["video_id"] for r in self.db.search_text("sourd")], ["v1"])
+        self.assertEqual(self.db.search_text('"'), [])
+
+    def test_updates_and_deletes_reach_the_index(self):
+        self.db.upsert_many("VIDEO", [{"video_id": "v1", "title": "Pasta"}], "video_id")
+        self.db.replace_many("COMMENT_ROW", [], "video_id=?", ("v3",))
+        self.assertEqual({r["video_id"] for r in self.db.search_text("bread")}, {"v2"})
+        self.assertEqual([r["video_id"] for r in self.db.search_text("pasta")], ["v1"])
+
+
+class DatabaseShutdownTest(unittest.TestCase):
+    """
+    Writes racing with shutdown() must fail instead of blocking their caller.
+    """
+
+    TIMEOUT = 10
+
+    def setUp(self):
+        self.base_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(base_dir=self.base_dir)
+
+    def tearDown(self):
+        self.db.shutdown()
+        shutil.rmtree(self.base_dir, ignore_errors=True)
+
+    def test_write_after_shutdown_raises(self):
+        self.db.shutdown()
+        with self.assertRaises(sqlite3.ProgrammingError):
+            self.db.upsert_many("CHANNEL", [{"channel_id": "c", "name": "C"}], "channel_id")
+
+    def test_shutdown_flushes_queued_writes(self):
+        started = threading.Event()
+        release = threading.Event()
+        errors = []
+
+        def blocked_write(conn):
+            started.set()
+            release.wait(self.TIMEOUT)
+
+        def submit(func):
+            try:
+                self.db._execute_write(func)
+            except sqlite3.ProgrammingError as e:
+                errors.append(e)
+
+        # Keep the writer busy so the next writes queue up behind it
+        first = threading.Thread(target=submit, args=(blocked_write,))
+        first.start()
+        self.assertTrue(started.wait(self.TIMEOUT))
+        queued = threading.Thread(
+            target=submit,
+            args=(lambda conn: conn.execute("INSERT INTO CHANNEL (channel_id, name) VALUES ('c', 'C')"),)
+        )
+        queued.start()
+        while self.db._write_queue.qsize() < 1:
+            time.sleep(0.01)
+        stopper = threading.Thread(target=self.db.shutdown)
+        stopper.start()
+        while not self.db._closing:
+            time.sleep(0.01)
+        late = threading.Thread(target=submit, args=(blocked_write,))
+        late.start()
+
+        release.set()
+        for thread in (first, queued, stopper, late):
+            thread.join(self.TIMEOUT)
+            self.assertFalse(thread.is_alive())
+
+        self.assertEqual(len(errors), 1)
+        conn = sqlite3.connect(self.db.db_path)
+        self.assertEqual(conn.execute("SELECT name FROM CHANNEL WHERE channel_id = 'c'").fetchone(), ("C",))
+        conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from Backend.SentimentEngine import SentimentEngine, sentence_hash
+from Data.DatabaseManager import DatabaseManager
+
+
+def fake_scores(sentences):
+    return [len(s) / 100 for s in sentences]
+
+
+class SentimentCacheTest(unittest.TestCase):
+    """
+    Compound scores are memoized in SENTIMENT_CACHE, so known sentences are never rescored.
+    """
+
+    def setUp(self):
+        self.base_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(base_dir=self.base_dir)
+
+    def tearDown(self):
+        self.db.shutdown()
+        shutil.rmtree(self.base_dir, ignore_errors=True)
+
+    def test_known_sentences_are_not_rescored(self):
+        engine = SentimentEngine(self.db, workers=1)
+        with mock.patch.object(engine, "_score_uncached", side_effect=fake_scores) as score:
+            self.assertEqual(engine.scores(["good", "bad", "good"]), [0.04, 0.03, 0.04])
+            score.assert_called_once_with(["good", "bad"])
+
+            self.assertEqual(engine.scores(["bad", "meh"]), [0.03, 0.03])
+            score.assert_called_with(["meh"])
+        self.assertEqual(engine.stats, {"cached": 2, "scored": 3})
+
+        # A new engine reads the scores back from the database
+        other = SentimentEngine(self.db, workers=1)
+        with mock.patch.object(other, "_score_uncached", side_effect=AssertionError("rescored")):
+            self.assertEqual(other.scores(["good"]), [0.04])
+        row = self.db.fetch("SENTIMENT_CACHE", where="sentence_hash=?", params=(sentence_hash("good"),))
+        self.assertEqual(row[0]["compound"], 0.04)
+
+    def test_cache_errors_fall_back_to_scoring(self):
+        engine = SentimentEngine(self.db, workers=1)
+        with mock.patch.object(self.db, "fetch_many_by_keys", side_effect=RuntimeError("locked")), \
+                mock.patch.object(engine, "_score_uncached", side_effect=fake_scores):
+            self.assertEqual(engine.scores(["good"]), [0.04])
+
+    def test_without_database(self):
+        engine = SentimentEngine(None, workers=1)
+        with mock.patch.object(engine, "_score_uncached", side_effect=fake_scores) as score:
+            engine.scores(["good"])
+            engine.scores(["good"])
+        self.assertEqual(score.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import asyncio
+import concurrent.futures
+import queue
+import threading
+import unittest
+from unittest import mock
+
+from Backend import ShortsMetadata
+from Backend.ShortsMetadata import ShortsMetadataEngine
+
+
+class ShortsEngineShutdownTest(unittest.TestCase):
+    """
+    The progress pump stops with the engine and survives a closed event loop.
+    """
+
+    def setUp(self):
+        self.engine = ShortsMetadataEngine(workers=1)
+        # Stand-ins for the process pool and its progress queue; nothing is extracted here
+        self.engine._pool = mock.Mock(submit=lambda *args: concurrent.futures.Future())
+        self.engine._progress = queue.Queue()
+        self.engine._pump = threading.Thread(target=self.engine._pump_progress, args=(self.engine._progress,),
+                                             daemon=True)
+        self.errors = []
+        previous_hook = threading.excepthook
+        threading.excepthook = lambda args: self.errors.append(args.exc_value)
+        self.addCleanup(setattr, threading, "excepthook", previous_hook)
+        self.engine._pump.start()
+
+    def test_completion_after_loop_closed(self):
+        pump = self.engine._pump
+        captured = {}
+        reported = []
+
+        def interrupted_gather(*futures, **kwargs):
+            captured.update(self.engine._listeners)
+            for future in futures:
+                future.cancel()
+            raise RuntimeError("scrape cancelled")
+
+        async def fetch():
+            with mock.patch("Backend.ShortsMetadata.asyncio.gather", interrupted_gather):
+                with self.assertRaises(RuntimeError):
+                    await self.engine.fetch(["a"], lambda done, total: reported.append(done))
+
+        asyncio.run(fetch())
+        # The pump looked the listener up just before fetch() removed it, and calls it now
+        (token, listener), = captured.items()
+        self.engine._listeners[token] = listener
+        self.engine._progress.put((token, "a"))
+        self.engine.shutdown()
+
+        self.assertFalse(pump.is_alive())
+        self.assertEqual(self.errors, [])
+        self.assertEqual(reported, [])
+
+    def test_shutdown_joins_pump(self):
+        pump = self.engine._pump
+        self.engine.shutdown()
+        self.assertFalse(pump.is_alive())
+        self.assertIsNone(self.engine._pool)
+
+
+class InnertubeClientTest(unittest.TestCase):
+    """
+    The lean shorts request uses the WEB client version shipped with yt-dlp.
+    """
+
+    def test_client_version_follows_yt_dlp(self):
+        try:
+            from yt_dlp.extractor.youtube import INNERTUBE_CLIENTS
+        except ImportError:
+            from yt_dlp.extractor.youtube._base import INNERTUBE_CLIENTS
+        version = INNERTUBE_CLIENTS["web"]["INNERTUBE_CONTEXT"]["client"]["clientVersion"]
+
+        client = ShortsMetadata.INNERTUBE_CONTEXT["client"]
+        self.assertEqual((client["clientName"], client["clientVersion"]), ("WEB", version))
+        self.assertEqual(ShortsMetadata.INNERTUBE_HEADERS["X-YouTube-Client-Version"], version)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import shutil
+import sqlite3
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from Backend.ScrapeTranscription import TranscriptFetcher
+from Data.DatabaseManager import DatabaseManager
+from utils.AppState import app_state
+
+
+def segments(*texts):
+    return [{"text": text, "start": float(i), "duration": 1.0} for i, text in enumerate(texts)]
+
+
+class TranscriptTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.base_dir = tempfile.mkdtemp()
+        self.previous_db = app_state._db
+        app_state.db = DatabaseManager(base_dir=self.base_dir)
+        self.db = app_state.db
+        self.fetcher = TranscriptFetcher()
+
+    def tearDown(self):
+        self.db.shutdown()
+        app_state._db = self.previous_db
+        shutil.rmtree(self.base_dir, ignore_errors=True)
+
+    def segment_texts(self, video_id):
+        rows = self.db.fetch("TRANSCRIPT_SEGMENT", where="video_id=?", params=(video_id,), order_by="seq")
+        return [row["text"] for row in rows]
+
+
+class TranscriptStoreTest(TranscriptTestCase):
+    """
+    Transcripts and their segments are stored and replaced together.
+    """
+
+    def test_saving_twice_replaces_segments(self):
+        self.fetcher.save_transcript_rows("v1", "en", False, segments("a", "b", "c"), channel_id="c1")
+        self.fetcher.save_transcript_rows("v1", "en", False, segments("d", "e"), channel_id="c1")
+
+        transcripts = self.db.fetch("TRANSCRIPT", where="video_id=?", params=("v1",))
+        self.assertEqual(len(transcripts), 1)
+        self.assertEqual(self.segment_texts("v1"), ["d", "e"])
+        orphans = self.db.fetch(
+            "TRANSCRIPT_SEGMENT",
+            where="transcript_id NOT IN (SELECT transcript_id FROM TRANSCRIPT)"
+        )
+        self.assertEqual(orphans, [])
+
+    def test_failed_segment_write_keeps_nothing(self):
+        with mock.patch.object(self.db, "replace_many", side_effect=sqlite3.OperationalError("disk I/O error")):
+            with self.assertRaises(sqlite3.OperationalError):
+                self.fetcher.save_transcript_rows("v1", "en", False, segments("a"), channel_id="c1")
+
+        self.assertEqual(self.db.fetch("TRANSCRIPT", where="video_id=?", params=("v1",)), [])
+        self.assertEqual(self.segment_texts("v1"), [])
+
+
+class TranscriptCacheTest(TranscriptTestCase):
+    """
+    One transcript per (video_id, language); auto-generated ones expire after the TTL.
+    """
+
+    def test_manual_replaces_generated(self):
+        self.fetcher.save_transcript_rows("v1", "en", True, segments("auto"), channel_id="c1")
+        self.fetcher.save_transcript_rows("v1", "en", False, segments("manual"), channel_id="c1")
+
+        cached = self.fetcher.cached_transcript("v1", "c1", ("en",))
+        self.assertEqual((cached["language"], cached["is_generated"]), ("en", False))
+        self.assertEqual(self.segment_texts("v1"), ["manual"])
+
+    def test_generated_expires_after_ttl(self):
+        old = time.time() - self.fetcher.generated_ttl - 60
+        self.fetcher.save_transcript_rows("v1", "en", True, segments("auto"), fetched_at=old, channel_id="c1")
+        self.fetcher.save_transcript_rows("v2", "en", False, segments("manual"), fetched_at=old, channel_id="c1")
+
+        self.assertIsNone(self.fetcher.cached_transcript("v1", "c1", ("en",)))
+        self.assertTrue(self.fetcher.cached_transcript("v2", "c1", ("en",))["cached"])
+
+    def test_missing_transcript_is_cached_until_ttl(self):
+        self.fetcher.save_missing_transcript("v1", "en", "No transcript found")
+        self.assertEqual(self.fetcher.cached_transcript("v1", "c1", ("en",))["remarks"], "No transcript found")
+
+        self.fetcher.generated_ttl = -1
+        self.assertIsNone(self.fetcher.cached_transcript("v1", "c1", ("en",)))
+
+    def test_cached_transcript_makes_no_request(self):
+        self.fetcher.save_transcript_rows("v1", "en", False, segments("manual"), channel_id="c1")
+        with mock.patch.object(self.fetcher, "_api", side_effect=AssertionError("network call")):
+            result = self.fetcher._fetch("v1", "c1", ("en",))
+        self.assertTrue(result["cached"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from PySide6.QtCore import Qt
+
+import Backend.ScrapeVideo as ScrapeVideo
+from Data.DatabaseManager import DatabaseManager
+from utils.AppState import app_state
+
+
+def fake_get_channel(channel_url=None, content_type=None, **kwargs):
+    # More videos than the pipeline queues hold, so a stalled stage fills them up
+    count = ScrapeVideo.VideoWorker.QUEUE_SIZE * 3
+    for i in range(count):
+        yield {
+            "videoId": f"{content_type}-{i}",
+            "title": {"runs": [{"text": f"Video {i}"}]},
+            "viewCountText": {"simpleText": "1.2K views"},
+            "lengthText": {"simpleText": "1:02"},
+            "publishedTimeText": {"simpleText": "2 days ago"},
+            "thumbnail": {"thumbnails": [{"url": f"https://i.ytimg.com/vi/{i}/hq.jpg"}]},
+        }
+
+
+async def fake_thumbnail_fetch(self, url, save_path):
+    with open(save_path, "wb") as f:
+        f.write(b"jpg")
+    return True
+
+
+async def failing_thumbnail_fetch(self, url, save_path):
+    raise RuntimeError("thumbnail download failed")
+
+
+async def failing_lean_metadata(video_ids, session, semaphore, progress_callback=None):
+    raise RuntimeError("shorts metadata failed")
+
+
+class VideoWorkerFailureTest(unittest.TestCase):
+    """
+    A failing pipeline stage must not hang the scrape: the worker still emits finished.
+    """
+
+    TIMEOUT = 60
+
+    def setUp(self):
+        self.base_dir = tempfile.mkdtemp()
+        self.previous_db = app_state._db
+        app_state.db = DatabaseManager(base_dir=self.base_dir)
+        patches = [
+            mock.patch.object(ScrapeVideo.scrapetube, "get_channel", fake_get_channel),
+            mock.patch.object(ScrapeVideo, "make_thumbnail_variants", lambda path: True),
+            mock.patch.object(ScrapeVideo.ThumbnailCache, "fetch", fake_thumbnail_fetch),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        app_state.db.shutdown()
+        app_state._db = self.previous_db
+        shutil.rmtree(self.base_dir, ignore_errors=True)
+
+    def run_worker(self, scrape_shorts: bool, incremental: bool = False) -> ScrapeVideo.VideoWorker:
+        worker = ScrapeVideo.VideoWorker("channel", "https://www.youtube.com/@channel", scrape_shorts,
+                                         incremental=incremental, shorts_workers=0)
+        finished = threading.Event()
+        # The worker runs on a plain thread without a Qt event loop
+        worker.finished.connect(finished.set, Qt.DirectConnection)
+        thread = threading.Thread(target=worker.run, daemon=True)
+        thread.start()
+        self.assertTrue(finished.wait(self.TIMEOUT), "VideoWorker did not finish")
+        thread.join(self.TIMEOUT)
+        return worker
+
+    def saved_ids(self, video_type: str) -> list:
+        return app_state.db.fetch("VIDEO", where="video_type=?", params=(video_type,), columns=["video_id"])
+
+    def test_shorts_metadata_failure_finishes(self):
+        with mock.patch.object(ScrapeVideo, "fetch_shorts_metadata_lean", failing_lean_metadata):
+            self.run_worker(scrape_shorts=True)
+        # The other content types are still scraped
+        self.assertEqual(len(self.saved_ids("videos")), ScrapeVideo.VideoWorker.QUEUE_SIZE * 3)
+
+    def test_thumbnail_failure_finishes(self):
+        with mock.patch.object(ScrapeVideo.ThumbnailCache, "fetch", failing_thumbnail_fetch):
+            self.run_worker(scrape_shorts=False)
+        self.assertEqual(self.saved_ids("videos"), [])
+
+
+    def scrape_state(self, video_type: str) -> dict:
+        rows = app_state.db.fetch("SCRAPE_STATE", where="content_type=?", params=(video_type,))
+        return rows[0]
+
+    def test_failed_video_is_retried_by_next_incremental_scrape(self):
+        build_video_record = ScrapeVideo.build_video_record
+
+        def failing_build(video, *args, **kwargs):
+            if video.get("videoId") == "videos-5":
+                raise ValueError("unparseable payload")
+            return build_video_record(video, *args, **kwargs)
+
+        with mock.patch.object(ScrapeVideo, "build_video_record", failing_build):
+            self.run_worker(scrape_shorts=False, incremental=True)
+        # The mark stays behind the failed video, which is recorded for the retry
+        state = self.scrape_state("videos")
+        self.assertEqual(state["last_video_id"], "videos-6")
+        self.assertEqual(state["pending_video_ids"], '["videos-5"]')
+
+        self.run_worker(scrape_shorts=False, incremental=True)
+        self.assertIn({"video_id": "videos-5"}, self.saved_ids("videos"))
+        state = self.scrape_state("videos")
+        self.assertEqual(state["last_video_id"], "videos-0")
+        self.assertIsNone(state["pending_video_ids"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 # logger_config.py
 import logging
+import multiprocessing
 import os
 from datetime import datetime
 import platform
@@ -45,11 +46,15 @@ def setup_logger():
     )
     formatter = EscapingFormatter(fmt)
 
-    # File handler
-    fh = logging.FileHandler(log_file_path, encoding="utf-8")
-    fh.setLevel(logging.DEBUG)
-    fh.setFormatter(formatter)
-    logger.addHandler(fh)
+    # File handler. Pool worker processes re-import this module, so only
+    # the main process writes a log file and each run produces one.
+    if multiprocessing.parent_process() is None:
+        fh = logging.FileHandler(log_file_path, encoding="utf-8")
+        fh.setLevel(logging.DEBUG)
+        fh.setFormatter(formatter)
+        logger.addHandler(fh)
+    else:
+        log_file_path = None
 
     # Optional: console output
     ch = logging.StreamHandler()